@@ -1,19 +1,24 @@
 import argparse
 import gc
+import multiprocessing
 import os
+import random
 import sys
 import traceback
-from typing import Tuple, Optional, Any
+from typing import Tuple, Optional, Any, List, Iterator
 
+import numpy as np
 
 from swarm_rescue.simulation.elements.sensor_disablers import ZoneType
 from swarm_rescue.simulation.gui_map.gui_sr import GuiSR
+from swarm_rescue.simulation.gui_map.headless_runner import HeadlessRunner
 from swarm_rescue.simulation.reporting.data_saver import DataSaver
 from swarm_rescue.simulation.reporting.evaluation import EvalConfig, EvalPlan, ZonesConfig
 from swarm_rescue.simulation.reporting.result_path_creator import ResultPathCreator
 from swarm_rescue.simulation.reporting.score_manager import ScoreManager
 from swarm_rescue.simulation.reporting.team_info import TeamInfo
 from swarm_rescue.simulation.utils.constants import DRONE_INITIAL_HEALTH
+from swarm_rescue.simulation.utils.step_profiler import StepProfiler
 
 from swarm_rescue.maps.map_intermediate_01 import MapIntermediate01
 from swarm_rescue.maps.map_intermediate_02 import MapIntermediate02
@@ -31,6 +36,15 @@ from swarm_rescue.maps.map_test_special_zones import MapTestSpecialZones
 from swarm_rescue.solutions.my_drone_eval import MyDroneEval
 
 
+RoundResult = Tuple[float, float, int, int, float, int, float, float, bool, bool]
+# number_drones, max_timestep_limit, max_walltime_limit, number_wounded_persons,
+# size_area, score_manager and step_profiler of the map of a round
+RoundInfo = Tuple[int, int, int, int, Any, ScoreManager, Optional[StepProfiler]]
+# Last image of the round, image of the explored lines and of the explored zones
+RoundImages = Tuple[Any, Any, Any]
+RoundOutput = Tuple[Optional[RoundResult], Optional[RoundInfo], Optional[RoundImages]]
+
+
 class MyDrone(MyDroneEval):
     """Custom drone class for evaluation."""
     pass
@@ -55,6 +69,7 @@ class Launcher:
         number_wounded_persons (Optional[int]): Number of wounded persons.
         size_area (Optional[Any]): Size of the simulation area.
         score_manager (Optional[ScoreManager]): Score manager instance.
+        step_profiler (Optional[StepProfiler]): Timings of the last round, if profiling is enabled.
         video_capture_enabled (bool): Whether video capture is enabled.
         result_path (Optional[str]): Path for results.
         data_saver (DataSaver): Data saver instance.
@@ -69,6 +84,7 @@ class Launcher:
     number_wounded_persons: Optional[int]
     size_area: Optional[Any]
     score_manager: Optional[ScoreManager]
+    step_profiler: Optional[StepProfiler]
     video_capture_enabled: bool
     result_path: Optional[str]
     data_saver: DataSaver
@@ -126,6 +142,7 @@ class Launcher:
         self.size_area = None
 
         self.score_manager = None
+        self.step_profiler = None
 
         # Set this value to True to generate stat data and pdf report
         stat_saving_enabled = self.eval_plan.stat_saving_enabled
@@ -146,26 +163,373 @@ class Launcher:
         num_round: int,
         hide_solution_output: bool = False,
         headless: bool = False,
-    ) -> Optional[Tuple[float, float, int, int, float, int, float, float, bool, bool]]:
+        fast: bool = False,
+        profile: bool = False,
+    ) -> Optional[RoundResult]:
         """
-        Runs a single round of the session.
-
-        It creates an instance of the map class with the specified
-        eval_config, which automatically constructs its playground during
-        initialization, and initializes a GUI with the map. It then runs the
-        GUI, which allows the user to interact with it. After the GUI finishes,
-        it calculates the score for the exploration of the map and saves the
-        images and data related to the round.
+        Runs a single round of the session with a RoundRunner, then keeps the
+        information about its map, needed to compute the score, and saves its
+        images.
 
         Args:
             eval_config (EvalConfig): The evaluation configuration.
             num_round (int): The round number.
             hide_solution_output (bool): Whether to hide solution output.
             headless (bool): Whether to run in headless mode.
+            fast (bool): Whether to step the round as fast as possible with a
+                HeadlessRunner instead of the frame rate limited GuiSR.
+            profile (bool): Whether to measure the time spent in each phase
+                of the steps, kept in 'step_profiler'.
 
         Returns:
             Optional[Tuple]: Various statistics and results from the round, or None if map class not found.
         """
+        round_runner = self._get_round_runner(hide_solution_output, headless, fast, profile)
+        output = round_runner.run(eval_config, num_round)
+        return self._finish_round(eval_config, num_round, output)
+
+    def go(
+        self,
+        stop_at_first_crash: bool = False,
+        hide_solution_output: bool = False,
+        headless: bool = False,
+        fast: bool = False,
+        jobs: int = 1,
+        profile: bool = False,
+        seed: Optional[int] = None
+    ) -> bool:
+        """
+        Runs the simulation for all evaluation configurations and calculates scores.
+
+        With jobs > 1, the rounds are run in a pool of worker processes, each
+        one with its own playground and OpenGL context. The results are still
+        processed and saved in the order of the evaluation plan, so the stats
+        file and the pdf report are the same as with a sequential run. The
+        workers only get the RoundRunner of the rounds, not the Launcher.
+
+        With a seed, the random generators are seeded at the beginning of
+        each round, from the seed and the index of the round in the
+        evaluation plan: the results of the rounds do not depend on the
+        number of jobs.
+
+        Args:
+            stop_at_first_crash (bool): Stop at the first crash if True.
+            hide_solution_output (bool): Hide solution output if True.
+            headless (bool): Run in headless mode if True.
+            fast (bool): Step the rounds as fast as possible if True.
+            jobs (int): Number of rounds run in parallel.
+            profile (bool): Measure and save the time spent in each phase of the steps if True.
+            seed (Optional[int]): Seed of the random generators of the rounds, not seeded if None.
+
+        Returns:
+            bool: True if all rounds completed successfully, False if any crashed.
+        """
+        if jobs < 1:
+            raise ValueError(f"Invalid number of jobs: {jobs}. It should be at least 1.")
+
+        ok = True
+
+        print(f"--------------------------------------------------------------------------------------------")
+
+        for eval_config in self.eval_plan.list_eval_config:
+            if not isinstance(eval_config.zones_config, Tuple) and not isinstance(eval_config.zones_config[0], Tuple):
+                raise ValueError("Invalid eval_config.zones_config. It should be a tuple of tuples of ZoneType.")
+
+        rounds = [(eval_config, num_round + 1)
+                  for eval_config in self.eval_plan.list_eval_config
+                  for num_round in range(eval_config.nb_rounds)]
+
+        round_runner = self._get_round_runner(hide_solution_output, headless, fast, profile, seed)
+        if jobs == 1:
+            all_results = self._run_rounds_sequentially(rounds, round_runner)
+        else:
+            all_results = self._run_rounds_in_pool(rounds, round_runner, jobs)
+
+        for eval_config, num_round, result in all_results:
+            if result is None:
+                return False
+
+            has_crashed = self._process_round_result(eval_config, num_round, result)
+            if has_crashed:
+                print(f"\t* WARNING, this program have crashed !")
+                ok = False
+                if stop_at_first_crash:
+                    self.data_saver.generate_pdf_report()
+                    return ok
+
+        print(f"--------------------------------------------------------------------------------------------")
+        self.data_saver.generate_pdf_report()
+
+        return ok
+
+    def _get_round_runner(
+        self,
+        hide_solution_output: bool,
+        headless: bool,
+        fast: bool,
+        profile: bool,
+        seed: Optional[int] = None
+    ) -> "RoundRunner":
+        """
+        Returns the RoundRunner running the rounds with the settings of the
+        launcher and the given options.
+
+        Args:
+            hide_solution_output (bool): Hide solution output if True.
+            headless (bool): Run in headless mode if True.
+            fast (bool): Step the rounds as fast as possible if True.
+            profile (bool): Measure the time spent in each phase of the steps if True.
+            seed (Optional[int]): Seed of the random generators of the rounds.
+
+        Returns:
+            RoundRunner: The round runner.
+        """
+        return RoundRunner(team_info=self.team_info,
+                           result_path=self.result_path,
+                           video_capture_enabled=self.video_capture_enabled,
+                           images_enabled=self.eval_plan.stat_saving_enabled,
+                           hide_solution_output=hide_solution_output,
+                           headless=headless,
+                           fast=fast,
+                           profile=profile,
+                           seed=seed)
+
+    def _run_rounds_sequentially(
+        self,
+        rounds: List[Tuple[EvalConfig, int]],
+        round_runner: "RoundRunner"
+    ) -> Iterator[Tuple[EvalConfig, int, Optional[RoundResult]]]:
+        """
+        Runs the rounds one after the other in the current process.
+
+        Args:
+            rounds (List[Tuple[EvalConfig, int]]): Evaluation config and round number of each round.
+            round_runner (RoundRunner): The runner of the rounds.
+
+        Yields:
+            Tuple: The evaluation config, the round number and the result of each round.
+        """
+        for index, (eval_config, num_round) in enumerate(rounds):
+            self._print_round_header(eval_config, num_round)
+            gc.collect()
+            output = round_runner.run(eval_config, num_round, index)
+            yield eval_config, num_round, self._finish_round(eval_config, num_round, output)
+
+    def _run_rounds_in_pool(
+        self,
+        rounds: List[Tuple[EvalConfig, int]],
+        round_runner: "RoundRunner",
+        jobs: int
+    ) -> Iterator[Tuple[EvalConfig, int, Optional[RoundResult]]]:
+        """
+        Runs the rounds in a pool of worker processes.
+
+        The processes are started with the 'spawn' method, so that each worker
+        creates its own OpenGL context. Each task only holds the round runner,
+        the evaluation config and the round number. The results are yielded in
+        the order of 'rounds' as soon as they are available.
+
+        Args:
+            rounds (List[Tuple[EvalConfig, int]]): Evaluation config and round number of each round.
+            round_runner (RoundRunner): The runner of the rounds.
+            jobs (int): Number of worker processes.
+
+        Yields:
+            Tuple: The evaluation config, the round number and the result of each round.
+        """
+        tasks = [(round_runner, eval_config, num_round, index)
+                 for index, (eval_config, num_round) in enumerate(rounds)]
+
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes=min(jobs, len(tasks))) as pool:
+            for (eval_config, num_round), output in zip(rounds, pool.imap(_one_round_in_worker, tasks)):
+                self._print_round_header(eval_config, num_round)
+                yield eval_config, num_round, self._finish_round(eval_config, num_round, output)
+
+    def _finish_round(self, eval_config: EvalConfig, num_round: int, output: RoundOutput) -> Optional[RoundResult]:
+        """
+        Keeps the information about the map of a round, needed to compute its
+        score, and saves its images.
+
+        Args:
+            eval_config (EvalConfig): The evaluation configuration.
+            num_round (int): The round number.
+            output (RoundOutput): The output of RoundRunner.run().
+
+        Returns:
+            Optional[RoundResult]: The result of the round, or None if map class not found.
+        """
+        result, round_info, images = output
+        if round_info is not None:
+            (self.number_drones,
+             self.max_timestep_limit,
+             self.max_walltime_limit,
+             self.number_wounded_persons,
+             self.size_area,
+             self.score_manager,
+             self.step_profiler) = round_info
+
+        if images is not None:
+            self.data_saver.save_images(*images,
+                                        eval_config.map_name,
+                                        eval_config.zones_name_for_filename,
+                                        num_round)
+        return result
+
+    def _print_round_header(self, eval_config: EvalConfig, num_round: int) -> None:
+        """
+        Prints the header of a round, preceded by a separator for the first round of a configuration.
+
+        Args:
+            eval_config (EvalConfig): The evaluation configuration.
+            num_round (int): The round number.
+        """
+        if num_round == 1:
+            print("")
+            print(f"--------------------------------------------------------------------------------------------")
+        print(f"--------------------------------------------------------------------------------------------")
+        print(f"* Map: {eval_config.map_name}, special zones: {eval_config.zones_name_casual}, "
+              f"round: {num_round}/{eval_config.nb_rounds}")
+
+    def _process_round_result(self, eval_config: EvalConfig, num_round: int, result: RoundResult) -> bool:
+        """
+        Computes the score of a round, prints it and saves it.
+
+        Args:
+            eval_config (EvalConfig): The evaluation configuration.
+            num_round (int): The round number.
+            result (RoundResult): The result returned by one_round().
+
+        Returns:
+            bool: True if the solution has crashed during the round.
+        """
+        (percent_drones_destroyed, mean_drones_health, elapsed_timestep,
+         full_rescue_timestep, score_exploration, rescued_number,
+         score_health_returned, elapsed_walltime,
+         is_max_walltime_limit_reached, has_crashed) = result
+
+        result_score = self.score_manager.compute_score(rescued_number,
+                                                        score_exploration,
+                                                        score_health_returned,
+                                                        full_rescue_timestep)
+        (round_score, percent_rescued, score_timestep) = result_score
+
+        mean_drones_health_percent = mean_drones_health / DRONE_INITIAL_HEALTH * 100.
+
+        print(
+            f"\t* Round n°{num_round}/{eval_config.nb_rounds}: "
+            f"\n\t\trescued nb: {int(rescued_number)}/{self.number_wounded_persons}, "
+            f"explor. score: {score_exploration:.1f}%, "
+            f"health return score: {score_health_returned:.1f}%, "
+            f"walltime elapsed: {elapsed_walltime:.0f}s/{self.max_walltime_limit}s, "
+            f"elapse timestep: {elapsed_timestep}/{self.max_timestep_limit} steps, "
+            f"time to rescue all: {full_rescue_timestep} steps."
+            f"\n\t\tpercentage of drones destroyed: {percent_drones_destroyed:.1f} %, "
+            f"mean percentage of drones health : {mean_drones_health_percent:.1f} %."
+            f"\n\t\tround score: {round_score:.1f}%, "
+            f"frequency: {elapsed_timestep / elapsed_walltime:.2f} steps/s.")
+        if is_max_walltime_limit_reached:
+            print(f"\t\tThe max walltime limit of {self.max_walltime_limit}s is reached first.")
+        if self.step_profiler is not None:
+            print(f"\t\tprofile: {self.step_profiler.summary()}")
+            self.data_saver.save_profile(eval_config, num_round, self.step_profiler)
+
+        self.data_saver.save_one_round(eval_config,
+                                       num_round,
+                                       percent_drones_destroyed,
+                                       mean_drones_health_percent,
+                                       percent_rescued,
+                                       score_exploration,
+                                       score_health_returned,
+                                       elapsed_timestep,
+                                       elapsed_walltime,
+                                       full_rescue_timestep,
+                                       score_timestep,
+                                       has_crashed,
+                                       round_score)
+
+        return has_crashed
+
+
+class RoundRunner:
+    """
+    The RoundRunner class runs one round of the session: it creates an
+    instance of the map with the zones of the evaluation config, which
+    automatically constructs its playground during initialization, and runs
+    it with a GUI, or a HeadlessRunner in fast mode. After the round, it
+    calculates the score of the exploration of the map.
+
+    It only holds the settings of the rounds, and is sent to the worker
+    processes of Launcher.go() instead of the whole Launcher. The images of
+    the rounds are returned to the Launcher, which saves them with the stats.
+
+    Attributes:
+        team_info (TeamInfo): Stores team information.
+        result_path (Optional[str]): Path for results.
+        video_capture_enabled (bool): Whether video capture is enabled.
+        images_enabled (bool): Whether the images of the rounds are returned, to be saved.
+        hide_solution_output (bool): Whether to hide solution output.
+        headless (bool): Whether to run in headless mode.
+        fast (bool): Whether to step the rounds as fast as possible.
+        profile (bool): Whether to measure the time spent in each phase of the steps.
+        seed (Optional[int]): Seed of the random generators of the rounds.
+    """
+
+    def __init__(
+        self,
+        team_info: TeamInfo,
+        result_path: Optional[str] = None,
+        video_capture_enabled: bool = False,
+        images_enabled: bool = False,
+        hide_solution_output: bool = False,
+        headless: bool = False,
+        fast: bool = False,
+        profile: bool = False,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initializes the RoundRunner.
+
+        Args:
+            team_info (TeamInfo): Stores team information.
+            result_path (Optional[str]): Path for results.
+            video_capture_enabled (bool): Whether video capture is enabled.
+            images_enabled (bool): Whether the images of the rounds are returned, to be saved.
+            hide_solution_output (bool): Whether to hide solution output.
+            headless (bool): Whether to run in headless mode.
+            fast (bool): Whether to step the rounds as fast as possible with a
+                HeadlessRunner instead of the frame rate limited GuiSR.
+            profile (bool): Whether to measure the time spent in each phase of the steps.
+            seed (Optional[int]): Seed of the random generators of the rounds, not seeded if None.
+        """
+        self.team_info = team_info
+        self.result_path = result_path
+        self.video_capture_enabled = video_capture_enabled
+        self.images_enabled = images_enabled
+        self.hide_solution_output = hide_solution_output
+        self.headless = headless
+        self.fast = fast
+        self.profile = profile
+        self.seed = seed
+
+    def run(self, eval_config: EvalConfig, num_round: int, index: int = 0) -> RoundOutput:
+        """
+        Runs a single round.
+
+        Args:
+            eval_config (EvalConfig): The evaluation configuration.
+            num_round (int): The round number.
+            index (int): Index of the round in the evaluation plan, added to
+                the seed of the random generators.
+
+        Returns:
+            RoundOutput: The results of the round, the information about its
+            map and its images (None if not enabled), or three None if map
+            class not found.
+        """
+        if self.seed is not None:
+            random.seed(self.seed + index)
+            np.random.seed(self.seed + index)
 
         # Retrieve the class object from the global namespace using its name
         map_class = globals().get(eval_config.map_name)
@@ -174,21 +538,15 @@ class Launcher:
         if not map_class:
             # If the class is not found, print a warning and skip this configuration
             print(f"Warning: Unknown map type '{eval_config.map_name}', skipping configuration")
-            return None
+            return None, None, None
 
         # Instantiate the map class with the provided zones configuration
         the_map = map_class(drone_type=MyDrone, zones_config=eval_config.zones_config)
 
-        self.number_drones = the_map.number_drones
-        self.max_timestep_limit = the_map.max_timestep_limit
-        self.max_walltime_limit = the_map.max_walltime_limit
-        self.number_wounded_persons = the_map.number_wounded_persons
-        self.size_area = the_map.size_area
-
-        self.score_manager = ScoreManager(number_drones=self.number_drones,
-                                          max_timestep_limit=self.max_timestep_limit,
-                                          max_walltime_limit=self.max_walltime_limit,
-                                          total_number_wounded_persons=self.number_wounded_persons)
+        score_manager = ScoreManager(number_drones=the_map.number_drones,
+                                     max_timestep_limit=the_map.max_timestep_limit,
+                                     max_walltime_limit=the_map.max_walltime_limit,
+                                     total_number_wounded_persons=the_map.number_wounded_persons)
 
         num_round_str = str(num_round)
         if self.video_capture_enabled:
@@ -205,10 +563,20 @@ class Launcher:
         else:
             filename_video_capture = None
 
-        my_gui = GuiSR(the_map=the_map,
-                       draw_interactive=False,
-                       filename_video_capture=filename_video_capture,
-                       headless=headless)
+        step_profiler = StepProfiler() if self.profile else None
+
+        if self.fast:
+            my_gui = HeadlessRunner(the_map=the_map,
+                                    draw_interactive=False,
+                                    filename_video_capture=filename_video_capture,
+                                    render=not self.headless,
+                                    profiler=step_profiler)
+        else:
+            my_gui = GuiSR(the_map=the_map,
+                           draw_interactive=False,
+                           filename_video_capture=filename_video_capture,
+                           headless=self.headless,
+                           profiler=step_profiler)
 
         window_title = (f"Team: {self.team_info.team_number_str}   -   "
                         f"Map: {type(the_map).__name__}   -   "
@@ -221,7 +589,7 @@ class Launcher:
         error_msg = ""
 
         original_stdout = sys.stdout
-        if hide_solution_output:
+        if self.hide_solution_output:
             sys.stdout = open(os.devnull, 'w')
 
         try:
@@ -242,7 +610,7 @@ class Launcher:
 
             has_crashed = True
         finally:
-            if hide_solution_output:
+            if self.hide_solution_output:
                 sys.stdout.close()
                 sys.stdout = original_stdout
 
@@ -252,14 +620,11 @@ class Launcher:
         score_exploration = the_map.explored_map.score() * 100.0
         score_health_returned = the_map.compute_score_health_returned() * 100
 
-        last_image_explo_lines = the_map.explored_map.get_pretty_map_explo_lines()
-        last_image_explo_zones = the_map.explored_map.get_pretty_map_explo_zones()
-        self.data_saver.save_images(my_gui.last_image,
-                                    last_image_explo_lines,
-                                    last_image_explo_zones,
-                                    eval_config.map_name,
-                                    eval_config.zones_name_for_filename,
-                                    num_round)
+        images = None
+        if self.images_enabled:
+            images = (my_gui.last_image,
+                      the_map.explored_map.get_pretty_map_explo_lines(),
+                      the_map.explored_map.get_pretty_map_explo_zones())
 
         # Clean up resources after the round to prevent memory leaks
         if hasattr(the_map, 'playground') and the_map.playground:
@@ -270,107 +635,40 @@ class Launcher:
             except Exception:
                 pass
 
-        return (my_gui.percent_drones_destroyed,
-                my_gui.mean_drones_health,
-                my_gui.elapsed_timestep,
-                my_gui.full_rescue_timestep,
-                score_exploration,
-                my_gui.rescued_number,
-                score_health_returned,
-                my_gui.elapsed_walltime,
-                my_gui.is_max_walltime_limit_reached,
-                has_crashed)
-
-    def go(
-        self,
-        stop_at_first_crash: bool = False,
-        hide_solution_output: bool = False,
-        headless: bool = False
-    ) -> bool:
-        """
-        Runs the simulation for all evaluation configurations and calculates scores.
-
-        Args:
-            stop_at_first_crash (bool): Stop at the first crash if True.
-            hide_solution_output (bool): Hide solution output if True.
-            headless (bool): Run in headless mode if True.
-
-        Returns:
-            bool: True if all rounds completed successfully, False if any crashed.
-        """
-        ok = True
-
-        print(f"--------------------------------------------------------------------------------------------")
-
-        for eval_config in self.eval_plan.list_eval_config:
-            gc.collect()
-            print("")
-
-            if not isinstance(eval_config.zones_config, Tuple) and not isinstance(eval_config.zones_config[0], Tuple):
-                raise ValueError("Invalid eval_config.zones_config. It should be a tuple of tuples of ZoneType.")
+        result = (my_gui.percent_drones_destroyed,
+                  my_gui.mean_drones_health,
+                  my_gui.elapsed_timestep,
+                  my_gui.full_rescue_timestep,
+                  score_exploration,
+                  my_gui.rescued_number,
+                  score_health_returned,
+                  my_gui.elapsed_walltime,
+                  my_gui.is_max_walltime_limit_reached,
+                  has_crashed)
+        round_info = (the_map.number_drones,
+                      the_map.max_timestep_limit,
+                      the_map.max_walltime_limit,
+                      the_map.number_wounded_persons,
+                      the_map.size_area,
+                      score_manager,
+                      step_profiler)
+        return result, round_info, images
+
+
+def _one_round_in_worker(task: Tuple[RoundRunner, EvalConfig, int, int]) -> RoundOutput:
+    """
+    Runs one round in a worker process of Launcher._run_rounds_in_pool().
 
-            print(f"--------------------------------------------------------------------------------------------")
-            for num_round in range(eval_config.nb_rounds):
-                print(f"--------------------------------------------------------------------------------------------")
-                print(f"* Map: {eval_config.map_name}, special zones: {eval_config.zones_name_casual}, "
-                      f"round: {num_round + 1}/{eval_config.nb_rounds}")
-                gc.collect()
-                result = self.one_round(eval_config, num_round + 1, hide_solution_output, headless)
-                if result is None:
-                    return False
-                (percent_drones_destroyed, mean_drones_health, elapsed_timestep,
-                 full_rescue_timestep, score_exploration, rescued_number,
-                 score_health_returned, elapsed_walltime,
-                 is_max_walltime_limit_reached, has_crashed) = result
-
-                result_score = self.score_manager.compute_score(rescued_number,
-                                                                score_exploration,
-                                                                score_health_returned,
-                                                                full_rescue_timestep)
-                (round_score, percent_rescued, score_timestep) = result_score
-
-                mean_drones_health_percent = mean_drones_health / DRONE_INITIAL_HEALTH * 100.
-
-                print(
-                    f"\t* Round n°{num_round + 1}/{eval_config.nb_rounds}: "
-                    f"\n\t\trescued nb: {int(rescued_number)}/{self.number_wounded_persons}, "
-                    f"explor. score: {score_exploration:.1f}%, "
-                    f"health return score: {score_health_returned:.1f}%, "
-                    f"walltime elapsed: {elapsed_walltime:.0f}s/{self.max_walltime_limit}s, "
-                    f"elapse timestep: {elapsed_timestep}/{self.max_timestep_limit} steps, "
-                    f"time to rescue all: {full_rescue_timestep} steps."
-                    f"\n\t\tpercentage of drones destroyed: {percent_drones_destroyed:.1f} %, "
-                    f"mean percentage of drones health : {mean_drones_health_percent:.1f} %."
-                    f"\n\t\tround score: {round_score:.1f}%, "
-                    f"frequency: {elapsed_timestep / elapsed_walltime:.2f} steps/s.")
-                if is_max_walltime_limit_reached:
-                    print(f"\t\tThe max walltime limit of {self.max_walltime_limit}s is reached first.")
-
-                self.data_saver.save_one_round(eval_config,
-                                               num_round + 1,
-                                               percent_drones_destroyed,
-                                               mean_drones_health_percent,
-                                               percent_rescued,
-                                               score_exploration,
-                                               score_health_returned,
-                                               elapsed_timestep,
-                                               elapsed_walltime,
-                                               full_rescue_timestep,
-                                               score_timestep,
-                                               has_crashed,
-                                               round_score)
-
-                if has_crashed:
-                    print(f"\t* WARNING, this program have crashed !")
-                    ok = False
-                    if stop_at_first_crash:
-                        self.data_saver.generate_pdf_report()
-                        return ok
+    Args:
+        task (Tuple): The round runner, the evaluation config, the round
+            number and the index of the round.
 
-        print(f"--------------------------------------------------------------------------------------------")
-        self.data_saver.generate_pdf_report()
-
-        return ok
+    Returns:
+        RoundOutput: The output of RoundRunner.run().
+    """
+    round_runner, eval_config, num_round, index = task
+    gc.collect()
+    return round_runner.run(eval_config, num_round, index)
 
 
 if __name__ == "__main__":
@@ -379,12 +677,20 @@ if __name__ == "__main__":
     parser.add_argument("--stop_at_first_crash", "-s", action="store_true", help="Stop the code at first crash")
     parser.add_argument("--hide_solution_output", "-o", action="store_true", help="Hide print output of the solution")
     parser.add_argument("--headless", "-H", action="store_true", help="Run evaluations without opening a display window (suitable for servers)")
+    parser.add_argument("--fast", "-f", action="store_true", help="Step the simulation as fast as possible, without frame rate limitation (combine with --headless to draw nothing)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Number of rounds run in parallel in worker processes")
+    parser.add_argument("--profile", "-p", action="store_true", help="Measure the time spent in each phase of the steps and in each drone, saved next to the stats file")
     parser.add_argument("--config", "-c", type=str, help="Path to evaluation plan YAML configuration file")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the random generators of the rounds, for results independent of the number of jobs")
     args = parser.parse_args()
 
     launcher = Launcher(config_path=args.config)
     success = launcher.go(stop_at_first_crash=args.stop_at_first_crash,
                           hide_solution_output=args.hide_solution_output,
-                          headless=args.headless)
+                          headless=args.headless,
+                          fast=args.fast,
+                          jobs=args.jobs,
+                          profile=args.profile,
+                          seed=args.seed)
     if not success:
         exit(1)
@@ -87,6 +87,7 @@ class MapFinal2022_23(MapAbstract):
 
         add_walls(self._playground)
         add_boxes(self._playground)
+        self._playground.merge_walls()
 
         self._explored_map.initialize_walls(self._playground)
 
@@ -81,6 +81,7 @@ class MapFinal_2023_24_03(MapAbstract):
 
         add_walls(self._playground)
         add_boxes(self._playground)
+        self._playground.merge_walls()
 
         self._explored_map.initialize_walls(self._playground)
 
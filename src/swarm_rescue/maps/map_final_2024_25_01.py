@@ -92,6 +92,7 @@ class MapFinal_2024_25_01(MapAbstract):
 
         add_walls(self._playground)
         add_boxes(self._playground)
+        self._playground.merge_walls()
 
         self._explored_map.initialize_walls(self._playground)
 
@@ -11,6 +11,8 @@ Examples can be found in spg/agents/agents.py
 """
 from __future__ import annotations
 
+from typing import Any, Dict, List
+
 from swarm_rescue.simulation.drone.communicator import Communicator
 from swarm_rescue.simulation.drone.controller import Controller, CommandsDict
 from swarm_rescue.simulation.drone.drone_base import DroneBase
@@ -64,6 +66,14 @@ class Agent(Entity):
         self._initial_coordinates = None
         self._allow_overlapping = False
 
+        # Devices of the base by type, rebuilt when devices are added
+        self._cached_sensors: List[Sensor] = []
+        self._cached_external_sensors: List[ExternalSensor] = []
+        self._cached_controllers: List[Controller] = []
+        self._cached_communicators: List[Communicator] = []
+        self._cached_name_to_controller: Dict[str, Controller] = {}
+        self._devices_cache_needs_update = True
+
     def add_base(self, base: DroneBase) -> None:
         """
         Attach a base to the agent.
@@ -73,6 +83,31 @@ class Agent(Entity):
         """
         base.agent = self
         self._base = base
+        self.invalidate_devices_cache()
+
+    def invalidate_devices_cache(self) -> None:
+        """
+        Rebuild the lists of the devices of the agent at their next access,
+        after devices are added to its base.
+        """
+        self._devices_cache_needs_update = True
+
+    def _update_devices_cache(self) -> None:
+        """
+        Sort the devices of the base by type, if they changed since the last
+        access.
+        """
+        if not self._devices_cache_needs_update:
+            return
+
+        devices = self.base.devices
+        self._cached_sensors = [dev for dev in devices if isinstance(dev, Sensor)]
+        self._cached_external_sensors = [sensor for sensor in self._cached_sensors
+                                         if isinstance(sensor, ExternalSensor)]
+        self._cached_controllers = [dev for dev in devices if isinstance(dev, Controller)]
+        self._cached_communicators = [dev for dev in devices if isinstance(dev, Communicator)]
+        self._cached_name_to_controller = {contr.name: contr for contr in self._cached_controllers}
+        self._devices_cache_needs_update = False
 
     ################
     # Properties
@@ -122,48 +157,37 @@ class Agent(Entity):
     @property
     def observations(self) -> dict:
         """Return a dictionary of sensor names to their current values."""
-        return {
-            sens: sens.sensor_values
-            for sens in self.base.devices
-            if isinstance(sens, Sensor)
-        }
+        return {sens: sens.sensor_values for sens in self.sensors}
 
     @property
     def controllers(self) -> list[Controller]:
-        """Return a list of controllers attached to the agent."""
-        return [
-            contr
-            for contr in self.base.devices
-            if isinstance(contr, Controller)
-        ]
+        """Return a list of controllers attached to the agent (cached, do not modify)."""
+        self._update_devices_cache()
+        return self._cached_controllers
 
     @property
     def _name_to_controller(self) -> dict:
         """Return a mapping from controller names to controller objects."""
-        return {contr.name: contr for contr in self.controllers}
+        self._update_devices_cache()
+        return self._cached_name_to_controller
 
     @property
     def communicators(self) -> list[Communicator]:
-        """Return a list of communicators attached to the agent."""
-        return [
-            comm
-            for comm in self.base.devices
-            if isinstance(comm, Communicator)
-        ]
+        """Return a list of communicators attached to the agent (cached, do not modify)."""
+        self._update_devices_cache()
+        return self._cached_communicators
 
     @property
     def sensors(self) -> list[Sensor]:
-        """Return a list of sensors attached to the agent."""
-        return [
-            sensor
-            for sensor in self.base.devices
-            if isinstance(sensor, Sensor)
-        ]
+        """Return a list of sensors attached to the agent (cached, do not modify)."""
+        self._update_devices_cache()
+        return self._cached_sensors
 
     @property
     def external_sensors(self) -> list[ExternalSensor]:
-        """Return a list of external sensors attached to the agent."""
-        return [sensor for sensor in self.sensors if isinstance(sensor, ExternalSensor)]
+        """Return a list of external sensors attached to the agent (cached, do not modify)."""
+        self._update_devices_cache()
+        return self._cached_external_sensors
 
     def compute_observations(self) -> None:
         """Update all sensors' values."""
@@ -231,6 +255,17 @@ class Agent(Entity):
         """Reset the agent's base."""
         self.base.reset()
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Return the state of the agent, with its current reward."""
+        state = super().snapshot_state()
+        state["reward"] = self._reward
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Revert the agent to a state returned by snapshot_state()."""
+        super().restore_state(state)
+        self._reward = state["reward"]
+
     def post_step(self) -> None:
         """Call post_step on the agent's base."""
         self.base.post_step()
@@ -0,0 +1,199 @@
+"""
+Module defining the graph of the communicators in transmission range of each
+other, shared by all the communicators of a playground.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy is optional, it comes with scikit-image
+    cKDTree = None
+
+if TYPE_CHECKING:
+    from swarm_rescue.simulation.drone.communicator import Communicator
+    from swarm_rescue.simulation.gui_map.playground import Playground
+
+
+class CommunicationGraph:
+    """
+    Computes which communicators of the agents of a playground are in
+    transmission range of each other, for all of them at once, instead of
+    testing each pair with Communicator.in_transmission_range().
+
+    The playground enables the graph during the phases of the step where the
+    communicators need it: the pre_step of the agents (for their
+    comms_in_range) and the transmission of the messages, after the physics.
+    It is computed at the first query of each phase. Out of these phases, the
+    communicators test their range themselves.
+
+    The distances are computed with a matrix of the distances between all
+    the communicators. With more than KD_TREE_MIN_COMMUNICATORS
+    communicators of finite range, only the pairs closer than the largest
+    range are found with a KD-tree, if scipy is installed.
+    """
+
+    KD_TREE_MIN_COMMUNICATORS = 50
+
+    def __init__(self, playground: Playground):
+        """
+        Initialize the CommunicationGraph.
+
+        Args:
+            playground (Playground): The playground of the communicators.
+        """
+        self._playground = playground
+
+        self._comms: List[Communicator] = []
+        self._indices: Dict[Communicator, int] = {}
+        # in_range[i, j] is True if the communicators i and j are in range
+        self._in_range = np.zeros((0, 0), dtype=bool)
+
+        self._enabled = False
+        self._computed = False
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns whether the graph answers the queries of the communicators.
+        """
+        return self._enabled
+
+    def enable(self) -> None:
+        """
+        Answer the queries of the communicators until disable() is called,
+        with the graph computed at the first query.
+        """
+        self._enabled = True
+        self._computed = False
+
+    def disable(self) -> None:
+        """
+        Stop answering the queries of the communicators, once the phase of
+        the step using the graph is over.
+        """
+        self._enabled = False
+
+    def _compute(self) -> None:
+        """
+        Compute the graph with the current positions of the communicators of
+        the agents of the playground.
+        """
+        self._comms = [comm for agent in self._playground.agents
+                       for comm in agent.communicators]
+        self._indices = {comm: index for index, comm in enumerate(self._comms)}
+
+        positions = np.array([tuple(comm.position) for comm in self._comms],
+                             dtype=float).reshape(-1, 2)
+        # A communicator without range has an infinite range
+        ranges = np.array([comm.transmission_range or np.inf for comm in self._comms],
+                          dtype=float)
+
+        if (cKDTree is not None and len(self._comms) >= self.KD_TREE_MIN_COMMUNICATORS
+                and np.all(np.isfinite(ranges))):
+            self._in_range = self._get_in_range_kd_tree(positions, ranges)
+        else:
+            self._in_range = self._get_in_range_matrix(positions, ranges)
+
+        self._computed = True
+
+    def _get_index(self, comm: Communicator) -> Optional[int]:
+        """
+        Returns the index of a communicator in the graph, computed first if
+        needed, or None if the graph is disabled or does not know the
+        communicator.
+
+        Args:
+            comm (Communicator): The communicator.
+        """
+        if not self._enabled:
+            return None
+
+        if not self._computed:
+            self._compute()
+
+        return self._indices.get(comm)
+
+    @staticmethod
+    def _get_in_range_matrix(positions: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+        """
+        Returns the communicators in range of each other, from the matrix of
+        their distances.
+
+        Args:
+            positions (np.ndarray): Positions of the communicators.
+            ranges (np.ndarray): Transmission ranges of the communicators.
+        """
+        delta = positions[:, np.newaxis, :] - positions[np.newaxis, :, :]
+        # Same computation as pymunk.Vec2d.get_distance()
+        distances = np.sqrt(delta[..., 0] ** 2 + delta[..., 1] ** 2)
+
+        in_range = distances < np.minimum(ranges[:, np.newaxis], ranges[np.newaxis, :])
+        np.fill_diagonal(in_range, False)
+
+        return in_range
+
+    @staticmethod
+    def _get_in_range_kd_tree(positions: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+        """
+        Returns the communicators in range of each other, from the pairs
+        closer than the largest range found with a KD-tree.
+
+        Args:
+            positions (np.ndarray): Positions of the communicators.
+            ranges (np.ndarray): Transmission ranges of the communicators,
+                all finite.
+        """
+        pairs = cKDTree(positions).query_pairs(r=float(ranges.max()), output_type="ndarray")
+        first, second = pairs[:, 0], pairs[:, 1]
+
+        delta = positions[first] - positions[second]
+        distances = np.sqrt(delta[:, 0] ** 2 + delta[:, 1] ** 2)
+        close = distances < np.minimum(ranges[first], ranges[second])
+
+        in_range = np.zeros((len(positions), len(positions)), dtype=bool)
+        in_range[first[close], second[close]] = True
+        in_range[second[close], first[close]] = True
+
+        return in_range
+
+    def comms_in_range(self, comm: Communicator) -> Optional[List[Communicator]]:
+        """
+        Returns the communicators in range of a communicator, in the order of
+        the agents of the playground.
+
+        Args:
+            comm (Communicator): The communicator.
+
+        Returns:
+            Optional[List[Communicator]]: The communicators in range, None if
+            the graph is disabled or does not know the communicator.
+        """
+        index = self._get_index(comm)
+        if index is None:
+            return None
+
+        return [self._comms[other] for other in np.flatnonzero(self._in_range[index])]
+
+    def in_range(self, comm: Communicator, other: Communicator) -> Optional[bool]:
+        """
+        Returns whether two communicators are in range of each other.
+
+        Args:
+            comm (Communicator): The first communicator.
+            other (Communicator): The second communicator.
+
+        Returns:
+            Optional[bool]: Whether they are in range, None if the graph is
+            disabled or does not know one of them.
+        """
+        index = self._get_index(comm)
+        other_index = self._get_index(other)
+        if index is None or other_index is None:
+            return None
+
+        return bool(self._in_range[index, other_index])
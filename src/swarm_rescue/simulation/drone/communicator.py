@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from swarm_rescue.simulation.drone.message_codec import MessageCodec
 from swarm_rescue.simulation.drone.pocket_device import PocketDevice
 
 Message = Any
@@ -17,6 +18,8 @@ class Communicator(PocketDevice):
     def __init__(
             self,
             transmission_range: Optional[float] = None,
+            codec: Optional[MessageCodec] = None,
+            byte_budget: Optional[int] = None,
     ):
         """
         By default, Communicator has infinite range and infinite receiver capacity.
@@ -24,6 +27,11 @@ class Communicator(PocketDevice):
 
         Args:
             transmission_range (Optional[float]): Communication range in pixels. None means infinite.
+            codec (Optional[MessageCodec]): Codec serializing the messages
+                sent, to count their size in bytes. None sends the messages
+                as they are, without counting their size.
+            byte_budget (Optional[int]): Number of bytes the communicator can
+                send per step, see byte_budget. None means infinite.
         """
 
         super().__init__(color=COMM_COLOR)
@@ -33,6 +41,15 @@ class Communicator(PocketDevice):
         self._comms_in_range: List[Communicator] = []
         self._received_messages: List[Tuple[Communicator, Message]] = []
 
+        self._codec = codec
+        self._byte_budget: Optional[int] = None
+        self.byte_budget = byte_budget
+
+        # Size in bytes of the last message sent, 0 without codec
+        self._last_message_size = 0
+        self._bytes_sent = 0
+        self._bytes_received = 0
+
     def pre_step(self) -> None:
         """
         Prepare communicator for a new simulation step.
@@ -40,6 +57,9 @@ class Communicator(PocketDevice):
         super().pre_step()
         self.update_list_comms_in_range()
         self._received_messages = []
+        self._last_message_size = 0
+        self._bytes_sent = 0
+        self._bytes_received = 0
 
     def reset(self) -> None:
         """
@@ -48,6 +68,33 @@ class Communicator(PocketDevice):
         self.pre_step()
         super().reset()
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the communicator, with the communicators in
+        range and the messages received during the last step.
+        """
+        state = super().snapshot_state()
+        state["comms_in_range"] = list(self._comms_in_range)
+        state["received_messages"] = list(self._received_messages)
+        state["last_message_size"] = self._last_message_size
+        state["bytes_sent"] = self._bytes_sent
+        state["bytes_received"] = self._bytes_received
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the communicator to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the communicator.
+        """
+        super().restore_state(state)
+        self._comms_in_range = list(state["comms_in_range"])
+        self._received_messages = list(state["received_messages"])
+        self._last_message_size = state["last_message_size"]
+        self._bytes_sent = state["bytes_sent"]
+        self._bytes_received = state["bytes_received"]
+
     @property
     def transmission_range(self) -> Optional[float]:
         """
@@ -55,12 +102,84 @@ class Communicator(PocketDevice):
         """
         return self._transmission_range
 
+    @property
+    def codec(self) -> Optional[MessageCodec]:
+        """
+        Returns the codec serializing the messages sent, or None.
+        """
+        return self._codec
+
+    @codec.setter
+    def codec(self, codec: Optional[MessageCodec]) -> None:
+        """
+        Set the codec serializing the messages sent. The receivers get the
+        messages decoded from their bytes, and the size of the messages is
+        counted in bytes_sent and bytes_received.
+
+        Args:
+            codec (Optional[MessageCodec]): The codec, None to send the
+                messages as they are.
+        """
+        self._codec = codec
+
+    @property
+    def byte_budget(self) -> Optional[int]:
+        """
+        Returns the number of bytes the communicator can send per step, or
+        None if infinite.
+        """
+        return self._byte_budget
+
+    @byte_budget.setter
+    def byte_budget(self, byte_budget: Optional[int]) -> None:
+        """
+        Set the number of bytes the communicator can send per step. A message
+        exceeding the bytes left in the step is not sent. The budget requires
+        a codec to measure the messages.
+
+        Args:
+            byte_budget (Optional[int]): Number of bytes, None for an
+                infinite budget.
+        """
+        if byte_budget is not None and byte_budget < 0:
+            raise ValueError("The byte budget of a communicator should be positive")
+        self._byte_budget = byte_budget
+
+    @property
+    def bytes_sent(self) -> int:
+        """
+        Returns the number of bytes sent during the step, counted with a
+        codec only.
+        """
+        return self._bytes_sent
+
+    @property
+    def last_message_size(self) -> int:
+        """
+        Returns the size in bytes of the last message sent, 0 without codec.
+        """
+        return self._last_message_size
+
+    @property
+    def bytes_received(self) -> int:
+        """
+        Returns the number of bytes received during the step, counted for the
+        messages of senders with a codec only.
+        """
+        return self._bytes_received
+
     def update_list_comms_in_range(self) -> None:
         """
-        Update the list of communicators in range.
+        Update the list of communicators in range, from the communication
+        graph of the playground if it is enabled.
         """
         assert self._playground
 
+        comms_in_range = self._playground.communication_graph.comms_in_range(self)
+        if comms_in_range is not None:
+            self._comms_in_range = comms_in_range
+            return
+
         comms = []
         for agent in self._playground.agents:
             comms += agent.communicators
@@ -118,18 +237,34 @@ class Communicator(PocketDevice):
 
     def send(self, msg: Message, ) -> Optional[Message]:
         """
-        Send a message if the communicator is enabled.
+        Send a message if the communicator is enabled. With a codec, the
+        message sent is the message decoded from its bytes, shared by all the
+        receivers, and it is not sent if it exceeds the byte budget left in
+        the step.
 
         Args:
             msg (Message): The message to send.
 
         Returns:
-            Optional[Message]: The message if sent, None if disabled.
+            Optional[Message]: The message if sent, None if disabled or over
+            the byte budget.
         """
         if self._disabled:
             return None
 
-        return msg
+        self._last_message_size = 0
+
+        if self._codec is None:
+            return msg
+
+        data = self._codec.encode(msg)
+        if self._byte_budget is not None and self._bytes_sent + len(data) > self._byte_budget:
+            return None
+
+        self._last_message_size = len(data)
+        self._bytes_sent += len(data)
+
+        return self._codec.decode(data)
 
     def receive(self, sender: Communicator, msg: Message) -> Optional[Message]:
         """
@@ -145,8 +280,34 @@ class Communicator(PocketDevice):
         if self._disabled or sender is self:
             return None
 
-        if self.in_transmission_range(sender):
+        in_range = None
+        if self._playground:
+            in_range = self._playground.communication_graph.in_range(self, sender)
+        if in_range is None:
+            in_range = self.in_transmission_range(sender)
+
+        if in_range:
             self._received_messages.append((sender, msg))
+            self._bytes_received += sender.last_message_size
             return msg
 
         return None
+
+    def receive_in_range(self, sender: Communicator, msg: Message) -> Optional[Message]:
+        """
+        Receive a message from a communicator already known to be in range,
+        without testing the range again.
+
+        Args:
+            sender (Communicator): The sender, in range of the communicator.
+            msg (Message): The message.
+
+        Returns:
+            Optional[Message]: The message if received, None otherwise.
+        """
+        if self._disabled or sender is self:
+            return None
+
+        self._received_messages.append((sender, msg))
+        self._bytes_received += sender.last_message_size
+        return msg
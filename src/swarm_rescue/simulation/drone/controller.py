@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import Union, Dict
+from typing import Union, Dict, Any, List, Optional, Sequence
 
 import numpy as np
 
@@ -110,6 +110,26 @@ class Controller(PocketDevice):
         """
         self.pre_step()
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the controller, with its current command.
+        """
+        state = super().snapshot_state()
+        state["command"] = self._command
+        state["currently_disabled"] = self._currently_disabled
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the controller to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the controller.
+        """
+        super().restore_state(state)
+        self._command = state["command"]
+        self._currently_disabled = state["currently_disabled"]
+
     @abstractmethod
     def _check(self, command: Command) -> bool:
         """
@@ -243,3 +263,102 @@ class CenteredContinuousController(Controller):
         Returns a random command value in the allowed range.
         """
         return self._playground.rng.uniform(self._min, self._max)
+
+
+class BatchedCommands:
+    """
+    The commands of the controllers of several agents, given as one array and
+    written into the controllers at once by Playground.step(), instead of one
+    dict of commands per agent.
+
+    The controllers are given as rows of the same number of controllers, one
+    row per agent for instance. The array of the commands has one row per row
+    of controllers and one column per controller of a row. Only
+    CenteredContinuousController and GrasperController are supported.
+
+    Example:
+        controllers = [[drone.base.forward_controller, drone.grasper.grasp_controller]
+                       for drone in drones]
+        batched_commands = BatchedCommands(controllers)
+        batched_commands.commands[:, 0] = 0.5
+        playground.step(batched_commands=batched_commands)
+    """
+
+    def __init__(self, controllers: Sequence[Sequence[Controller]]):
+        """
+        Initialize the BatchedCommands, with the default commands of the
+        controllers.
+
+        Args:
+            controllers (Sequence[Sequence[Controller]]): The rows of
+                controllers.
+        """
+        rows = [list(row) for row in controllers]
+        if len({len(row) for row in rows}) > 1:
+            raise ValueError("All the rows of controllers should have the same length")
+
+        # One list of controllers per column of the commands
+        self._columns: List[List[Controller]] = [list(column) for column in zip(*rows)]
+        self._defaults = np.array([[contr.default for contr in row] for row in rows],
+                                  dtype=float).reshape(len(rows), len(self._columns))
+
+        # Valid commands of each controller: a range for the continuous
+        # controllers, a set of values for the graspers
+        self._mins = np.full(self._defaults.shape, -np.inf)
+        self._maxs = np.full(self._defaults.shape, np.inf)
+        self._valid_values: List[Optional[np.ndarray]] = []
+        for j, column in enumerate(self._columns):
+            if all(isinstance(contr, CenteredContinuousController) for contr in column):
+                self._mins[:, j] = [contr.min for contr in column]
+                self._maxs[:, j] = [contr.max for contr in column]
+                self._valid_values.append(None)
+            elif all(isinstance(contr, GrasperController) for contr in column):
+                if len({tuple(contr.valid_commands) for contr in column}) > 1:
+                    raise ValueError("The graspers of a column should have the same valid commands")
+                self._valid_values.append(np.array(column[0].valid_commands, dtype=float))
+            else:
+                raise ValueError("A column should only have CenteredContinuousController "
+                                 "or only GrasperController controllers")
+
+        self._commands = self._defaults.copy()
+
+    @property
+    def commands(self) -> np.ndarray:
+        """
+        Returns the array of the commands, of shape (number of rows, number of
+        controllers per row), to write the commands of the next step in.
+        """
+        return self._commands
+
+    def write(self) -> None:
+        """
+        Write the commands into the controllers, checked as by
+        Controller.command: an invalid command raises a ValueError for a
+        controller with hard_check, and is replaced by the default command
+        otherwise, as the commands of the disabled controllers.
+        """
+        commands = self._commands
+        valid = (commands >= self._mins) & (commands <= self._maxs)
+        for j, valid_values in enumerate(self._valid_values):
+            if valid_values is not None:
+                valid[:, j] = np.isin(commands[:, j], valid_values)
+
+        # pylint: disable=protected-access
+        hard_check = np.array([[contr._hard_check for contr in column]
+                               for column in self._columns], dtype=bool).T.reshape(valid.shape)
+        if np.any(~valid & hard_check):
+            row, j = np.argwhere(~valid & hard_check)[0]
+            contr = self._columns[j][row]
+            raise ValueError(f"Invalid command '{commands[row, j]}' for controller '{contr.name}'. "
+                             f"Expected type: {type(contr.default).__name__}")
+
+        disabled = np.array([[contr._currently_disabled for contr in column]
+                             for column in self._columns], dtype=bool).T.reshape(valid.shape)
+        values = np.where(valid & ~disabled, commands, self._defaults)
+
+        for j, column in enumerate(self._columns):
+            column_values = values[:, j]
+            if self._valid_values[j] is not None:
+                column_values = column_values.astype(int)
+            for contr, value in zip(column, column_values.tolist()):
+                contr._command = value
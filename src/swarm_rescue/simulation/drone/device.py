@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Dict, Any
+
 from swarm_rescue.simulation.drone.interactive_anchored import InteractiveAnchored
 from swarm_rescue.simulation.utils.definitions import CollisionTypes
 
@@ -37,6 +39,24 @@ class Device(InteractiveAnchored):
         """
         self._disabled = False
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the device, with its disabled state.
+        """
+        state = super().snapshot_state()
+        state["disabled"] = self._disabled
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the device to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the device.
+        """
+        super().restore_state(state)
+        self._disabled = state["disabled"]
+
     def disable(self) -> None:
         """
         Disable the device for the current step.
@@ -1,7 +1,8 @@
+import copy
 import math
 from abc import abstractmethod
 from enum import IntEnum, auto
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Union
 
 import arcade
 import matplotlib.pyplot as plt
@@ -19,7 +20,7 @@ from swarm_rescue.simulation.drone.grasper import Grasper
 from swarm_rescue.simulation.ray_sensors.drone_lidar import DroneLidar
 from swarm_rescue.simulation.ray_sensors.drone_semantic_sensor import DroneSemanticSensor
 from swarm_rescue.simulation.drone.drone_sensors import DroneGPS, DroneCompass, DroneOdometer
-from swarm_rescue.simulation.elements.normal_wall import NormalWall, NormalBox
+from swarm_rescue.simulation.elements.normal_wall import NormalWall, NormalBox, StaticWalls
 from swarm_rescue.simulation.elements.physical_element import PhysicalElement
 from swarm_rescue.simulation.gui_map.collision_handlers import get_colliding_entities
 from swarm_rescue.simulation.gui_map.playground import Playground
@@ -52,7 +53,8 @@ def drone_collision_wall(arbiter: pymunk.Arbiter, _, data) -> bool:
     my_drone = drone_base.agent
 
     if (isinstance(element, NormalWall) or
-            isinstance(element, NormalBox)):
+            isinstance(element, NormalBox) or
+            isinstance(element, StaticWalls)):
         my_drone.collide_wall()
 
     return True
@@ -717,3 +719,33 @@ class DroneAbstract(Agent):
         """
         self.is_inside_return_area = False
         super().pre_step()
+
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the drone: its health and its elapsed time.
+        The state of the drone solution (maps, plans, ...) is not part of it.
+
+        Returns:
+            Dict[str, Any]: State of the drone.
+        """
+        state = super().snapshot_state()
+        state["drone_health"] = self._drone_health
+        state["timer_collision"] = copy.copy(self._timer_collision_wall_or_drone)
+        state["is_inside_return_area"] = self.is_inside_return_area
+        state["elapsed_timestep"] = self.elapsed_timestep
+        state["elapsed_walltime"] = self.elapsed_walltime
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the drone to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the drone.
+        """
+        super().restore_state(state)
+        self._drone_health = state["drone_health"]
+        self._timer_collision_wall_or_drone = copy.copy(state["timer_collision"])
+        self.is_inside_return_area = state["is_inside_return_area"]
+        self.elapsed_timestep = state["elapsed_timestep"]
+        self.elapsed_walltime = state["elapsed_walltime"]
@@ -1,4 +1,5 @@
 import math
+from typing import Any, Dict
 
 import arcade
 import pymunk
@@ -164,6 +165,28 @@ class DroneBase(DronePart):
         # Reset the collision flag for next frame
         self._kill_zone_collision_this_frame = False
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the drone base, with its kill zone flags.
+        """
+        state = super().snapshot_state()
+        state["in_kill_zone"] = self._is_in_kill_zone
+        state["kill_zone_collision_this_frame"] = self._kill_zone_collision_this_frame
+        state["inside_return_area"] = self.inside_return_area
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the drone base to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the drone base.
+        """
+        super().restore_state(state)
+        self.set_in_kill_zone(state["in_kill_zone"])
+        self._kill_zone_collision_this_frame = state["kill_zone_collision_this_frame"]
+        self.inside_return_area = state["inside_return_area"]
+
     def _apply_commands(self, **kwargs) -> None:
         """
         Apply the control commands to the drone's physical body.
@@ -80,6 +80,9 @@ class DronePart(PhysicalEntity, ABC):
         else:
             raise ValueError("Not implemented")
 
+        if self._agent is not None:
+            self._agent.invalidate_devices_cache()
+
     def move_to(  # pylint: disable=arguments-differ
             self,
             coordinates: Coordinate,
@@ -1,5 +1,6 @@
+import copy
 import math
-from typing import Optional
+from typing import Optional, Dict, Any
 
 import numpy as np
 
@@ -15,6 +16,9 @@ class DroneGPS(Sensor):
     array, with a noise that follows an autoregressive model of order 1.
     """
 
+    # Computed at each step, as the noise follows an autoregressive model
+    LAZY_EVALUATION = False
+
     def __init__(self, **kwargs):
         """
         Initialize the DroneGPS sensor.
@@ -114,12 +118,33 @@ class DroneGPS(Sensor):
         """
         return self._disabled
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the sensor, with the state of its noise model.
+        """
+        state = super().snapshot_state()
+        state["noise_model"] = copy.deepcopy(self._noise_model)
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the sensor to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the sensor.
+        """
+        super().restore_state(state)
+        self._noise_model = copy.deepcopy(state["noise_model"])
+
 
 class DroneCompass(Sensor):
     """
     DroneCompass sensor returns the orientation of the drone as a float.
     """
 
+    # Computed at each step, as the noise follows an autoregressive model
+    LAZY_EVALUATION = False
+
     def __init__(self, **kwargs):
         """
         Initialize the DroneCompass sensor.
@@ -203,6 +228,24 @@ class DroneCompass(Sensor):
         """
         return self._disabled
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the sensor, with the state of its noise model.
+        """
+        state = super().snapshot_state()
+        state["noise_model"] = copy.deepcopy(self._noise_model)
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the sensor to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the sensor.
+        """
+        super().restore_state(state)
+        self._noise_model = copy.deepcopy(state["noise_model"])
+
 
 class DroneOdometer(Sensor):
     """
@@ -214,6 +257,9 @@ class DroneOdometer(Sensor):
         the last step in the reference frame
     """
 
+    # Computed at each step, as the values depend on the previous pose of the drone
+    LAZY_EVALUATION = False
+
     def __init__(self, **kwargs):
         """
         Initialize the DroneOdometer sensor.
@@ -331,3 +377,23 @@ class DroneOdometer(Sensor):
             bool: True if disabled, False otherwise.
         """
         return self._disabled
+
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the sensor, with the previous pose of the drone.
+        """
+        state = super().snapshot_state()
+        state["prev_position"] = self.prev_position
+        state["prev_angle"] = self.prev_angle
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the sensor to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the sensor.
+        """
+        super().restore_state(state)
+        self.prev_position = state["prev_position"]
+        self.prev_angle = state["prev_angle"]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import pymunk
 
@@ -68,6 +68,7 @@ class Grasper(Device):
             self._grasped_wounded_persons.append(wounded)
             self._add_joints(wounded)
             wounded.grasped_by.append(self)
+            self._anchor.playground.update_grasped(wounded)
 
             for sensor in self._anchor.agent.external_sensors:
                 if sensor.invisible_grasped:
@@ -140,6 +141,7 @@ class Grasper(Device):
         joints = self._grasp_joints.pop(wounded)
         if self._anchor and hasattr(self._anchor, 'playground') and self._anchor.playground:
             self._anchor.playground.space.remove(*joints)
+            self._anchor.playground.update_grasped(wounded)
 
         self._grasped_wounded_persons.remove(wounded)
 
@@ -150,6 +152,47 @@ class Grasper(Device):
         self._release_grasping()
         super().reset()
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the grasper, with the wounded persons grasped
+        and the anchors of the joints holding them.
+        """
+        state = super().snapshot_state()
+        state["can_grasp"] = self._can_grasp
+        state["grasped"] = [(wounded, joint.anchor_a, joint.anchor_b)
+                            for wounded in self._grasped_wounded_persons
+                            for joint in self._grasp_joints[wounded]]
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the grasper to a state returned by snapshot_state().
+        The wounded persons grasped at that time are attached again with
+        joints at the same anchors, even if they were dropped meanwhile.
+
+        Args:
+            state (Dict[str, Any]): State of the grasper.
+        """
+        super().restore_state(state)
+        self._release_grasping()
+
+        for wounded, anchor_a, anchor_b in state["grasped"]:
+            joint = pymunk.PivotJoint(self._anchor.pm_body, wounded.pm_body,
+                                      anchor_a, anchor_b)
+            joint.collide_bodies = False
+            self._grasp_joints[wounded] = [joint]
+            self._anchor.playground.space.add(joint)
+
+            self._grasped_wounded_persons.append(wounded)
+            wounded.grasped_by.append(self)
+            self._anchor.playground.update_grasped(wounded)
+
+            for sensor in self._anchor.agent.external_sensors:
+                if sensor.invisible_grasped:
+                    sensor.add_to_temporary_invisible(wounded)
+
+        self._can_grasp = state["can_grasp"]
+
     def apply_commands(self) -> None:
         """
         Apply the current grasp command.
@@ -0,0 +1,81 @@
+"""
+Module defining the codecs serializing the messages of the communicators to
+bytes, to measure and bound the size of the messages sent between drones.
+"""
+
+import pickle
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class MessageCodec(ABC):
+    """
+    Base class of the codecs of the messages of a Communicator.
+    """
+
+    @abstractmethod
+    def encode(self, msg: Any) -> bytes:
+        """
+        Serialize a message to bytes.
+
+        Args:
+            msg (Any): The message.
+
+        Returns:
+            bytes: The serialized message.
+        """
+        ...
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """
+        Deserialize a message serialized by encode().
+
+        Args:
+            data (bytes): The serialized message.
+
+        Returns:
+            Any: The message.
+        """
+        ...
+
+
+class PickleCodec(MessageCodec):
+    """
+    Codec serializing the messages with pickle, in its most compact protocol.
+    Any picklable message is accepted, and numpy arrays are serialized as
+    their raw data.
+    """
+
+    def __init__(self, protocol: int = pickle.HIGHEST_PROTOCOL):
+        """
+        Initialize the PickleCodec.
+
+        Args:
+            protocol (int): Pickle protocol of the serialized messages.
+        """
+        self._protocol = protocol
+
+    def encode(self, msg: Any) -> bytes:
+        """
+        Serialize a message to bytes with pickle.
+
+        Args:
+            msg (Any): The message.
+
+        Returns:
+            bytes: The serialized message.
+        """
+        return pickle.dumps(msg, protocol=self._protocol)
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Deserialize a message serialized by encode().
+
+        Args:
+            data (bytes): The serialized message.
+
+        Returns:
+            Any: The message.
+        """
+        return pickle.loads(data)
@@ -4,8 +4,9 @@ Module defining the Base Classes for Sensors.
 
 from __future__ import annotations
 
+import copy
 from abc import abstractmethod
-from typing import List, Optional, Union, Any
+from typing import List, Optional, Union, Any, Dict
 
 import numpy as np
 
@@ -30,9 +31,15 @@ class Sensor(PocketDevice):
 
     """
 
+    # Whether the values of the sensor can be computed lazily, at their first
+    # access (see lazy)
+    LAZY_EVALUATION = True
+
     def __init__(
             self,
             normalize: Optional[bool] = False,
+            update_period: int = 1,
+            lazy: bool = False,
             **kwargs: Any,
     ):
         """
@@ -43,6 +50,11 @@ class Sensor(PocketDevice):
         Args:
             anchor: Body Part or Scene Element on which the sensor will be attached.
             normalize: boolean. If True, sensor values are scaled between 0 and 1.
+            update_period: number of steps between two computations of the
+                values. On the steps in between, the sensor keeps its previous
+                values.
+            lazy: boolean. If True, the values are only computed when they
+                are read, see the lazy attribute.
             noise_params: Dictionary of noise parameters.
                 Noise is applied to the raw sensor, before normalization.
             name: name of the sensor. If not provided, a name will be set by default.
@@ -63,21 +75,185 @@ class Sensor(PocketDevice):
 
         self._noise = False
 
+        if update_period < 1:
+            raise ValueError("The update period of a sensor should be at least 1 step")
+        self._update_period = update_period
+
+        # Number of updates before the next computation of the values
+        self._updates_before_compute = 0
+
+        self._lazy = False
+        # Whether the values of a lazy sensor are due and not computed yet
+        self._values_pending = False
+        # Random generator of the noise of a lazy sensor
+        self._random_generator: Optional[np.random.RandomState] = None
+        self.lazy = lazy
+
+    @property
+    def lazy(self) -> bool:
+        """
+        Returns whether the values are computed lazily.
+        """
+        return self._lazy
+
+    @lazy.setter
+    def lazy(self, lazy: bool) -> None:
+        """
+        Compute the values of the sensor only when they are read in a step
+        (get_sensor_values(), draw(), ...), instead of at each step. A lazy
+        sensor never read costs nothing.
+
+        The values are read after the end of the step (in the control() of
+        the drones), when the playground may have changed since the
+        observations of the step: an entity removed in post_step, a
+        disappearing wall, ... The playground computes the pending values
+        before adding or removing an entity, and before the physics of the
+        next step for a sensor with an update_period keeping its values, so
+        that a lazy sensor always observes the same playground as an eager
+        one.
+
+        The noise of a lazy sensor is drawn from its own random generator (see
+        _random), seeded from the numpy random generator when the sensor
+        becomes lazy, so that its values do not depend on the sensors read
+        before it. Sensors whose values depend on their previous computation
+        (LAZY_EVALUATION is False) are still computed at each step.
+
+        Args:
+            lazy (bool): Whether the values are computed lazily.
+        """
+        if not lazy:
+            self._compute_pending_values()
+            self._random_generator = None
+        elif self._random_generator is None:
+            self._random_generator = np.random.RandomState(np.random.randint(2 ** 31))
+
+        self._lazy = lazy
+
+    @property
+    def _random(self):
+        """
+        Returns the random generator to draw the noise from: the generator of
+        the sensor if it is lazy, the numpy random generator otherwise.
+        """
+        if self._random_generator is None:
+            return np.random
+        return self._random_generator
+
+    @property
+    def computed_lazily(self) -> bool:
+        """
+        Returns whether the values are computed at their first access rather
+        than at the update.
+        """
+        return self._lazy and self.LAZY_EVALUATION
+
+    @property
+    def values_pending(self) -> bool:
+        """
+        Returns whether the values of a lazy sensor are due and not computed
+        yet.
+        """
+        return self._values_pending
+
+    @property
+    def update_period(self) -> int:
+        """
+        Returns the number of steps between two computations of the values.
+        """
+        return self._update_period
+
+    @update_period.setter
+    def update_period(self, update_period: int) -> None:
+        """
+        Set the number of steps between two computations of the values. A
+        sensor updated every N steps is N times cheaper, but its values can
+        be N - 1 steps old.
+
+        Args:
+            update_period (int): Number of steps, 1 to compute the values at
+                each step.
+        """
+        if update_period < 1:
+            raise ValueError("The update period of a sensor should be at least 1 step")
+        self._update_period = update_period
+        self._updates_before_compute = min(self._updates_before_compute, update_period - 1)
+
+    @property
+    def update_due(self) -> bool:
+        """
+        Returns whether the values are computed at the next update, or kept
+        from the previous one.
+        """
+        return self._updates_before_compute == 0
+
     def update(self) -> None:
         """
         Update the sensor values, applying noise and normalization if enabled.
+        The values are only computed every update_period steps, and kept in
+        between.
         """
         if self._disabled:
+            self._values_pending = False
             self._values = self._default_value
+            # Compute the values as soon as the sensor is enabled again
+            self._updates_before_compute = 0
+
+        elif self._updates_before_compute > 0:
+            self._updates_before_compute -= 1
 
         else:
-            self._compute_raw_sensor()
+            self._updates_before_compute = self._update_period - 1
+
+            if self.computed_lazily:
+                self._values_pending = True
+            else:
+                self._compute_values()
 
-            if self._noise:
-                self._apply_noise()
+    def _compute_values(self) -> None:
+        """
+        Compute the sensor values, applying noise and normalization if enabled.
+        """
+        self._compute_raw_sensor()
+
+        if self._noise:
+            self._apply_noise()
+
+        if self._normalize:
+            self._apply_normalization()
+
+    def _compute_pending_values(self) -> None:
+        """
+        Compute the values of a lazy sensor, if they were not computed yet
+        since its last update.
+        """
+        if self._values_pending:
+            self._values_pending = False
+            self._compute_values()
 
-            if self._normalize:
-                self._apply_normalization()
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the sensor, with a copy of its current values.
+        """
+        state = super().snapshot_state()
+        # The pending values of a lazy sensor are not computed by the snapshot
+        state["values"] = copy.copy(self._values)
+        state["values_pending"] = self._values_pending
+        state["random_generator"] = copy.deepcopy(self._random_generator)
+        state["updates_before_compute"] = self._updates_before_compute
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the sensor to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the sensor.
+        """
+        super().restore_state(state)
+        self._values = copy.copy(state["values"])
+        self._values_pending = state["values_pending"]
+        self._random_generator = copy.deepcopy(state["random_generator"])
+        self._updates_before_compute = state["updates_before_compute"]
 
     @abstractmethod
     def _compute_raw_sensor(self) -> None:
@@ -1,7 +1,7 @@
 """
 Module that defines DisappearingWall class - walls that disappear after a specified time
 """
-from typing import Tuple
+from typing import Any, Dict, Tuple
 
 from swarm_rescue.simulation.elements.normal_wall import NormalWall, NormalBox
 
@@ -77,6 +77,19 @@ class DisappearingWall(NormalWall):
         # Remove the wall from the playground (definitive removal)
         self._playground.remove(self, definitive=True)
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Returns the state of the wall, with its disappearance countdown."""
+        state = super().snapshot_state()
+        state["disappeared"] = self._disappeared
+        state["creation_timestep"] = self._creation_timestep
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Revert the wall to a state returned by snapshot_state()."""
+        super().restore_state(state)
+        self._disappeared = state["disappeared"]
+        self._creation_timestep = state["creation_timestep"]
+
 
 class DisappearingBox(NormalBox):
     """
@@ -149,3 +162,16 @@ class DisappearingBox(NormalBox):
         # Remove the box from the playground (definitive removal)
         self._playground.remove(self, definitive=True)
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """Returns the state of the box, with its disappearance countdown."""
+        state = super().snapshot_state()
+        state["disappeared"] = self._disappeared
+        state["creation_timestep"] = self._creation_timestep
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Revert the box to a state returned by snapshot_state()."""
+        super().restore_state(state)
+        self._disappeared = state["disappeared"]
+        self._creation_timestep = state["creation_timestep"]
+
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import math
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import arcade
+import numpy as np
 import pymunk
 import pymunk.autogeometry
 from PIL import Image
@@ -78,6 +79,10 @@ class EmbodiedEntity(Entity, ABC):
         # Set collision type for pymunk shapes
         self._set_pm_collision_type()
 
+        # Textures with the uid encoded as a color, by name of the original
+        # texture and color of the uid (see generate_texture_with_id_color)
+        self._id_textures: Dict[Tuple[str, Tuple[int, int, int, int]], arcade.Texture] = {}
+
         # Flags for movement and overlapping
         self._moved = False
         self._allow_overlapping = False
@@ -430,38 +435,38 @@ class EmbodiedEntity(Entity, ABC):
         as a color. This is useful for rendering objects with unique colors for debugging
         or identification purposes.
 
+        The textures are cached by original texture and color of the UID, so
+        that the entity added again to a view, or to a new ID view, reuses
+        its texture.
+
         Args:
             texture (arcade.Texture): The original texture of the entity.
 
         Returns:
             arcade.Texture: A new texture with the UID encoded as a color.
         """
-        # Create a new blank RGBA image with the same size as the input texture
-        img_uid = Image.new("RGBA", texture.size)
-        pixels = img_uid.load()  # Access the pixel data of the new image
-        pixels_texture = texture.image.load()  # Access the pixel data of the original texture
-
-        # Iterate over each pixel in the new image img_uid
-        for i in range(img_uid.size[0]):
-            for j in range(img_uid.size[1]):
-
-                # If the pixel is fully transparent in the original texture,
-                # set the pixel to fully transparent and black in the new image
-                if pixels_texture[i, j][3] == 0:
-                    pixels[i, j] = (0, 0, 0, 0)
-
-                # Else if the pixel is not black in the original texture
-                else:
-                    pixels[i, j] = self.color_uid  # type: ignore
-
-        texture = arcade.Texture(
-            name=str(self._uid),
+        key = (texture.name, self.color_uid)
+        texture_uid = self._id_textures.get(key)
+        if texture_uid is not None:
+            return texture_uid
+
+        # The pixels fully transparent in the original texture stay fully
+        # transparent and black, the others take the color of the UID
+        alpha = np.asarray(texture.image.convert("RGBA").getchannel("A"))
+        pixels = np.zeros(alpha.shape + (4,), dtype=np.uint8)
+        pixels[alpha != 0] = self.color_uid
+        img_uid = Image.fromarray(pixels, "RGBA")
+
+        # The hit box of the sprites of the views is not used (the collisions
+        # are computed by pymunk), so it is not computed from the image
+        texture_uid = arcade.Texture(
+            name=f"{texture.name}_uid_{self._uid}",
             image=img_uid,
-            hit_box_algorithm="Detailed",
-            hit_box_detail=1,
+            hit_box_algorithm="None",
         )
+        self._id_textures[key] = texture_uid
 
-        return texture
+        return texture_uid
 
     @property
     def needs_sprite_update(self) -> bool:
@@ -10,7 +10,7 @@ objects in simple-playgrounds.
 from __future__ import annotations
 
 from abc import ABC
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
 if TYPE_CHECKING:
     from swarm_rescue.simulation.gui_map.playground import Playground
@@ -144,3 +144,24 @@ class Entity(ABC):
         """
         Updates the entity state after pymunk engine steps.
         """
+
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the part of the state of the entity that changes during a
+        round, used by Playground.snapshot().
+
+        Subclasses with such a state extend the returned dict.
+
+        Returns:
+            Dict[str, Any]: State of the entity.
+        """
+        return {}
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the entity to a state returned by snapshot_state(), used by
+        Playground.restore().
+
+        Args:
+            state (Dict[str, Any]): State of the entity.
+        """
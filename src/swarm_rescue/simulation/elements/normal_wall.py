@@ -1,6 +1,6 @@
 import math
 import random
-from typing import Tuple
+from typing import List, Tuple
 
 import arcade
 import numpy as np
@@ -11,6 +11,10 @@ from swarm_rescue.resources import path_resources
 from swarm_rescue.simulation.elements.physical_element import PhysicalElement
 from swarm_rescue.simulation.utils.definitions import CollisionTypes
 
+# A wall as (pos_start, pos_end, wall_thickness), as given to ColorWall: the
+# wall extends by wall_thickness / 2 beyond its start and end positions
+WallSegment = Tuple[Tuple[float, float], Tuple[float, float], float]
+
 
 class ColorWall(PhysicalElement):
     """
@@ -53,6 +57,9 @@ class ColorWall(PhysicalElement):
         angle = (pymunk.Vec2d(*pos_end) - pos_start).angle
 
         self.wall_coordinates = (position.x, position.y), angle
+        self.wall_segment: WallSegment = ((float(pos_start[0]), float(pos_start[1])),
+                                          (float(pos_end[0]), float(pos_end[1])),
+                                          wall_thickness)
 
         if color is not None:
             img = Image.new("RGBA",
@@ -199,3 +206,252 @@ class NormalBox(ColorWall):
                          wall_thickness=int(wall_thickness),
                          file_name=filename,
                          **kwargs)
+
+
+def _wall_rectangle(segment: WallSegment) -> Tuple[float, float, float, float, float]:
+    """
+    Returns the rectangle covered by a wall, in the frame of its direction.
+
+    Args:
+        segment (WallSegment): The wall.
+
+    Returns:
+        Tuple[float, float, float, float, float]: The angle of the direction
+        of the wall in [0, pi), the interval (along_min, along_max) covered
+        along this direction, and the interval (across_min, across_max)
+        covered along its normal.
+    """
+    pos_start, pos_end, wall_thickness = segment
+    angle = math.atan2(pos_end[1] - pos_start[1], pos_end[0] - pos_start[0]) % math.pi
+    if math.isclose(angle, math.pi):
+        angle = 0.0
+
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    along = sorted(x * cos_a + y * sin_a for x, y in (pos_start, pos_end))
+    across = -pos_start[0] * sin_a + pos_start[1] * cos_a
+    half = wall_thickness / 2
+
+    return angle, along[0] - half, along[1] + half, across - half, across + half
+
+
+def _rectangle_to_wall(angle: float, along_min: float, along_max: float,
+                       across_min: float, across_max: float) -> WallSegment:
+    """
+    Returns the wall covering a rectangle, along the longest side of the
+    rectangle.
+
+    Args:
+        angle (float): Angle of the direction of the rectangle.
+        along_min (float): Start of the rectangle along the direction.
+        along_max (float): End of the rectangle along the direction.
+        across_min (float): Start of the rectangle along the normal.
+        across_max (float): End of the rectangle along the normal.
+    """
+    if across_max - across_min > along_max - along_min:
+        # The wall goes along the normal of the direction
+        angle += math.pi / 2
+        along_min, along_max, across_min, across_max = (
+            across_min, across_max, -along_max, -along_min)
+
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    half = (across_max - across_min) / 2
+    across = (across_min + across_max) / 2
+
+    def to_position(along: float) -> Tuple[float, float]:
+        return along * cos_a - across * sin_a, along * sin_a + across * cos_a
+
+    return (to_position(along_min + half), to_position(along_max - half),
+            across_max - across_min)
+
+
+def merge_wall_segments(segments: List[WallSegment],
+                        tolerance: float = 1e-6) -> List[WallSegment]:
+    """
+    Merge the walls that cover a single rectangle together: the collinear
+    walls of the same thickness that overlap or touch end to end, and the
+    parallel walls of the same extent that overlap or touch side by side
+    (as the walls 2 and 3 of walls_final_2024_25_02.py, 4 pixels apart). The
+    area covered by the walls is unchanged.
+
+    Args:
+        segments (List[WallSegment]): The walls.
+        tolerance (float): Tolerance on the positions compared.
+
+    Returns:
+        List[WallSegment]: The merged walls.
+    """
+    # Walls grouped by direction, as rectangles [along_min, along_max,
+    # across_min, across_max] in the frame of the direction
+    directions: dict = {}
+    for segment in segments:
+        angle, *rectangle = _wall_rectangle(segment)
+        directions.setdefault(round(angle, 6), (angle, []))[1].append(rectangle)
+
+    merged_segments = []
+    for angle, rectangles in directions.values():
+        merged = True
+        while merged:
+            merged = False
+            for i, first in enumerate(rectangles):
+                for j in range(len(rectangles) - 1, i, -1):
+                    second = rectangles[j]
+                    # Pairs of intervals (along, across) that should be the
+                    # same, and that should overlap or touch
+                    for same, joined in ((slice(2, 4), slice(0, 2)), (slice(0, 2), slice(2, 4))):
+                        if (abs(first[same][0] - second[same][0]) <= tolerance
+                                and abs(first[same][1] - second[same][1]) <= tolerance
+                                and first[joined][0] <= second[joined][1] + tolerance
+                                and second[joined][0] <= first[joined][1] + tolerance):
+                            first[joined] = [min(first[joined][0], second[joined][0]),
+                                             max(first[joined][1], second[joined][1])]
+                            del rectangles[j]
+                            merged = True
+                            break
+
+        merged_segments += [_rectangle_to_wall(angle, *rectangle) for rectangle in rectangles]
+
+    return merged_segments
+
+
+class StaticWalls(PhysicalElement):
+    """
+    The StaticWalls class is a subclass of the PhysicalElement class. It
+    represents a set of walls that never move as a single element: one static
+    pymunk body with one rectangular pymunk.Poly shape per wall, and one
+    sprite. It is created by ClosedPlayground.merge_walls() when a map is
+    loaded, in place of the NormalWall and NormalBox elements of the map.
+
+    The adjacent and collinear walls are merged first (see
+    merge_wall_segments()). Each shape covers the rectangle of its wall, as
+    the shape of a ColorWall.
+
+    Example Usage
+        # Creating the two walls of a corner
+        walls = StaticWalls(segments=[((0, 0), (100, 0), 6), ((0, 0), (0, 100), 6)])
+        playground.add(walls, walls.wall_coordinates)
+    """
+
+    def __init__(self, segments: List[WallSegment], **kwargs):
+        """
+        Initialize a StaticWalls.
+
+        Args:
+            segments (List[WallSegment]): The walls, as (pos_start, pos_end,
+                wall_thickness), see ColorWall.
+            **kwargs: Additional keyword arguments.
+        """
+        if not segments:
+            raise ValueError("At least one wall should be provided")
+
+        self.wall_segments = merge_wall_segments(segments)
+
+        corners = np.array([corner for segment in self.wall_segments
+                            for corner in self._get_corners(segment)])
+        self._bottom_left = corners.min(axis=0)
+        self._top_right = corners.max(axis=0)
+        center = (self._bottom_left + self._top_right) / 2
+
+        self.wall_coordinates = (float(center[0]), float(center[1])), 0
+
+        super().__init__(texture=self._get_walls_texture(), **kwargs)
+
+        # Same physical properties as ColorWall
+        for pm_shape in self._pm_shapes:
+            pm_shape.elasticity = 0.5
+            pm_shape.friction = 0.9
+
+    @staticmethod
+    def _get_corners(segment: WallSegment) -> np.ndarray:
+        """
+        Returns the corners of the rectangle covered by a wall.
+
+        Args:
+            segment (WallSegment): The wall.
+        """
+        angle, along_min, along_max, across_min, across_max = _wall_rectangle(segment)
+        direction = np.array([math.cos(angle), math.sin(angle)])
+        normal = np.array([-direction[1], direction[0]])
+
+        return np.array([along * direction + across * normal
+                         for along in (along_min, along_max)
+                         for across in (across_min, across_max)])
+
+    def _get_walls_texture(self) -> arcade.Texture:
+        """
+        Returns the texture of all the walls: the stone texture of NormalWall,
+        cropped and rotated for each wall, in an image of the bounding box of
+        the walls.
+        """
+        stone_img = Image.open(path_resources + "/stone_texture_g_04.png").convert("RGBA")
+
+        size = np.ceil(self._top_right - self._bottom_left).astype(int)
+        img = Image.new("RGBA", (int(size[0]), int(size[1])))
+
+        for segment in self.wall_segments:
+            pos_start, pos_end, wall_thickness = segment
+            length = math.dist(pos_start, pos_end) + wall_thickness
+            angle = math.atan2(pos_end[1] - pos_start[1], pos_end[0] - pos_start[0])
+
+            wall_img = self._crop_stone(stone_img, round(length), round(wall_thickness))
+            wall_img = wall_img.rotate(math.degrees(angle), resample=Image.Resampling.NEAREST,
+                                       expand=True)
+
+            # Center of the wall in the image, whose y axis goes down
+            center_x = (pos_start[0] + pos_end[0]) / 2 - self._bottom_left[0]
+            center_y = self._top_right[1] - (pos_start[1] + pos_end[1]) / 2
+            img.alpha_composite(wall_img, (round(center_x - wall_img.width / 2),
+                                           round(center_y - wall_img.height / 2)))
+
+        return arcade.Texture(
+            name=f"StaticWalls_{hash(tuple(self.wall_segments))}",
+            image=img,
+            hit_box_algorithm="None",
+        )
+
+    @staticmethod
+    def _crop_stone(stone_img: Image.Image, length: int, wall_thickness: int) -> Image.Image:
+        """
+        Returns a random crop of the stone texture, tiled if the wall is
+        longer than the texture.
+
+        Args:
+            stone_img (Image.Image): The stone texture.
+            length (int): Length of the crop.
+            wall_thickness (int): Height of the crop.
+        """
+        w_img, h_img = stone_img.size
+        wall_img = Image.new("RGBA", (length, wall_thickness))
+
+        for x_wall in range(0, length, w_img - 1):
+            width = min(length - x_wall, w_img - 1)
+            x = random.randint(0, w_img - width - 1)
+            y = random.randint(0, h_img - wall_thickness - 1)
+            wall_img.paste(stone_img.crop((x, y, x + width, y + wall_thickness)), (x_wall, 0))
+
+        return wall_img
+
+    def _get_pm_shapes_from_sprite(self, shape_approximation):
+        """
+        Returns the rectangular pymunk.Poly shapes of the walls, in the frame
+        of the body, whose position is the center of the walls.
+
+        Args:
+            shape_approximation: Unused, the shapes are given by the walls.
+        """
+        center = np.array(self.wall_coordinates[0])
+
+        pm_shapes = []
+        for segment in self.wall_segments:
+            # Corners in counterclockwise order
+            corners = self._get_corners(segment)[[0, 2, 3, 1]] - center
+            pm_shapes.append(pymunk.Poly(self._pm_body,
+                                         [pymunk.Vec2d(float(x), float(y)) for x, y in corners]))
+
+        return pm_shapes
+
+    @property
+    def _collision_type(self):
+        """
+        Returns the collision type for the walls.
+        """
+        return CollisionTypes.WALL
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Optional
+from typing import Optional, Dict, Any, Union
 
 import pymunk
 
 from swarm_rescue.simulation.elements.embodied import EmbodiedEntity
+from swarm_rescue.simulation.utils.position import Coordinate, CoordinateSampler
 
 
 class PhysicalEntity(EmbodiedEntity, ABC):
@@ -58,6 +59,56 @@ class PhysicalEntity(EmbodiedEntity, ABC):
         """
         return self._moved or self.movable
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the entity, with the state of its body if it is
+        movable. Static bodies never move during a round.
+        """
+        state = super().snapshot_state()
+        if self.movable:
+            body = self._pm_body
+            state["pm_body"] = (body.position, body.angle,
+                                body.velocity, body.angular_velocity)
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the entity, and the state of its body, to a state returned by
+        snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the entity.
+        """
+        super().restore_state(state)
+        if "pm_body" in state:
+            body = self._pm_body
+            (body.position, body.angle,
+             body.velocity, body.angular_velocity) = state["pm_body"]
+            if body.space:
+                body.space.reindex_shapes_for_body(body)
+            self._moved = True
+
+    def move_to(
+            self,
+            coordinates: Union[Coordinate, CoordinateSampler],
+            allow_overlapping: bool = True,
+            check_within: bool = False,
+    ) -> None:
+        """
+        Moves the entity to the specified coordinates. The views drawing the
+        entities that cannot move in a static layer draw it again.
+
+        Args:
+            coordinates (Union[Coordinate, CoordinateSampler]): Target coordinates.
+            allow_overlapping (bool): Whether overlapping is allowed.
+            check_within (bool): Whether to check if the entity is within bounds.
+        """
+        super().move_to(coordinates, allow_overlapping, check_within)
+
+        if not self.movable:
+            for view in self._playground._views:
+                view.invalidate_static_layer()
+
     ########################
     # BODY AND SHAPE
     ########################
@@ -1,4 +1,4 @@
-from typing import Optional, Tuple, Set
+from typing import Any, Dict, Optional, Tuple, Set
 
 import arcade
 import pymunk
@@ -134,6 +134,24 @@ class ReturnArea(InteractiveZone, SceneElement):
         self.clear()
         super().pre_step()
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the return area, with the drones inside.
+        """
+        state = super().snapshot_state()
+        state["drone_inside_set"] = set(self.drone_inside_set)
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the return area to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the return area.
+        """
+        super().restore_state(state)
+        self.drone_inside_set = set(state["drone_inside_set"])
+
     def compute_total_health_returned(self) -> int:
         """
         Compute the total health of all drones inside the return area.
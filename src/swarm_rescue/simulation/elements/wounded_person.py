@@ -1,5 +1,5 @@
 import math
-from typing import Tuple
+from typing import Any, Dict, Tuple
 
 import numpy as np
 import pymunk
@@ -129,6 +129,29 @@ class WoundedPerson(PhysicalElement):
         self.pose = Pose(np.asarray(self.true_position()), self.true_angle())
         self.compute_movement()
 
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the wounded person, with its progress along its
+        path.
+        """
+        state = super().snapshot_state()
+        state["reverse"] = self.reverse
+        state["goal_index"] = self.goal_index
+        state["pose"] = self.pose
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the wounded person to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the wounded person.
+        """
+        super().restore_state(state)
+        self.reverse = state["reverse"]
+        self.goal_index = state["goal_index"]
+        self.pose = state["pose"]
+
     def compute_movement(self) -> None:
         """
         Compute and apply movement forces based on the current path.
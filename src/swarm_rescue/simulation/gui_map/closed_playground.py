@@ -1,11 +1,11 @@
 import platform
-from typing import Tuple
+from typing import Optional, Tuple
 
 from swarm_rescue.simulation.drone.agent import Agent
 from swarm_rescue.simulation.drone.drone_abstract import (drone_collision_wall,
                                                           drone_collision_drone)
 from swarm_rescue.simulation.elements.embodied import EmbodiedEntity
-from swarm_rescue.simulation.elements.normal_wall import NormalWall
+from swarm_rescue.simulation.elements.normal_wall import NormalWall, NormalBox, StaticWalls
 from swarm_rescue.simulation.elements.rescue_center import wounded_rescue_center_collision
 from swarm_rescue.simulation.elements.return_area import return_area_collision
 from swarm_rescue.simulation.elements.sensor_disablers import disabler_zone_disables_device
@@ -35,13 +35,19 @@ class ClosedPlayground(Playground):
         _height: The height of the playground.
     """
 
-    def __init__(self, size: Tuple[int, int], border_thickness: int = 6):
+    def __init__(self, size: Tuple[int, int], border_thickness: int = 6,
+                 ray_backend: Optional[str] = None, ray_zoom: float = 1):
         """
         Initialize the ClosedPlayground.
 
         Args:
             size (Tuple[int, int]): Size of the playground (width, height).
             border_thickness (int): Thickness of the border walls.
+            ray_backend (Optional[str]): Backend of the ray sensors, see
+                Playground. By default, the platform decides between the
+                compute shader and the CPU.
+            ray_zoom (float): Zoom factor of the ID view of the ray sensors,
+                see Playground.
         """
         background = (220, 220, 220)
         use_shaders = True
@@ -51,7 +57,9 @@ class ClosedPlayground(Playground):
         super().__init__(size=size,
                          seed=None,
                          background=background,
-                         use_shaders=use_shaders)
+                         use_shaders=use_shaders,
+                         ray_backend=ray_backend,
+                         ray_zoom=ray_zoom)
 
         assert isinstance(self.size[0], int)
         assert isinstance(self.size[1], int)
@@ -82,6 +90,33 @@ class ClosedPlayground(Playground):
                               wall_thickness=border_thickness)
             self.add(wall, wall.wall_coordinates)
 
+    def merge_walls(self) -> Optional[StaticWalls]:
+        """
+        Replace the walls and boxes of the playground by a single StaticWalls
+        element, once all the walls of a map are added. The adjacent and
+        collinear walls are merged, and the walls are seen by pymunk as the
+        rectangles of one static body and drawn as one sprite in the views.
+
+        The subclasses of NormalWall and NormalBox, as the disappearing walls,
+        are removed during a round and stay separate elements.
+
+        Returns:
+            Optional[StaticWalls]: The element of the walls, None if there is
+            no wall to merge.
+        """
+        walls = [element for element in self._elements
+                 if type(element) in (NormalWall, NormalBox) and not element.removed]
+        if not walls:
+            return None
+
+        for wall in walls:
+            self.remove(wall, definitive=True)
+
+        static_walls = StaticWalls(segments=[wall.wall_segment for wall in walls])
+        self.add(static_walls, static_walls.wall_coordinates)
+
+        return static_walls
+
     def _handle_interactions(self) -> None:
         """
         Set up collision interactions for the playground.
@@ -16,6 +16,7 @@ from swarm_rescue.simulation.reporting.screen_recorder import ScreenRecorder
 from swarm_rescue.simulation.utils.constants import FRAME_RATE, DRONE_INITIAL_HEALTH, ENABLE_WINDOW_AUTO_RESIZE
 from swarm_rescue.simulation.utils.fps_display import FpsDisplay
 from swarm_rescue.simulation.utils.mouse_measure import MouseMeasure
+from swarm_rescue.simulation.utils.step_profiler import NO_PROFILING, StepProfiler
 from swarm_rescue.simulation.utils.visu_noises import VisuNoises
 from swarm_rescue.simulation.utils.window_utils import auto_resize_window
 
@@ -91,6 +92,7 @@ class GuiSR(TopDownView):
             enable_visu_noises: bool = False,
             filename_video_capture: str = None,
             headless: bool = False,
+            profiler: Optional[StepProfiler] = None,
     ) -> None:
         """
         Initialize the GuiSR graphical user interface.
@@ -114,6 +116,10 @@ class GuiSR(TopDownView):
             use_mouse_measure (bool): Enable mouse measurement tool.
             enable_visu_noises (bool): Enable visualization of sensor noises.
             filename_video_capture (str): Output filename for video capture.
+            headless (bool): Hide the window.
+            profiler (Optional[StepProfiler]): If given, the time spent in
+                each phase of the steps and in the code of each drone is
+                accumulated in this profiler.
         """
         # Handle automatic window resizing
         size, zoom = self._handle_window_auto_resize(the_map, size, zoom, headless)
@@ -198,6 +204,9 @@ class GuiSR(TopDownView):
         self._last_image = None
         self._terminate = False
 
+        self._profiler = profiler
+        self._playground.profiler = profiler
+
         self.fps_display = FpsDisplay(period_display=2)
         self._keyboardController = KeyboardController()
         self._mouse_measure = MouseMeasure(playground_size=the_map.playground.size)
@@ -260,7 +269,8 @@ class GuiSR(TopDownView):
             # self._the_map.explored_map.display()
             return
 
-        self._the_map.explored_map.update_drones(self._drones)
+        with self._profile("explored_map"):
+            self._the_map.explored_map.update_drones(self._drones)
         # self._the_map.explored_map._process_positions()
         # self._the_map.explored_map.display()
 
@@ -271,7 +281,8 @@ class GuiSR(TopDownView):
         for i in range(self._number_drones):
             self._drones[i].elapsed_walltime = self._elapsed_walltime
             self._drones[i].elapsed_timestep = self._elapsed_timestep
-            command = self._drones[i].control()
+            with self._profile("control", self._drones[i].identifier):
+                command = self._drones[i].control()
             if self._use_keyboard and i == 0:
                 command = self._keyboardController.control()
 
@@ -335,7 +346,8 @@ class GuiSR(TopDownView):
 
         # Capture the frame
         # Au bon endroit ? Il faudrait le mettre avant le draw() ?
-        self.recorder.capture_frame(self)
+        with self._profile("frame_capture"):
+            self.recorder.capture_frame(self)
 
         self.fps_display.update(display=False)
 
@@ -532,10 +544,25 @@ class GuiSR(TopDownView):
         """
         messages: AllSentMessagesDict = {}
         for i in range(self._number_drones):
-            msg_data = drones[i].define_message_for_all()
+            with self._profile("define_message_for_all", drones[i].identifier):
+                msg_data = drones[i].define_message_for_all()
             messages[drones[i]] = {drones[i].communicator: (None, msg_data)}
         return messages
 
+    def _profile(self, name: str, drone_id: Optional[int] = None):
+        """
+        Returns the context manager measuring a phase of the update, or a
+        context manager doing nothing if the profiling is disabled.
+
+        Args:
+            name (str): Name of the phase.
+            drone_id (Optional[int]): Identifier of the drone, for the code
+                of a drone solution.
+        """
+        if self._profiler is None:
+            return NO_PROFILING
+        return self._profiler.phase(name, drone_id)
+
     def compute_health_stats(self) -> None:
         """
         Compute statistics about drone health and destruction.
@@ -563,6 +590,16 @@ class GuiSR(TopDownView):
         """
         return self._last_image
 
+    @property
+    def profiler(self) -> Optional[StepProfiler]:
+        """
+        Returns the profiler of the round, if the profiling is enabled.
+
+        Returns:
+            Optional[StepProfiler]: The profiler.
+        """
+        return self._profiler
+
     @property
     def percent_drones_destroyed(self) -> float:
         """
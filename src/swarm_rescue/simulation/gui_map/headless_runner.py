@@ -0,0 +1,63 @@
+from swarm_rescue.simulation.gui_map.gui_sr import GuiSR
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.utils.constants import FRAME_RATE
+
+
+class HeadlessRunner(GuiSR):
+    """
+    The HeadlessRunner class runs a round as fast as the CPU allows.
+
+    GuiSR hands control to the arcade event loop, so a round is paced by the
+    pyglet clock (FRAME_RATE) and the window is redrawn at every frame, even
+    in headless mode. HeadlessRunner instead calls the same on_update() method
+    in a tight Python loop. The sequence of messages, controls and playground
+    steps is therefore identical to GuiSR, and so are the results exposed by
+    the properties (elapsed_timestep, rescued_number, last_image, ...), only
+    the elapsed walltime is shorter.
+
+    Nothing is drawn in the window unless 'render' is True. The video capture
+    and the last image of the playground do not depend on the window and
+    still work.
+    """
+
+    def __init__(
+            self,
+            the_map: MapAbstract,
+            filename_video_capture: str = None,
+            render: bool = False,
+            **kwargs,
+    ) -> None:
+        """
+        Initialize the HeadlessRunner.
+
+        Args:
+            the_map (MapAbstract): The map object containing the playground and drones.
+            filename_video_capture (str): Output filename for video capture.
+            render (bool): If True, the window is shown and redrawn after each
+                step, without any frame rate limitation.
+            **kwargs: Other arguments passed to GuiSR (draw options, ...).
+        """
+        super().__init__(the_map=the_map,
+                         filename_video_capture=filename_video_capture,
+                         headless=not render,
+                         **kwargs)
+        self._render = render
+
+    def run(self) -> None:
+        """
+        Step the simulation until the end of the round.
+
+        This function is blocking until the round is finished, like GuiSR.run().
+        """
+        window = self._playground.window
+        while True:
+            # on_update() finalizes the round (stats, last image, closing of
+            # the window) during the call where self._terminate is set.
+            self.on_update(FRAME_RATE)
+            if self._terminate:
+                break
+
+            if self._render:
+                window.dispatch_events()
+                self.on_draw()
+                window.flip()
@@ -13,7 +13,7 @@ Examples can be found in :
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import arcade
 import matplotlib.pyplot as plt
@@ -22,8 +22,9 @@ import pymunk
 import pymunk.matplotlib_util
 
 from swarm_rescue.simulation.drone.agent import Agent
+from swarm_rescue.simulation.drone.communication_graph import CommunicationGraph
 from swarm_rescue.simulation.drone.communicator import Communicator, Message
-from swarm_rescue.simulation.drone.controller import CommandsDict
+from swarm_rescue.simulation.drone.controller import BatchedCommands, CommandsDict
 from swarm_rescue.simulation.drone.drone_part import DronePart
 from swarm_rescue.simulation.drone.interactive_anchored import InteractiveAnchored
 from swarm_rescue.simulation.ray_sensors.ray_compute import RayCompute
@@ -39,6 +40,7 @@ from swarm_rescue.simulation.utils.definitions import (
     CollisionTypes,
 )
 from swarm_rescue.simulation.utils.position import Coordinate
+from swarm_rescue.simulation.utils.step_profiler import NO_PROFILING, StepProfiler
 
 # pylint: disable=unused-argument
 # pylint: disable=line-too-long
@@ -52,6 +54,50 @@ ReceivedMessagesDict = Dict[Agent, Dict[Communicator, Tuple[Communicator, Messag
 RewardsDict = Dict[Agent, float]
 
 
+class PlaygroundSnapshot:
+    """
+    State of a Playground at a given timestep, returned by
+    Playground.snapshot() and used by Playground.restore().
+
+    A snapshot keeps references to the entities of the playground, so it can
+    only be restored in the playground it comes from.
+
+    Attributes:
+        timestep (int): Timestep of the playground.
+        rng_state (dict): State of the random number generator of the playground.
+        np_random_state (tuple): State of the global numpy random generator,
+            used by the noise models of the sensors.
+        entities_states (Dict[int, Dict[str, Any]]): State of each entity,
+            indexed by uid.
+        removed (Dict[int, bool]): Whether each entity was removed, indexed by uid.
+    """
+
+    def __init__(self, playground: Playground):
+        """
+        Take a snapshot of the playground.
+
+        Args:
+            playground (Playground): The playground to take the snapshot of.
+        """
+        self.timestep = playground.timestep
+        self.rng_state = playground.rng.bit_generator.state
+        self.np_random_state = np.random.get_state()
+
+        # pylint: disable=protected-access
+        self.uids_to_entities = dict(playground._uids_to_entities)
+        self.shapes_to_entities = dict(playground._shapes_to_entities)
+        self.name_to_agents = dict(playground._name_to_agents)
+        self.name_to_elements = dict(playground._name_to_elements)
+        self.agents = list(playground._agents)
+        self.elements = list(playground._elements)
+
+        self.entities_states: Dict[int, Dict[str, Any]] = {}
+        self.removed: Dict[int, bool] = {}
+        for uid, entity in self.uids_to_entities.items():
+            self.entities_states[uid] = entity.snapshot_state()
+            self.removed[uid] = entity.removed
+
+
 class Playground:
     """Playground is a Base Class that manages the physical simulation.
 
@@ -78,6 +124,8 @@ class Playground:
                 Union[Tuple[int, int, int], List[int], Tuple[int, int, int, int]]
             ] = None,
             use_shaders: bool = True,
+            ray_backend: Optional[str] = None,
+            ray_zoom: float = 1,
     ):
         """
         Initialize the Playground.
@@ -87,6 +135,11 @@ class Playground:
             seed (Optional[int]): Seed for the random number generator.
             background (Optional[Tuple[int, int, int] or List[int] or Tuple[int, int, int, int]]): Background color.
             use_shaders (bool): Whether to use shaders for rendering.
+            ray_backend (Optional[str]): Backend of the ray sensors, one of
+                RayCompute.BACKENDS. By default, 'shader' if use_shaders is
+                True, else 'cpu'.
+            ray_zoom (float): Zoom factor of the ID view of the ray sensors,
+                see ray_zoom.
         """
 
         # Random number generator for replication, rewind, etc.
@@ -121,8 +174,16 @@ class Playground:
         # Mappings
         self._shapes_to_entities: Dict[pymunk.Shape, EmbodiedEntity] = {}
         self._name_to_agents: Dict[str, Agent] = {}
+        self._name_to_elements: Dict[str, SceneElement] = {}
         self._uids_to_entities: Dict[int, Entity] = {}
 
+        # Semantic type and grasped flag of the entities, in arrays sorted by
+        # uid and rebuilt when entities are added or removed
+        self._uid_table_keys = np.zeros(0, dtype=np.int64)
+        self._uid_table_types = np.zeros(0, dtype=np.int8)
+        self._uid_table_grasped = np.zeros(0, dtype=bool)
+        self._uid_table_needs_update = True
+
         self._handle_interactions()
         self._views = []
 
@@ -131,7 +192,23 @@ class Playground:
         self._window.ctx.blend_func = self._window.ctx.ONE, self._window.ctx.ZERO
 
         self._ray_compute = None
-        self._use_shaders = use_shaders
+        if ray_backend is None:
+            ray_backend = "shader" if use_shaders else "cpu"
+        if ray_backend not in RayCompute.BACKENDS:
+            raise ValueError(f"Unknown ray backend '{ray_backend}', "
+                             f"expected one of {RayCompute.BACKENDS}")
+        self._ray_backend = ray_backend
+
+        if ray_zoom <= 0:
+            raise ValueError("The zoom of the ray sensors should be positive")
+        self._ray_zoom = ray_zoom
+
+        # Communicators in range of each other, computed once for all the
+        # communicators in the phases of the step where they need it
+        self._communication_graph = CommunicationGraph(self)
+
+        # Optional measure of the time spent in each phase of the step
+        self._profiler: Optional[StepProfiler] = None
 
     def debug_draw(self, plt_width: int = 10, center: Optional[Tuple[float, float]] = None, size: Optional[Tuple[int, int]] = None) -> None:
         """
@@ -195,11 +272,103 @@ class Playground:
         if not self._ray_compute:
             assert self._size
             self._ray_compute = RayCompute(
-                self, self._size, self._center, zoom=1, use_shader=self._use_shaders
+                self, self._size, self._center, zoom=self._ray_zoom, backend=self._ray_backend
             )
 
         return self._ray_compute
 
+    @property
+    def communication_graph(self) -> CommunicationGraph:
+        """
+        Returns the graph of the communicators in range of each other.
+
+        Returns:
+            CommunicationGraph: The CommunicationGraph instance.
+        """
+        return self._communication_graph
+
+    @property
+    def ray_zoom(self) -> float:
+        """
+        Returns the zoom factor of the ID view sampled by the ray sensors.
+
+        With a zoom below 1, the ID view of a large map is smaller, so it is
+        faster to draw and to read back. The rays still sample the same
+        number of points (n_points of the sensors), which do not depend on
+        the zoom. A pixel of the ID view then covers 1 / zoom units of the
+        playground, so the distances of the ray sensors are rounded to about
+        1 / zoom, and entities thinner than 1 / zoom can be missed.
+
+        Returns:
+            float: The zoom factor, 1 by default.
+        """
+        return self._ray_zoom
+
+    @ray_zoom.setter
+    def ray_zoom(self, ray_zoom: float) -> None:
+        """
+        Set the zoom factor of the ID view of the ray sensors, even after the
+        sensors have been added.
+
+        Args:
+            ray_zoom (float): Zoom factor, positive.
+        """
+        if ray_zoom <= 0:
+            raise ValueError("The zoom of the ray sensors should be positive")
+        self._ray_zoom = ray_zoom
+        if self._ray_compute:
+            self._ray_compute.zoom = ray_zoom
+
+    @property
+    def use_shaders(self) -> bool:
+        """
+        Returns whether the ray sensors are computed with a compute shader,
+        instead of the CPU.
+
+        Returns:
+            bool: True if the compute shader is used.
+        """
+        return self._ray_backend == "shader"
+
+    @use_shaders.setter
+    def use_shaders(self, use_shaders: bool) -> None:
+        """
+        Switch the computation of the ray sensors between the compute shader
+        and the CPU, even after the sensors have been added.
+
+        Args:
+            use_shaders (bool): Whether to use the compute shader.
+        """
+        self.ray_backend = "shader" if use_shaders else "cpu"
+
+    @property
+    def ray_backend(self) -> str:
+        """
+        Returns the backend of the ray sensors: 'shader' (compute shader),
+        'cpu' (sampling of the ID view with numpy) or 'geometric'
+        (intersection of the rays with the shapes, nothing is rendered).
+
+        Returns:
+            str: The backend.
+        """
+        return self._ray_backend
+
+    @ray_backend.setter
+    def ray_backend(self, ray_backend: str) -> None:
+        """
+        Switch the backend of the ray sensors, even after the sensors have
+        been added.
+
+        Args:
+            ray_backend (str): One of RayCompute.BACKENDS.
+        """
+        if ray_backend not in RayCompute.BACKENDS:
+            raise ValueError(f"Unknown ray backend '{ray_backend}', "
+                             f"expected one of {RayCompute.BACKENDS}")
+        self._ray_backend = ray_backend
+        if self._ray_compute:
+            self._ray_compute.backend = ray_backend
+
     @property
     def background(self):
         """
@@ -244,6 +413,39 @@ class Playground:
         """
         return self._timestep
 
+    @property
+    def profiler(self) -> Optional[StepProfiler]:
+        """
+        Returns the profiler measuring the phases of the step, if any.
+
+        Returns:
+            Optional[StepProfiler]: The profiler.
+        """
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler: Optional[StepProfiler]) -> None:
+        """
+        Set the profiler measuring the phases of the step, or None to disable
+        the profiling.
+
+        Args:
+            profiler (Optional[StepProfiler]): The profiler.
+        """
+        self._profiler = profiler
+
+    def _profile(self, name: str):
+        """
+        Returns the context manager measuring a phase of the step, or a
+        context manager doing nothing if the profiling is disabled.
+
+        Args:
+            name (str): Name of the phase.
+        """
+        if self._profiler is None:
+            return NO_PROFILING
+        return self._profiler.phase(name)
+
     #################
     # Pymunk space
     #################
@@ -304,7 +506,8 @@ class Playground:
         if not name:
             name = type(entity).__name__ + "_" + str(uid)
 
-        if name in [ent.name for ent in self.elements]:
+        element = self._name_to_elements.get(name)
+        if element is not None and not element.removed:
             raise ValueError("Entity with this name already in Playground")
 
         return uid, name
@@ -321,6 +524,68 @@ class Playground:
         """
         return self._uids_to_entities[uid]
 
+    def get_entity_types(self, uids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieve the semantic types of entities and whether they are grasped,
+        from their unique identifiers.
+
+        Args:
+            uids (np.ndarray): The unique identifiers.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The values of the TypeEntity of the
+            entities, 0 for an unknown uid, and whether they are grasped.
+        """
+        if self._uid_table_needs_update:
+            self._update_uid_table()
+
+        uids = np.asarray(uids, dtype=np.int64)
+        if len(self._uid_table_keys) == 0:
+            return np.zeros(uids.shape, dtype=np.int8), np.zeros(uids.shape, dtype=bool)
+
+        slots = np.searchsorted(self._uid_table_keys, uids)
+        np.minimum(slots, len(self._uid_table_keys) - 1, out=slots)
+        found = self._uid_table_keys[slots] == uids
+
+        types = np.where(found, self._uid_table_types[slots], 0)
+        grasped = found & self._uid_table_grasped[slots]
+        return types, grasped
+
+    def update_grasped(self, entity: Entity) -> None:
+        """
+        Update whether an entity is grasped in the table of the semantic
+        types, after it is grasped or released.
+
+        Args:
+            entity (Entity): The entity grasped or released.
+        """
+        if self._uid_table_needs_update:
+            return
+
+        # Imported here, the entities of the semantic types import the playground
+        from swarm_rescue.simulation.ray_sensors.entity_type import is_grasped
+
+        slot = np.searchsorted(self._uid_table_keys, entity.uid)
+        if slot < len(self._uid_table_keys) and self._uid_table_keys[slot] == entity.uid:
+            self._uid_table_grasped[slot] = is_grasped(entity)
+
+    def _update_uid_table(self) -> None:
+        """
+        Build the table of the semantic types of the entities, sorted by uid.
+        """
+        # Imported here, the entities of the semantic types import the playground
+        from swarm_rescue.simulation.ray_sensors.entity_type import get_type_entity, is_grasped
+
+        uids = sorted(self._uids_to_entities)
+        entities = [self._uids_to_entities[uid] for uid in uids]
+
+        self._uid_table_keys = np.array(uids, dtype=np.int64)
+        self._uid_table_types = np.array([get_type_entity(entity).value for entity in entities],
+                                         dtype=np.int8)
+        self._uid_table_grasped = np.array([is_grasped(entity) for entity in entities],
+                                           dtype=bool)
+        self._uid_table_needs_update = False
+
     @property
     def agents(self) -> List[Agent]:
         """
@@ -358,6 +623,7 @@ class Playground:
             all_commands: Optional[AllCommandsDict] = None,
             all_messages: Optional[AllSentMessagesDict] = None,
             pymunk_steps: int = PYMUNK_STEPS,
+            batched_commands: Optional[BatchedCommands] = None,
     ):
         """
         Update the Playground.
@@ -369,6 +635,8 @@ class Playground:
             all_commands (Optional[AllCommandsDict]): All commands for agents.
             all_messages (Optional[AllSentMessagesDict]): All messages for communicators.
             pymunk_steps (int): Number of steps for the pymunk physics engine to run.
+            batched_commands (Optional[BatchedCommands]): Commands for the
+                controllers, as one array, written after all_commands.
 
         Returns:
             tuple: (messages, rewards)
@@ -381,24 +649,36 @@ class Playground:
             of pymunk_steps.
 
         """
-        mess, rew = None, None
+        with self._profile(StepProfiler.STEP):
+            mess, rew = None, None
 
-        self._pre_step()
+            # The lazy sensors not read during their last update, and which
+            # keep their values at this step, observe the playground before
+            # the physics
+            if self._ray_compute:
+                self._ray_compute.compute_pending_sensors(kept_only=True)
 
-        self._apply_commands(all_commands)
+            with self._profile("pre_step"):
+                self._pre_step()
 
-        for _ in range(pymunk_steps):
-            self.space.step(1.0 / pymunk_steps)
+            with self._profile("apply_commands"):
+                self._apply_commands(all_commands, batched_commands)
 
-        self._compute_observations()
+            with self._profile("physics"):
+                for _ in range(pymunk_steps):
+                    self.space.step(1.0 / pymunk_steps)
+
+            self._compute_observations()
 
-        self._post_step()
+            with self._profile("post_step"):
+                self._post_step()
 
-        rew = {agent: agent.reward for agent in self._agents}
-        if all_messages:
-            mess = self._transmit_messages(all_messages)
+            rew = {agent: agent.reward for agent in self._agents}
+            if all_messages:
+                with self._profile("transmit_messages"):
+                    mess = self._transmit_messages(all_messages)
 
-        self._timestep += 1
+            self._timestep += 1
 
         return mess, rew
 
@@ -409,8 +689,11 @@ class Playground:
         for element in self.elements:
             element.pre_step()
 
+        # The communicators update their communicators in range
+        self._communication_graph.enable()
         for agent in self.agents:
             agent.pre_step()
+        self._communication_graph.disable()
 
     def _post_step(self) -> None:
         """
@@ -422,19 +705,28 @@ class Playground:
         for agent in self.agents:
             agent.post_step()
 
-    def _apply_commands(self, all_commands: Optional[Dict[Agent, CommandsDict]] = None) -> None:
+    def _apply_commands(
+            self,
+            all_commands: Optional[Dict[Agent, CommandsDict]] = None,
+            batched_commands: Optional[BatchedCommands] = None,
+    ) -> None:
         """
         Apply commands to all agents.
 
         Args:
             all_commands (Optional[Dict[Agent, CommandsDict]]): Commands for agents.
+            batched_commands (Optional[BatchedCommands]): Commands for the
+                controllers, as one array.
         """
-        if not all_commands:
+        if not all_commands and batched_commands is None:
             return
 
-        for agent, commands_dict in all_commands.items():
+        for agent, commands_dict in (all_commands or {}).items():
             agent.receive_commands(commands_dict)
 
+        if batched_commands is not None:
+            batched_commands.write()
+
         for agent in self._agents:
             agent.apply_commands()
 
@@ -449,6 +741,12 @@ class Playground:
             dict: Received messages.
         """
         msgs = {agent: {} for agent in self.agents}
+        # Messages received by the agent of each communicator
+        msgs_of_comms = {comm: msgs[agent] for agent in self.agents for comm in agent.communicators}
+
+        # The communicators receive the messages from the communicators in
+        # range after the physics step
+        self._communication_graph.enable()
 
         all_sent_messages = [
             (agent, comm_source, target)
@@ -481,15 +779,29 @@ class Playground:
                     msgs[comm_target.agent][comm_target] = (comm_source, received_msg)
 
             elif comm_target is None:
-                for agent2 in self.agents:
-                    for comm in agent2.communicators:
-                        received_msg = comm.receive(comm_source, msg)
-                        if received_msg:
-                            msgs[comm.agent][comm] = (comm_source, received_msg)
+                # The message is delivered to the communicators in range of
+                # the source in the communication graph, in the order of the
+                # agents, all sharing the same received message
+                comms_in_range = self._communication_graph.comms_in_range(comm_source)
+
+                if comms_in_range is not None:
+                    received = (comm_source, msg)
+                    for comm in comms_in_range:
+                        if comm.receive_in_range(comm_source, msg):
+                            msgs_of_comms[comm][comm] = received
+
+                else:
+                    for agent2 in self.agents:
+                        for comm in agent2.communicators:
+                            received_msg = comm.receive(comm_source, msg)
+                            if received_msg:
+                                msgs[comm.agent][comm] = (comm_source, received_msg)
 
             else:
                 raise ValueError
 
+        self._communication_graph.disable()
+
         return msgs
 
     def _compute_observations(self) -> None:
@@ -500,10 +812,12 @@ class Playground:
             dict: Observations for each agent.
         """
         if self._ray_compute:
-            self._ray_compute.update_sensors()
+            with self._profile("ray_compute"):
+                self._ray_compute.update_sensors()
 
-        for agent in self.agents:
-            agent.compute_observations()
+        with self._profile("observations"):
+            for agent in self.agents:
+                agent.compute_observations()
 
     def reset(self):
         """
@@ -549,6 +863,66 @@ class Playground:
 
         self._compute_observations()
 
+    def snapshot(self) -> PlaygroundSnapshot:
+        """
+        Take a snapshot of the current state of the playground: positions and
+        velocities of the bodies, entities present or removed, grasped wounded
+        persons, health of the drones, states of the random generators, ...
+
+        Returns:
+            PlaygroundSnapshot: The snapshot, to be given to restore().
+        """
+        return PlaygroundSnapshot(self)
+
+    def restore(self, snapshot: PlaygroundSnapshot) -> None:
+        """
+        Revert the playground to the state of a snapshot taken with snapshot().
+        Restoring is much faster than building the map again, and the same
+        snapshot can be restored several times.
+
+        The contact cache of the physics engine is not part of the snapshot,
+        so steps following a restore can slightly differ from the steps that
+        followed the snapshot when bodies are in contact.
+
+        Args:
+            snapshot (PlaygroundSnapshot): The snapshot to restore.
+        """
+        # Entities added since the snapshot leave the playground
+        for entity in self._agents + self._elements:
+            if entity.uid not in snapshot.entities_states:
+                self.remove(entity, definitive=True)
+
+        self._uids_to_entities = dict(snapshot.uids_to_entities)
+        self._uid_table_needs_update = True
+        self._shapes_to_entities = dict(snapshot.shapes_to_entities)
+        self._name_to_agents = dict(snapshot.name_to_agents)
+        self._name_to_elements = dict(snapshot.name_to_elements)
+        self._agents = list(snapshot.agents)
+        self._elements = list(snapshot.elements)
+        self._agents_cache_needs_update = True
+        self._elements_cache_needs_update = True
+
+        # Entities removed since the snapshot come back, the others are removed
+        for entity in self._agents + self._elements:
+            was_removed = snapshot.removed[entity.uid]
+            if was_removed and not entity.removed:
+                self.remove(entity)
+            elif not was_removed and entity.removed:
+                self.add(entity, from_removed=True)
+
+        for uid, entity in self._uids_to_entities.items():
+            entity.restore_state(snapshot.entities_states[uid])
+
+        self._timestep = snapshot.timestep
+        self._rng.bit_generator.state = snapshot.rng_state
+        np.random.set_state(snapshot.np_random_state)
+
+        for view in self._views:
+            view.update_and_draw_in_framebuffer(force=True)
+
+        if self._ray_compute:
+            self._ray_compute.invalidate()
+
 
     def add(
             self,
@@ -566,6 +940,7 @@ class Playground:
             allow_overlapping (bool): Whether to allow overlapping.
             from_removed (bool): Whether the entity is being re-added from removed.
         """
+        self._compute_pending_sensors()
 
         entity.playground = self
 
@@ -577,6 +952,10 @@ class Playground:
 
         if not from_removed:
             self._add_to_mappings(entity)
+        elif isinstance(entity, SceneElement):
+            # The name was freed while the element was removed, and maybe
+            # dropped from the index by an element removed for good since
+            self._name_to_elements[entity.name] = entity
 
         self._add_to_views(entity)
 
@@ -660,6 +1039,7 @@ class Playground:
         entity.uid, entity.name = self._get_identifier(entity)
 
         self._uids_to_entities[entity.uid] = entity
+        self._uid_table_needs_update = True
 
         if isinstance(entity, Agent):
             self._agents.append(entity)
@@ -668,6 +1048,7 @@ class Playground:
 
         elif isinstance(entity, SceneElement):
             self._elements.append(entity)
+            self._name_to_elements[entity.name] = entity
             self._elements_cache_needs_update = True
 
         if isinstance(entity, EmbodiedEntity):
@@ -695,6 +1076,8 @@ class Playground:
             entity: The entity to remove.
             definitive (bool): Whether to remove definitively.
         """
+        self._compute_pending_sensors()
+
         if not entity.removed:
             self._remove_from_space(entity)
             self._remove_from_views(entity)
@@ -719,6 +1102,15 @@ class Playground:
 
         entity.removed = True
 
+    def _compute_pending_sensors(self) -> None:
+        """
+        Compute the values of the lazy sensors not read yet during the step,
+        before an entity is added or removed, so that they observe the
+        playground of the step as the eager sensors (see Sensor.lazy).
+        """
+        if self._ray_compute:
+            self._ray_compute.compute_pending_sensors()
+
     def _remove_from_space(self, entity):
         """
         Remove the entity from the pymunk space.
@@ -745,6 +1137,7 @@ class Playground:
             return
 
         self._uids_to_entities.pop(entity.uid)
+        self._uid_table_needs_update = True
 
         if isinstance(entity, Agent):
             if entity in self._agents:
@@ -760,11 +1153,17 @@ class Playground:
                 self._elements.remove(entity)
                 self._elements_cache_needs_update = True
 
+            if self._name_to_elements.get(entity.name) is entity:
+                self._name_to_elements.pop(entity.name)
+
         if not isinstance(entity, Agent):
             for pm_shape in entity.pm_shapes:
                 if pm_shape in self._shapes_to_entities:
                     self._shapes_to_entities.pop(pm_shape)
 
+            if self._ray_compute:
+                self._ray_compute.forget_shapes(entity.pm_shapes)
+
         entity.playground = None
 
     def _remove_from_views(self, entity):
@@ -801,6 +1200,15 @@ class Playground:
 
         self._views.append(view)
 
+    def remove_view(self, view) -> None:
+        """
+        Remove a view from the playground, which does not update it anymore.
+
+        Args:
+            view: The view to remove.
+        """
+        self._views.remove(view)
+
     def within_playground(
             self,
             entity: Optional[Union[Agent, EmbodiedEntity]] = None,
@@ -946,7 +1354,9 @@ class Playground:
         # Clear all mappings
         self._shapes_to_entities.clear()
         self._name_to_agents.clear()
+        self._name_to_elements.clear()
         self._uids_to_entities.clear()
+        self._uid_table_needs_update = True
 
         # Clear views
         self._views.clear()
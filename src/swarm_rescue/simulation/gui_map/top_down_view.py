@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
 
 import arcade
 import matplotlib.pyplot as plt
@@ -30,6 +30,7 @@ class TopDownView:
             draw_transparent: bool = True,
             draw_interactive: bool = True,
             draw_zone: bool = True,
+            static_layer: bool = False,
     ) -> None:
         """
         Initialize the TopDownView.
@@ -43,6 +44,10 @@ class TopDownView:
             draw_transparent (bool): Whether to draw transparent sprites.
             draw_interactive (bool): Whether to draw interactive sprites.
             draw_zone (bool): Whether to draw zone sprites.
+            static_layer (bool): Whether to draw the visible entities that
+                cannot move (walls, rescue centers, ...) once in a separate
+                layer, copied in the view before drawing the other sprites.
+                The static entities are then drawn below the other sprites.
         """
         self._center = center
 
@@ -67,6 +72,15 @@ class TopDownView:
 
         self._sprites: Dict[EmbodiedEntity, arcade.Sprite] = {}
 
+        # Static layer: sprites of the entities that cannot move, drawn in
+        # their own framebuffer only when one of them is added, removed or
+        # moved
+        self._static_layer = static_layer
+        self._static_sprites = arcade.SpriteList()
+        self._static_entities: Set[EmbodiedEntity] = set()
+        self._dynamic_sprites: Dict[EmbodiedEntity, arcade.Sprite] = {}
+        self._static_layer_needs_update = True
+
         self._background = playground.background
 
         self._playground = playground
@@ -85,6 +99,18 @@ class TopDownView:
             ]
         )
 
+        self._static_fbo = None
+        if self._static_layer:
+            self._static_fbo = self._ctx.framebuffer(
+                color_attachments=[
+                    self._ctx.texture(
+                        size,
+                        components=4,
+                        filter=(self._ctx.NEAREST, self._ctx.NEAREST),
+                    ),
+                ]
+            )
+
         playground.add_view(self)
 
     @property
@@ -177,6 +203,11 @@ class TopDownView:
                 if self._draw_transparent:
                     self._transparent_sprites.append(sprite)
 
+            elif self._static_layer and not entity.movable:
+                self._static_sprites.append(sprite)
+                self._static_entities.add(entity)
+                self._static_layer_needs_update = True
+
             else:
                 self._visible_sprites.append(sprite)
 
@@ -185,6 +216,8 @@ class TopDownView:
 
         entity.update_sprite(self, sprite)
         self._sprites[entity] = sprite
+        if entity not in self._static_entities:
+            self._dynamic_sprites[entity] = sprite
 
     def remove_as_sprite(self, entity) -> None:
         """
@@ -200,6 +233,7 @@ class TopDownView:
             return
 
         sprite = self._sprites.pop(entity)
+        self._dynamic_sprites.pop(entity, None)
 
         if isinstance(entity, InteractiveAnchored):
             self._interactive_sprites.remove(sprite)
@@ -211,22 +245,60 @@ class TopDownView:
             if entity.transparent:
                 self._transparent_sprites.remove(sprite)
 
+            elif entity in self._static_entities:
+                self._static_sprites.remove(sprite)
+                self._static_entities.remove(entity)
+                self._static_layer_needs_update = True
+
             else:
                 self._visible_sprites.remove(sprite)
 
+    def invalidate_static_layer(self) -> None:
+        """
+        Request to draw the static layer again at the next update, after a
+        static entity was moved.
+        """
+        self._static_layer_needs_update = True
+
     def update_sprites_position(self, force: bool = False) -> None:
         """
         Update the sprites position and angle of the entities in the view from
         the pymunk position and angle.
 
+        The sprites of the static layer are only updated when the layer is
+        drawn again.
+
         Args:
-            force (bool): If True, force update all sprites.
+            force (bool): If True, force update all sprites, and draw the
+                static layer again.
         """
-        # check that
-        for entity, sprite in self._sprites.items():
+        if force:
+            self._static_layer_needs_update = True
+
+        sprites = self._dynamic_sprites if self._static_layer else self._sprites
+        for entity, sprite in sprites.items():
             if entity.needs_sprite_update or force:
                 entity.update_sprite(self, sprite)
 
+    def _draw_static_layer(self) -> None:
+        """
+        Draw the sprites of the static entities in the framebuffer of the
+        static layer.
+        """
+        for entity in self._static_entities:
+            entity.update_sprite(self, self._sprites[entity])
+
+        with self._static_fbo.activate() as fbo:
+            if self._use_color_uid:
+                fbo.clear()
+            else:
+                fbo.clear(self._background)
+
+            self._ctx.projection_2d = 0, self._width, 0, self._height
+            self._static_sprites.draw(pixelated=True)
+
+        self._static_layer_needs_update = False
+
     def update_and_draw_in_framebuffer(self, force: bool = False) -> None:
         """
         Update and draw all sprites in the framebuffer.
@@ -242,10 +314,15 @@ class TopDownView:
         # Update the sprites' positions and angles
         self.update_sprites_position(force)
 
+        if self._static_layer and self._static_layer_needs_update:
+            self._draw_static_layer()
+
         # Activate the framebuffer for drawing
         with self._fbo.activate() as fbo:
-            # Clear the framebuffer
-            if self._use_color_uid:
+            if self._static_layer:
+                # Start from the static layer instead of an empty framebuffer
+                self._ctx.copy_framebuffer(self._static_fbo, fbo)
+            elif self._use_color_uid:
                 fbo.clear()  # Clear without background if displaying UIDs
             else:
                 fbo.clear(self._background)  # Clear with the background color
@@ -280,6 +357,21 @@ class TopDownView:
         )
         return img
 
+    def get_np_ids(self) -> np.ndarray:
+        """
+        Get the uids of the entities drawn in the framebuffer of a view using
+        color uids, decoded from the colors of the pixels.
+
+        Returns:
+            np.ndarray: The (height, width) array of uids, 0 where no entity
+            is drawn.
+        """
+        img = np.frombuffer(self._fbo.read(components=4), dtype=np.dtype("<u4")).reshape(
+            self._height, self._width
+        )
+        # The uid is encoded in the red, green and blue bytes, ignore the alpha
+        return img & 0xFFFFFF
+
     def draw_matplotlib(self) -> None:
         """
         Draw the image from the framebuffer using matplotlib.
@@ -297,3 +389,7 @@ class TopDownView:
         self._interactive_sprites.clear()
         self._zone_sprites.clear()
         self._visible_sprites.clear()
+        self._static_sprites.clear()
+        self._static_entities.clear()
+        self._dynamic_sprites.clear()
+        self._static_layer_needs_update = True
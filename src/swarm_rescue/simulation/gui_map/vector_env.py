@@ -0,0 +1,430 @@
+import gc
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import arcade
+import numpy as np
+
+from swarm_rescue.simulation.drone.controller import BatchedCommands
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.utils.constants import RESOLUTION_LIDAR_SENSOR, RESOLUTION_SEMANTIC_SENSOR
+
+MapFactory = Callable[[], MapAbstract]
+Observations = Dict[str, np.ndarray]
+
+# Order of the commands in the last dimension of the command arrays.
+COMMAND_NAMES: Tuple[str, ...] = ("forward", "lateral", "rotation", "grasper")
+
+# Shape of the observation of one drone, for each observation name.
+OBSERVATION_SHAPES: Dict[str, Tuple[int, ...]] = {
+    "lidar": (RESOLUTION_LIDAR_SENSOR,),
+    # For each ray: distance, angle, entity type (value of
+    # DroneSemanticSensor.TypeEntity, 0 if nothing detected) and grasped.
+    "semantic": (RESOLUTION_SEMANTIC_SENSOR, 4),
+    "gps": (2,),
+    "compass": (),
+    "odometer": (3,),
+}
+
+
+class MapRunner:
+    """
+    The MapRunner class steps one map with array commands and returns its
+    observations as arrays. It is used by VectorEnv, in the main process or in
+    a worker process.
+
+    The map is built by calling 'map_factory'. The commands are written in
+    the controllers of the drones as one array (see BatchedCommands), and the
+    observations are written in preallocated arrays, where missing values
+    (disabled sensor, destroyed drone, no detection) are NaN. The semantic
+    sensors of the drones give structured arrays, written at the index of
+    their rays.
+    """
+
+    def __init__(self, map_factory: MapFactory):
+        """
+        Initialize the MapRunner.
+
+        Args:
+            map_factory (MapFactory): Callable without argument returning a new map.
+        """
+        self._map_factory = map_factory
+        self._the_map: Optional[MapAbstract] = None
+        self._drones: List[DroneAbstract] = []
+        self._semantic_ray_angles = np.full(RESOLUTION_SEMANTIC_SENSOR, np.nan)
+        self._batched_commands: Optional[BatchedCommands] = None
+        self._observations: Observations = {}
+        self._alive = np.zeros(0, dtype=bool)
+        self._rewards = np.zeros(0)
+
+    @property
+    def number_drones(self) -> int:
+        """
+        Returns the number of drones of the map.
+        """
+        return len(self._drones)
+
+    @property
+    def the_map(self) -> Optional[MapAbstract]:
+        """
+        Returns the map currently run.
+        """
+        return self._the_map
+
+    def reset(self) -> Tuple[Observations, np.ndarray, np.ndarray, bool]:
+        """
+        Build a new map and compute its first observations.
+
+        Returns:
+            Tuple: observations, alive mask, rewards and done flag.
+        """
+        self.close()
+        self._the_map = self._map_factory()
+        self._drones = list(self._the_map.drones)
+        number_drones = len(self._drones)
+
+        if self._drones:
+            self._semantic_ray_angles = np.asarray(self._drones[0].semantic().ray_angles)
+        for drone in self._drones:
+            drone.semantic().structured_output = True
+
+        # The columns of the controllers follow COMMAND_NAMES
+        self._batched_commands = BatchedCommands(
+            [[drone.base.forward_controller,
+              drone.base.lateral_controller,
+              drone.base.angular_vel_controller,
+              drone.grasper.grasp_controller]
+             for drone in self._drones])
+
+        self._observations = {name: np.full((number_drones,) + shape, np.nan)
+                              for name, shape in OBSERVATION_SHAPES.items()}
+        self._alive = np.ones(number_drones, dtype=bool)
+        self._rewards = np.zeros(number_drones)
+
+        self._use_context()
+        self._the_map.playground.step()
+        return self._gather()
+
+    def step(self, commands: np.ndarray) -> Tuple[Observations, np.ndarray, np.ndarray, bool]:
+        """
+        Apply the commands of all the drones and step the map.
+
+        Args:
+            commands (np.ndarray): Commands of shape (number_drones, 4), in the
+                order of COMMAND_NAMES.
+
+        Returns:
+            Tuple: observations, alive mask, rewards and done flag.
+        """
+        playground = self._the_map.playground
+        commands = np.asarray(commands, dtype=float)[:len(self._drones)]
+        batched = self._batched_commands.commands
+        np.clip(commands[:, :3], -1.0, 1.0, out=batched[:, :3])
+        batched[:, 3] = commands[:, 3] > 0.5
+
+        self._use_context()
+        playground.step(batched_commands=self._batched_commands)
+        return self._gather()
+
+    def close(self) -> None:
+        """
+        Release the resources of the current map.
+        """
+        if self._the_map is None:
+            return
+        playground = self._the_map.playground
+        playground.cleanup()
+        playground.close_window()
+        self._the_map = None
+        # A closed pyglet window closes itself again when it is garbage
+        # collected, which unsets the current arcade window. Collect it now,
+        # rather than while the window of the next map is being created.
+        gc.collect()
+
+    def _use_context(self) -> None:
+        """
+        Make the OpenGL context of the map the current one. Several
+        playgrounds can live in the same process, each one with its window.
+        """
+        window = self._the_map.playground.window
+        window.switch_to()
+        arcade.set_window(window)
+
+    def _gather(self) -> Tuple[Observations, np.ndarray, np.ndarray, bool]:
+        """
+        Write the observations of all the drones in the preallocated arrays.
+
+        Returns:
+            Tuple: observations, alive mask, rewards and done flag.
+        """
+        playground = self._the_map.playground
+        agents = set(playground.agents)
+        obs = self._observations
+
+        self._alive[:] = [drone in agents for drone in self._drones]
+        alive_drones = [drone for drone, alive in zip(self._drones, self._alive) if alive]
+        rows = np.flatnonzero(self._alive)
+        self._rewards[:] = 0.0
+        self._rewards[rows] = [drone.reward for drone in alive_drones]
+
+        for values in obs.values():
+            values[:] = np.nan
+        _write_rows(obs["lidar"], rows, [drone.lidar_values() for drone in alive_drones])
+        _write_rows(obs["gps"], rows, [drone.gps_values() for drone in alive_drones])
+        _write_rows(obs["compass"], rows, [drone.compass_values() for drone in alive_drones])
+        _write_rows(obs["odometer"], rows, [drone.odometer_values() for drone in alive_drones])
+
+        # Each detection is written at the index of its ray, the other rays
+        # of an enabled sensor have a NaN distance and the entity type 0
+        all_detections = [drone.semantic_values() for drone in alive_drones]
+        semantic = obs["semantic"]
+        enabled = [row for row, detections in zip(rows, all_detections) if detections is not None]
+        detections = [detections for detections in all_detections if detections is not None]
+        semantic[enabled, :, 1] = self._semantic_ray_angles
+        semantic[enabled, :, 2:] = 0
+        if detections:
+            detection_rows = np.repeat(enabled, [len(values) for values in detections])
+            detections = np.concatenate(detections)
+            semantic[detection_rows, detections["ray"]] = np.column_stack(
+                (detections["distance"], detections["angle"],
+                 detections["entity_type"], detections["grasped"]))
+
+        max_timestep_limit = self._the_map.max_timestep_limit
+        done = max_timestep_limit is not None and playground.timestep >= max_timestep_limit
+        return obs, self._alive, self._rewards, done
+
+
+def _write_rows(array: np.ndarray, rows: np.ndarray, values: List[Optional[np.ndarray]]) -> None:
+    """
+    Write the values of some drones in the rows of an array of observations,
+    the values being None for a disabled sensor (the row is left as it is).
+
+    Args:
+        array (np.ndarray): Array of the observations of all the drones.
+        rows (np.ndarray): Index of the row of each value.
+        values (List[Optional[np.ndarray]]): Values of the drones.
+    """
+    present = [i for i, value in enumerate(values) if value is not None]
+    if present:
+        array[rows[present]] = np.stack([values[i] for i in present])
+
+
+def _map_runner_worker(pipe: Connection, map_factory: MapFactory) -> None:
+    """
+    Main loop of a worker process of VectorEnv, running one map.
+
+    Args:
+        pipe (Connection): Connection with the main process.
+        map_factory (MapFactory): Callable without argument returning a new map.
+    """
+    runner = MapRunner(map_factory)
+    try:
+        while True:
+            command, data = pipe.recv()
+            if command == "reset":
+                result = runner.reset()
+                pipe.send((runner.number_drones, result))
+            elif command == "step":
+                pipe.send(runner.step(data))
+            elif command == "close":
+                break
+            else:
+                raise ValueError(f"Unknown command '{command}'")
+    finally:
+        runner.close()
+        pipe.close()
+
+
+class VectorEnv:
+    """
+    The VectorEnv class steps K maps in lockstep, with batched commands and
+    stacked observations.
+
+    The commands of all the drones of all the maps are given as one array of
+    shape (K, D, 4), where D is the largest number of drones of the maps and
+    the last dimension follows COMMAND_NAMES. The grasper is activated when its
+    command is greater than 0.5. The observations are returned as a dict of
+    arrays of shape (K, D) + OBSERVATION_SHAPES[name], padded with NaN for the
+    missing drones.
+
+    The maps are run in the current process (each playground has its own
+    OpenGL context), or in one worker process per map if 'use_subprocesses' is
+    True. In this case, the map factories must be picklable (a map class, or a
+    functools.partial of a map class, for instance).
+
+    Messages between drones are not transmitted: the drones are controlled
+    from outside, by the commands given to step().
+
+    Example:
+        env = VectorEnv([MapIntermediate01] * 8)
+        obs = env.reset()
+        commands = np.zeros((env.num_envs, env.max_drones, 4))
+        obs, rewards, dones = env.step(commands)
+        env.close()
+    """
+
+    def __init__(self, map_factories: Sequence[MapFactory], use_subprocesses: bool = False):
+        """
+        Initialize the VectorEnv. The maps are built by reset().
+
+        Args:
+            map_factories (Sequence[MapFactory]): One callable without argument
+                returning a new map, for each environment.
+            use_subprocesses (bool): Run each map in its own worker process.
+        """
+        if not map_factories:
+            raise ValueError("VectorEnv needs at least one map factory.")
+
+        self._map_factories = list(map_factories)
+        self._use_subprocesses = use_subprocesses
+        self._runners: List[MapRunner] = []
+        self._pipes: List[Connection] = []
+        self._processes = []
+        self._numbers_drones = [0] * len(self._map_factories)
+        self._observations: Observations = {}
+        self._alive = np.zeros((len(self._map_factories), 0), dtype=bool)
+        self._rewards = np.zeros((len(self._map_factories), 0))
+        self._dones = np.zeros(len(self._map_factories), dtype=bool)
+
+        if self._use_subprocesses:
+            context = multiprocessing.get_context("spawn")
+            for map_factory in self._map_factories:
+                parent_pipe, child_pipe = context.Pipe()
+                process = context.Process(target=_map_runner_worker,
+                                          args=(child_pipe, map_factory),
+                                          daemon=True)
+                process.start()
+                child_pipe.close()
+                self._pipes.append(parent_pipe)
+                self._processes.append(process)
+        else:
+            self._runners = [MapRunner(map_factory) for map_factory in self._map_factories]
+
+    @property
+    def num_envs(self) -> int:
+        """
+        Returns the number of environments K.
+        """
+        return len(self._map_factories)
+
+    @property
+    def max_drones(self) -> int:
+        """
+        Returns the largest number of drones of the maps, D. Known after reset().
+        """
+        return max(self._numbers_drones)
+
+    @property
+    def numbers_drones(self) -> List[int]:
+        """
+        Returns the number of drones of each map. Known after reset().
+        """
+        return list(self._numbers_drones)
+
+    @property
+    def alive(self) -> np.ndarray:
+        """
+        Returns the boolean mask of shape (K, D) of the drones still in their
+        playground (not destroyed and not padding).
+        """
+        return self._alive
+
+    @property
+    def maps(self) -> List[MapAbstract]:
+        """
+        Returns the maps, only available when they run in the current process.
+        """
+        if self._use_subprocesses:
+            raise ValueError("The maps run in worker processes and are not available.")
+        return [runner.the_map for runner in self._runners]
+
+    def reset(self) -> Observations:
+        """
+        Build new maps and return their first observations.
+
+        Returns:
+            Observations: Dict of arrays of shape (K, D) + OBSERVATION_SHAPES[name].
+        """
+        if self._use_subprocesses:
+            for pipe in self._pipes:
+                pipe.send(("reset", None))
+            replies = [pipe.recv() for pipe in self._pipes]
+            self._numbers_drones = [number_drones for number_drones, _ in replies]
+            results = [result for _, result in replies]
+        else:
+            results = [runner.reset() for runner in self._runners]
+            self._numbers_drones = [runner.number_drones for runner in self._runners]
+
+        shape = (self.num_envs, self.max_drones)
+        self._observations = {name: np.full(shape + obs_shape, np.nan)
+                              for name, obs_shape in OBSERVATION_SHAPES.items()}
+        self._alive = np.zeros(shape, dtype=bool)
+        self._rewards = np.zeros(shape)
+        self._dones = np.zeros(self.num_envs, dtype=bool)
+
+        self._stack(results)
+        return self._observations
+
+    def step(self, commands: np.ndarray) -> Tuple[Observations, np.ndarray, np.ndarray]:
+        """
+        Apply the commands to all the drones and step all the maps once.
+
+        Args:
+            commands (np.ndarray): Commands of shape (K, D, 4).
+
+        Returns:
+            Tuple: observations (dict of arrays of shape (K, D) + OBSERVATION_SHAPES[name]),
+            rewards of shape (K, D) and done flags of shape (K,). A map is done
+            when its max timestep limit is reached.
+        """
+        commands = np.asarray(commands, dtype=float)
+        expected_shape = (self.num_envs, self.max_drones, len(COMMAND_NAMES))
+        if commands.shape != expected_shape:
+            raise ValueError(f"Invalid shape of commands: {commands.shape}, expected {expected_shape}.")
+
+        if self._use_subprocesses:
+            for pipe, env_commands in zip(self._pipes, commands):
+                pipe.send(("step", env_commands))
+            results = [pipe.recv() for pipe in self._pipes]
+        else:
+            results = [runner.step(env_commands)
+                       for runner, env_commands in zip(self._runners, commands)]
+
+        self._stack(results)
+        return self._observations, self._rewards, self._dones
+
+    def close(self) -> None:
+        """
+        Release all the maps and stop the worker processes.
+        """
+        for runner in self._runners:
+            runner.close()
+        self._runners = []
+
+        for pipe in self._pipes:
+            try:
+                pipe.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+            pipe.close()
+        for process in self._processes:
+            process.join(timeout=5)
+        self._pipes = []
+        self._processes = []
+
+    def _stack(self, results) -> None:
+        """
+        Copy the results of each map in the stacked arrays.
+
+        Args:
+            results: List of (observations, alive, rewards, done) of each map.
+        """
+        for k, (obs, alive, rewards, done) in enumerate(results):
+            number_drones = self._numbers_drones[k]
+            for name, values in obs.items():
+                self._observations[name][k, :number_drones] = values
+            self._alive[k, :number_drones] = alive
+            self._rewards[k, :number_drones] = rewards
+            self._dones[k] = done
@@ -55,6 +55,7 @@ class DistanceSensor(RaySensor):
         """
         Draws the distance sensor rays using Arcade.
         """
+        self._compute_pending_values()
         if self._disabled:
             return
         view_xy = self._hitpoints[:, :2]
@@ -62,6 +62,7 @@ class DroneDistanceSensor(DistanceSensor):
         Returns:
             np.ndarray or None: Sensor values or None if disabled.
         """
+        self._compute_pending_values()
         if not self._disabled:
             return self._values
         else:
@@ -80,12 +81,13 @@ class DroneDistanceSensor(DistanceSensor):
         """
         Applies noise to the sensor values.
         """
-        self._values = self._noise_model.add_noise(self._values)
+        self._values = self._noise_model.add_noise(self._values, self._random)
 
     def draw(self) -> None:
         """
         Draws the rays of lidar sensor.
         """
+        self._compute_pending_values()
         if self._hitpoints is not None:
             super().draw()
 
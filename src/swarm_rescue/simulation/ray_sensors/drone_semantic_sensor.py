@@ -2,7 +2,6 @@ import math
 import os
 import sys
 from collections import namedtuple
-from enum import Enum, auto
 from typing import Union
 
 import arcade
@@ -11,8 +10,8 @@ import numpy as np
 from swarm_rescue.simulation.drone.agent import Agent
 from swarm_rescue.simulation.drone.drone_base import DroneBase
 from swarm_rescue.simulation.ray_sensors.distance_sensor import compute_ray_angles
+from swarm_rescue.simulation.ray_sensors.entity_type import TypeEntity
 from swarm_rescue.simulation.ray_sensors.semantic_sensor import SemanticSensor
-from swarm_rescue.simulation.elements.normal_wall import NormalWall, NormalBox
 from swarm_rescue.simulation.elements.rescue_center import RescueCenter
 from swarm_rescue.simulation.elements.wounded_person import WoundedPerson
 from swarm_rescue.simulation.gui_map.playground import Playground
@@ -30,22 +29,21 @@ class DroneSemanticSensor(SemanticSensor):
     - range (maximum range of the sensor): 200 pix
     """
 
-    # noinspection PyArgumentList
-    class TypeEntity(Enum):
-        """
-        Type of the entity detected.
-        """
-        WALL = auto()
-        WOUNDED_PERSON = auto()
-        RESCUE_CENTER = auto()
-        DRONE = auto()
-        OTHER = auto()
+    TypeEntity = TypeEntity
 
     Data = namedtuple("Data",
                       "distance angle entity_type grasped")
 
+    # Type of the structured array of the detections, the entity type being
+    # the value of a TypeEntity and the ray the index of the ray in ray_angles
+    DTYPE = np.dtype([("distance", np.float64),
+                      ("angle", np.float64),
+                      ("entity_type", np.int8),
+                      ("grasped", np.bool_),
+                      ("ray", np.int16)])
+
     def __init__(self, playground: Playground, noise: bool = True,
-                 invisible_elements=None, **kwargs):
+                 invisible_elements=None, structured_output: bool = False, **kwargs):
         """
         Initialize the DroneSemanticSensor.
 
@@ -53,6 +51,8 @@ class DroneSemanticSensor(SemanticSensor):
             playground (Playground): The playground environment.
             noise (bool): Whether to apply noise.
             invisible_elements: Elements invisible to the sensor.
+            structured_output (bool): Whether the values are a numpy
+                structured array of DTYPE instead of a list of Data.
             **kwargs: Additional keyword arguments.
         """
         super().__init__(normalize=False,
@@ -85,6 +85,35 @@ class DroneSemanticSensor(SemanticSensor):
                               grasped=False)
         self._null_sensor = [null_data] * self.resolution
 
+        self._null_structured_sensor = np.zeros(self.resolution, dtype=self.DTYPE)
+        self._null_structured_sensor["distance"] = np.nan
+        self._null_structured_sensor["angle"] = np.nan
+        self._null_structured_sensor["ray"] = np.arange(self.resolution)
+
+        self._structured_output = structured_output
+
+        self._values = self._default_value
+
+    @property
+    def structured_output(self) -> bool:
+        """
+        Returns whether the values are a numpy structured array instead of a
+        list of Data.
+        """
+        return self._structured_output
+
+    @structured_output.setter
+    def structured_output(self, structured_output: bool) -> None:
+        """
+        Choose between a list of Data namedtuples and a numpy structured
+        array of DTYPE, with one row per detection, for the values of the
+        sensor. The values are the default ones until the next update.
+
+        Args:
+            structured_output (bool): Whether the values are a numpy
+                structured array.
+        """
+        self._structured_output = structured_output
         self._values = self._default_value
 
     def _compute_raw_sensor(self, *_) -> None:
@@ -98,49 +127,25 @@ class DroneSemanticSensor(SemanticSensor):
         # distances is the second column of self._values
         distances = self._values[:, 1]
 
-        new_values = []
-
-        for index, id_detection in enumerate(id_detections):
-            if id_detection == 0:
-                continue
-            try:
-                entity = self._playground.get_entity_from_uid(id_detection)
-            except KeyError:
-                # Skip invalid entity IDs (e.g., background colors in xvfb)
-                continue
-
-            if isinstance(entity, NormalWall):
-                entity_type = self.TypeEntity.WALL
-            elif isinstance(entity, NormalBox):
-                entity_type = self.TypeEntity.WALL
-            elif isinstance(entity, WoundedPerson):
-                entity_type = self.TypeEntity.WOUNDED_PERSON
-            elif isinstance(entity, RescueCenter):
-                entity_type = self.TypeEntity.RESCUE_CENTER
-            elif isinstance(entity, Agent) or isinstance(entity, DroneBase):
-                entity_type = self.TypeEntity.DRONE
-            else:
-                entity_type = self.TypeEntity.OTHER
-                # print(__file__, type(entity))
-
-            grasped = False
-            if (hasattr(entity, 'graspable') and
-                    entity.graspable and
-                    entity.grasped_by):
-                grasped = True
-
-            distance = distances[index]
-            angle = self.ray_angles[index]
-
-            # We remove the walls, so that it is not too easy
-            if entity_type == self.TypeEntity.WALL:
-                continue
-
-            new_detection = self.Data(distance=distance,
-                                      angle=angle,
-                                      entity_type=entity_type,
-                                      grasped=grasped)
-            new_values.append(new_detection)
+        # Unknown ids (e.g., background colors in xvfb) have the type 0.
+        # We remove the walls, so that it is not too easy
+        types, grasped = self._playground.get_entity_types(id_detections)
+        detected = np.flatnonzero((id_detections != 0) & (types != 0)
+                                  & (types != TypeEntity.WALL.value))
+
+        if self._structured_output:
+            new_values = np.empty(len(detected), dtype=self.DTYPE)
+            new_values["distance"] = distances[detected]
+            new_values["angle"] = self.ray_angles[detected]
+            new_values["entity_type"] = types[detected]
+            new_values["grasped"] = grasped[detected]
+            new_values["ray"] = detected
+        else:
+            new_values = [self.Data(distance=distances[index],
+                                    angle=self.ray_angles[index],
+                                    entity_type=TypeEntity(int(types[index])),
+                                    grasped=bool(grasped[index]))
+                          for index in detected]
 
         self._values = new_values
 
@@ -156,13 +161,16 @@ class DroneSemanticSensor(SemanticSensor):
         """
         return math.degrees(self._fov)
 
-    def get_sensor_values(self) -> Union[list, None]:
+    def get_sensor_values(self) -> Union[list, np.ndarray, None]:
         """
         Get values of the semantic sensor.
 
         Returns:
-            list or None: Sensor values or None if disabled.
+            list, np.ndarray or None: Sensor values, a list of Data or a
+            structured array of DTYPE (see structured_output), or None if
+            disabled.
         """
+        self._compute_pending_values()
         if not self._disabled:
             return self._values
         else:
@@ -188,20 +196,21 @@ class DroneSemanticSensor(SemanticSensor):
         """
         Applies noise to the semantic sensor values.
         """
-        for index, data in enumerate(self._values):
-            new_data = self.Data(
-                distance=max(0.0, data.distance +
-                             np.random.normal(self._std_dev_noise)),
-                angle=data.angle,
-                entity_type=data.entity_type,
-                grasped=data.grasped)
+        noise = self._random.normal(self._std_dev_noise, size=len(self._values))
 
-            self._values[index] = new_data
+        if self._structured_output:
+            distances = self._values["distance"]
+            np.maximum(0.0, distances + noise, out=distances)
+            return
+
+        for index, data in enumerate(self._values):
+            self._values[index] = data._replace(distance=max(0.0, data.distance + noise[index]))
 
     def draw(self) -> None:
         """
         Draws the lidar sensor rays.
         """
+        self._compute_pending_values()
         # If hitpoints are defined, call the draw_details method
         if self._hitpoints is not None:
             self.draw_details()
@@ -250,4 +259,6 @@ class DroneSemanticSensor(SemanticSensor):
         """
         Returns the default value for the sensor.
         """
+        if self._structured_output:
+            return self._null_structured_sensor
         return self._null_sensor
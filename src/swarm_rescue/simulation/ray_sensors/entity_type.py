@@ -0,0 +1,58 @@
+"""
+Module defining the types of the entities detected by the semantic sensor.
+"""
+
+from enum import Enum, auto
+
+from swarm_rescue.simulation.drone.agent import Agent
+from swarm_rescue.simulation.drone.drone_base import DroneBase
+from swarm_rescue.simulation.elements.entity import Entity
+from swarm_rescue.simulation.elements.normal_wall import NormalWall, NormalBox, StaticWalls
+from swarm_rescue.simulation.elements.rescue_center import RescueCenter
+from swarm_rescue.simulation.elements.wounded_person import WoundedPerson
+
+
+# noinspection PyArgumentList
+class TypeEntity(Enum):
+    """
+    Type of the entity detected.
+    """
+    WALL = auto()
+    WOUNDED_PERSON = auto()
+    RESCUE_CENTER = auto()
+    DRONE = auto()
+    OTHER = auto()
+
+
+def get_type_entity(entity: Entity) -> TypeEntity:
+    """
+    Returns the type of an entity, as detected by the semantic sensor.
+
+    Args:
+        entity (Entity): The entity.
+
+    Returns:
+        TypeEntity: The type of the entity.
+    """
+    if isinstance(entity, (NormalWall, NormalBox, StaticWalls)):
+        return TypeEntity.WALL
+    if isinstance(entity, WoundedPerson):
+        return TypeEntity.WOUNDED_PERSON
+    if isinstance(entity, RescueCenter):
+        return TypeEntity.RESCUE_CENTER
+    if isinstance(entity, (Agent, DroneBase)):
+        return TypeEntity.DRONE
+    return TypeEntity.OTHER
+
+
+def is_grasped(entity: Entity) -> bool:
+    """
+    Returns whether an entity is grasped by a drone.
+
+    Args:
+        entity (Entity): The entity.
+
+    Returns:
+        bool: True if the entity is graspable and grasped.
+    """
+    return bool(getattr(entity, "graspable", False) and entity.grasped_by)
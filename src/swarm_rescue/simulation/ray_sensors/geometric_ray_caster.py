@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import numpy as np
+import pymunk
+
+from swarm_rescue.simulation.elements.physical_entity import PhysicalEntity
+from swarm_rescue.simulation.ray_sensors.ray_sensor import RaySensor
+
+if TYPE_CHECKING:
+    from swarm_rescue.simulation.gui_map.playground import Playground
+
+
+class GeometricRayCaster:
+    """
+    Computes the hitpoints of the ray sensors by intersecting the rays with
+    the pymunk shapes of the playground, without rendering anything.
+
+    The entities seen by the rays are the ones drawn in the ID view of
+    RayCompute: the non-transparent physical entities (walls, boxes, drone
+    bases, wounded persons, rescue centers, ...). They are seen with their
+    collision shape, instead of the opaque pixels of their sprite. The edges
+    of the polygons and segments and the circles are intersected with all
+    the rays of a sensor at once, with numpy.
+
+    The hitpoints have the same 10 columns as with the other backends, the
+    view coordinates being computed with the parameters of the ID view.
+    """
+
+    def __init__(self, playground: Playground, size, center, zoom):
+        """
+        Initialize the GeometricRayCaster.
+
+        Args:
+            playground (Playground): The playground environment.
+            size: Size of the ID view.
+            center: Center of the ID view.
+            zoom: Zoom factor of the ID view.
+        """
+        self._playground = playground
+        self._width, self._height = size
+        self._center = np.asarray(center, dtype=float)
+        self._zoom = zoom
+
+        # uid of the entity of each shape, 0 if the shape is not seen by rays
+        self._shape_uids: Dict[pymunk.Shape, int] = {}
+
+        # Vertices of the polygons and segments, in the frame of their body
+        self._local_vertices: Dict[pymunk.Shape, np.ndarray] = {}
+
+        # Edges of the shapes of static bodies, with the pose of the body
+        # they were computed for
+        self._static_edges: Dict[pymunk.Shape, Tuple[Tuple[float, float, float], np.ndarray]] = {}
+
+    def forget_shapes(self, shapes: List[pymunk.Shape]) -> None:
+        """
+        Drop the cached geometry of shapes removed for good from the
+        playground, so that the caches do not grow with the entities removed
+        during a round.
+
+        Args:
+            shapes (List[pymunk.Shape]): The shapes.
+        """
+        for shape in shapes:
+            self._shape_uids.pop(shape, None)
+            self._local_vertices.pop(shape, None)
+            self._static_edges.pop(shape, None)
+
+    def _get_uid(self, shape: pymunk.Shape) -> int:
+        """
+        Returns the uid of the entity of a shape, or 0 if the shape is not
+        seen by the rays.
+
+        Args:
+            shape (pymunk.Shape): The shape.
+        """
+        uid = self._shape_uids.get(shape)
+        if uid is None:
+            uid = 0
+            if not shape.sensor:
+                entity = self._playground.get_entity_from_shape(shape)
+                if isinstance(entity, PhysicalEntity) and not entity.transparent:
+                    uid = entity.uid
+            self._shape_uids[shape] = uid
+        return uid
+
+    def _get_edges(self, shape: pymunk.Shape) -> np.ndarray:
+        """
+        Returns the edges of a polygon or a segment in the frame of the
+        environment, as an array of rows (x_start, y_start, x_end, y_end).
+
+        Args:
+            shape (pymunk.Shape): A pymunk.Poly or a pymunk.Segment.
+        """
+        body = shape.body
+        pose = (body.position.x, body.position.y, body.angle)
+
+        is_static = body.body_type == pymunk.Body.STATIC
+        if is_static:
+            cached = self._static_edges.get(shape)
+            if cached is not None and cached[0] == pose:
+                return cached[1]
+
+        local_vertices = self._local_vertices.get(shape)
+        if local_vertices is None:
+            if isinstance(shape, pymunk.Segment):
+                local_vertices = np.array([tuple(shape.a), tuple(shape.b)])
+            else:
+                vertices = [tuple(vertex) for vertex in shape.get_vertices()]
+                local_vertices = np.array(vertices + vertices[:1])
+            self._local_vertices[shape] = local_vertices
+
+        cos_a, sin_a = np.cos(pose[2]), np.sin(pose[2])
+        vertices = local_vertices @ np.array([[cos_a, sin_a], [-sin_a, cos_a]]) + pose[:2]
+        edges = np.hstack((vertices[:-1], vertices[1:]))
+
+        if is_static:
+            self._static_edges[shape] = (pose, edges)
+
+        return edges
+
+    def _collect_shapes(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the geometry seen by the rays.
+
+        Returns:
+            Tuple: The edges (x_start, y_start, x_end, y_end), the uids of
+            their entity and the index of their polygon (-1 for segments),
+            then the circles (x_center, y_center, radius) and the uids of
+            their entity.
+        """
+        edges: List[np.ndarray] = []
+        edge_uids: List[np.ndarray] = []
+        edge_polygons: List[np.ndarray] = []
+        circles: List[Tuple[float, float, float]] = []
+        circle_uids: List[int] = []
+
+        for shape in self._playground.space.shapes:
+            uid = self._get_uid(shape)
+            if not uid:
+                continue
+
+            if isinstance(shape, pymunk.Circle):
+                center = shape.body.local_to_world(shape.offset)
+                circles.append((center.x, center.y, shape.radius))
+                circle_uids.append(uid)
+            else:
+                shape_edges = self._get_edges(shape)
+                polygon = -1 if isinstance(shape, pymunk.Segment) else len(edges)
+                edges.append(shape_edges)
+                edge_uids.append(np.full(len(shape_edges), uid))
+                edge_polygons.append(np.full(len(shape_edges), polygon))
+
+        if edges:
+            all_edges = np.vstack(edges)
+            all_edge_uids = np.concatenate(edge_uids)
+            all_edge_polygons = np.concatenate(edge_polygons)
+        else:
+            all_edges = np.zeros((0, 4))
+            all_edge_uids = np.zeros(0, dtype=int)
+            all_edge_polygons = np.zeros(0, dtype=int)
+
+        return (all_edges, all_edge_uids, all_edge_polygons,
+                np.array(circles, dtype=float).reshape(-1, 3), np.array(circle_uids, dtype=int))
+
+    @staticmethod
+    def _get_uid_at(facing: np.ndarray, edge_uids: np.ndarray, edge_polygons: np.ndarray) -> int:
+        """
+        Returns the uid of a polygon containing a position, or 0.
+
+        The polygons of pymunk are convex and their vertices are in
+        counterclockwise order, so a position is inside a polygon when none
+        of its edges is facing the position.
+
+        Args:
+            facing (np.ndarray): Whether each edge is facing the position,
+                i.e. the position is on the right of the edge.
+            edge_uids (np.ndarray): uids of the entities of the edges.
+            edge_polygons (np.ndarray): Index of the polygon of the edges, -1
+                for segments.
+        """
+        is_polygon = edge_polygons >= 0
+        polygons = edge_polygons[is_polygon]
+        if len(polygons) == 0:
+            return 0
+
+        nb_edges = np.bincount(polygons)
+        nb_edges_facing = np.bincount(polygons, weights=facing[is_polygon], minlength=len(nb_edges))
+        inside = np.flatnonzero((nb_edges > 0) & (nb_edges_facing == 0))
+        if len(inside) == 0:
+            return 0
+
+        return int(edge_uids[is_polygon][np.searchsorted(polygons, inside[0])])
+
+    def update_sensors(self, sensors: List[RaySensor]) -> None:
+        """
+        Update the hitpoints of the sensors.
+
+        Args:
+            sensors (List[RaySensor]): The sensors to update.
+        """
+        edges, edge_uids, edge_polygons, circles, circle_uids = self._collect_shapes()
+
+        edges_min = np.minimum(edges[:, :2], edges[:, 2:])
+        edges_max = np.maximum(edges[:, :2], edges[:, 2:])
+        edges_vectors = edges[:, 2:] - edges[:, :2]
+
+        for sensor in sensors:
+            sensor.update_hitpoints(
+                self._compute_hitpoints(sensor, edges, edges_min, edges_max, edges_vectors,
+                                        edge_uids, edge_polygons, circles, circle_uids))
+
+    def _compute_hitpoints(self, sensor: RaySensor, edges: np.ndarray, edges_min: np.ndarray,
+                           edges_max: np.ndarray, edges_vectors: np.ndarray, edge_uids: np.ndarray,
+                           edge_polygons: np.ndarray, circles: np.ndarray,
+                           circle_uids: np.ndarray) -> np.ndarray:
+        """
+        Returns the hitpoints of one sensor.
+
+        The rays are parametrized by t in [0, 1], from the position of the
+        sensor (t = 0) to the end of the ray at max range (t = 1).
+
+        Args:
+            sensor (RaySensor): The sensor.
+            edges (np.ndarray): Edges of the polygons and segments.
+            edges_min (np.ndarray): Lower corners of the bounding boxes of the edges.
+            edges_max (np.ndarray): Upper corners of the bounding boxes of the edges.
+            edges_vectors (np.ndarray): Vectors from the start to the end of the edges.
+            edge_uids (np.ndarray): uids of the entities of the edges.
+            edge_polygons (np.ndarray): Index of the polygon of the edges, -1
+                for segments.
+            circles (np.ndarray): Centers and radii of the circles.
+            circle_uids (np.ndarray): uids of the entities of the circles.
+
+        Returns:
+            np.ndarray: The hitpoints, one row of 10 columns per ray.
+        """
+        origin = np.array(sensor.position, dtype=float)
+        max_range = sensor.max_range
+        invisible_ids = [sensor.anchor.uid] + sensor.invisible_ids
+
+        # Vectors from the sensor to the end of the rays
+        rays = sensor.end_positions.T
+        nb_rays = len(rays)
+
+        visible_edges = ~np.isin(edge_uids, invisible_ids)
+
+        # Vectors from the sensor to the start of the edges
+        starts = edges[:, :2] - origin
+        facing = edges_vectors[:, 1] * starts[:, 0] - edges_vectors[:, 0] * starts[:, 1] <= 0
+
+        # Only keep the edges close enough to be hit, and for the polygons the
+        # edges facing the sensor, as a ray hits one of them first
+        near = (np.all(edges_max >= origin - max_range, axis=1)
+                & np.all(edges_min <= origin + max_range, axis=1)
+                & visible_edges
+                & (facing | (edge_polygons < 0)))
+
+        # Ray-segment intersection: origin + t * ray = start + u * segment
+        starts = starts[near]
+        segments = edges_vectors[near]
+        denominator = rays[:, :1] * segments[:, 1] - rays[:, 1:] * segments[:, 0]
+        t_numerator = starts[:, 0] * segments[:, 1] - starts[:, 1] * segments[:, 0]
+        u_numerator = rays[:, 1:] * starts[:, 0] - rays[:, :1] * starts[:, 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_edges = t_numerator / denominator
+            u_edges = u_numerator / denominator
+        hit = (denominator != 0) & (t_edges >= 0) & (t_edges <= 1) & (u_edges >= 0) & (u_edges <= 1)
+        t_edges = np.where(hit, t_edges, np.inf)
+
+        # Ray-circle intersection: |origin + t * ray - center| = radius
+        visible_circles = ~np.isin(circle_uids, invisible_ids)
+        near_circles = circles[visible_circles]
+        to_origin = origin - near_circles[:, :2]
+        a = np.sum(rays ** 2, axis=1)[:, np.newaxis]
+        b = 2 * rays @ to_origin.T
+        c = np.sum(to_origin ** 2, axis=1) - near_circles[:, 2] ** 2
+        discriminant = b ** 2 - 4 * a * c
+        with np.errstate(invalid="ignore"):
+            t_circles = (-b - np.sqrt(discriminant)) / (2 * a)
+        t_circles = np.where(c < 0, 0, t_circles)
+        hit = (discriminant >= 0) & (t_circles >= 0) & (t_circles <= 1)
+        t_circles = np.where(hit, t_circles, np.inf)
+
+        t_all = np.hstack((t_edges, t_circles))
+        uids = np.concatenate((edge_uids[near], circle_uids[visible_circles]))
+
+        if t_all.shape[1]:
+            index_first_hit = np.argmin(t_all, axis=1)
+            t_first_hit = t_all[np.arange(nb_rays), index_first_hit]
+            id_first_hit = np.where(np.isfinite(t_first_hit), uids[index_first_hit], 0)
+        else:
+            t_first_hit = np.full(nb_rays, np.inf)
+            id_first_hit = np.zeros(nb_rays, dtype=int)
+
+        # A sensor inside an entity sees it at distance 0 in all directions
+        uid_at_origin = self._get_uid_at(facing[visible_edges], edge_uids[visible_edges],
+                                         edge_polygons[visible_edges])
+        if uid_at_origin:
+            t_first_hit[:] = 0
+            id_first_hit[:] = uid_at_origin
+
+        t_first_hit = np.minimum(t_first_hit, 1)
+        distance = np.where(id_first_hit != 0, t_first_hit * max_range, max_range)
+
+        # Positions of the hitpoints, or of the end of the rays without hit,
+        # the positions on the view being at the scale of the environment
+        abs_env_position = origin + t_first_hit[:, np.newaxis] * rays
+        half_size = np.array((self._width / 2, self._height / 2)) / self._zoom
+        view_position = abs_env_position - self._center + half_size
+        center_on_view = np.broadcast_to(origin - self._center + half_size, (nb_rays, 2))
+
+        return np.hstack(
+            (
+                view_position,
+                abs_env_position,
+                np.zeros((nb_rays, 2)),
+                center_on_view,
+                id_first_hit[:, np.newaxis],
+                distance[:, np.newaxis],
+            )
+        )
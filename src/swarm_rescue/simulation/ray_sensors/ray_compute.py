@@ -1,78 +1,183 @@
 from __future__ import annotations
 
+import math
 from array import array
+from ctypes import memmove
 from os import path
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
 import numpy as np
+from pyglet import gl
 
 from swarm_rescue.simulation.gui_map.top_down_view import TopDownView
+from swarm_rescue.simulation.ray_sensors.geometric_ray_caster import GeometricRayCaster
 from swarm_rescue.simulation.ray_sensors.ray_sensor import RaySensor
+from swarm_rescue.simulation.utils.step_profiler import NO_PROFILING, StepProfiler
 
 if TYPE_CHECKING:
+    import pymunk
+    from arcade.gl import Buffer
     from swarm_rescue.simulation.gui_map.playground import Playground
 
 
+def read_buffer_into(buffer: Buffer, destination: np.ndarray) -> None:
+    """
+    Copy the beginning of an OpenGL buffer into a numpy array, without
+    creating an intermediate bytes object as Buffer.read() does.
+
+    Args:
+        buffer (Buffer): The buffer to read.
+        destination (np.ndarray): C-contiguous array receiving the first
+            destination.nbytes bytes of the buffer.
+    """
+    size = destination.nbytes
+    if size > buffer.size:
+        raise ValueError(f"Attempting to read {size} bytes from a buffer of {buffer.size} bytes")
+
+    gl.glBindBuffer(gl.GL_ARRAY_BUFFER, buffer.glo)
+    ptr = gl.glMapBufferRange(gl.GL_ARRAY_BUFFER, 0, size, gl.GL_MAP_READ_BIT)
+    memmove(destination.ctypes.data, ptr, size)
+    gl.glUnmapBuffer(gl.GL_ARRAY_BUFFER)
+
+
 class RayCompute:
     """
-    Class for computing ray-based ray_sensors hitpoints using shaders or CPU.
+    Class for computing ray-based ray_sensors hitpoints.
+
+    Three backends are available:
+        - 'shader': a compute shader samples the rays in an ID view, where
+          each entity is drawn with the color of its uid.
+        - 'cpu': the rays are sampled in the same ID view with numpy.
+        - 'geometric': the rays are intersected with the pymunk shapes of
+          the entities, nothing is rendered (see GeometricRayCaster).
     """
 
-    def __init__(self, playground: Playground, size, center, zoom, use_shader: bool = True):
+    BACKENDS = ("shader", "cpu", "geometric")
+
+    # Initial number of ids per sensor in the invisible buffer of the shader,
+    # the anchor and the elements grasped by the drone
+    MIN_INVISIBLE_CAPACITY = 8
+
+    # Number of points of the first chunk marched along the rays by the CPU
+    # backend, the next chunks are twice as long as the previous one
+    CPU_MARCHING_CHUNK = 8
+
+    # Number of rays computed by each work group of the compute shader
+    RAYS_PER_GROUP = 64
+
+    def __init__(self, playground: Playground, size, center, zoom, backend: str = "shader"):
         """
         Initialize RayCompute.
 
         Args:
             playground (Playground): The playground environment.
-            size: Size of the view.
+            size: Size of the area covered by the view, in the frame of the
+                environment. The ID view has size * zoom pixels.
             center: Center of the view.
-            zoom: Zoom factor.
-            use_shader (bool): Whether to use shaders for computation.
+            zoom: Zoom factor of the ID view.
+            backend (str): Backend computing the hitpoints, one of BACKENDS.
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {self.BACKENDS}")
+        if zoom <= 0:
+            raise ValueError("The zoom of the ID view should be positive")
+
+        self._playground = playground
         self._ctx = playground.window._ctx
+        self._size = size
+        self._center = center
+        self._zoom = zoom
 
-        self._use_shader = use_shader
-
-        self._id_view = TopDownView(
-            playground,
-            size,
-            center,
-            zoom,
-            use_color_uid=True,
-            draw_interactive=False,
-            draw_transparent=False,
-            draw_zone=False,
-        )
+        self._backend = backend
 
         self._sensors: List[RaySensor] = []
 
-        if self._use_shader:
-            self._view_params_buffer = self._ctx.buffer(
-                data=array(
-                    "f",
-                    [
-                        self._id_view.center[0],
-                        self._id_view.center[1],
-                        self._id_view.width,
-                        self._id_view.height,
-                        self._id_view.zoom,
-                    ],
+        self._id_view: Optional[TopDownView] = None
+        self._view_params_buffer = None
+        self._compact_readback = False
+        self._fused_rays = True
+        self._cpu_buffers: Optional[dict] = None
+        # What was already computed during the current step, reused by the
+        # lazy sensors computed after the update of the other sensors, and
+        # the lazy sensors whose hitpoints are not computed yet
+        self._id_view_up_to_date = False
+        self._ids_view: Optional[np.ndarray] = None
+        self._shader_up_to_date = False
+        self._lazy_sensors: Set[RaySensor] = set()
+        self._geometric_ray_caster: Optional[GeometricRayCaster] = None
+        self._initialize_backend()
+
+    def _initialize_backend(self) -> None:
+        """
+        Create the resources needed by the current backend, if they do not
+        exist yet.
+        """
+        if self._backend == "geometric":
+            if self._geometric_ray_caster is None:
+                self._geometric_ray_caster = GeometricRayCaster(
+                    self._playground, self._view_size, self._center, self._zoom
                 )
+            return
+
+        if self._id_view is None:
+            self._id_view = TopDownView(
+                self._playground,
+                self._view_size,
+                self._center,
+                self._zoom,
+                use_color_uid=True,
+                draw_interactive=False,
+                draw_transparent=False,
+                draw_zone=False,
+                static_layer=True,
             )
 
-            self._view_params_buffer.bind_to_storage_buffer(binding=6)
+        if self._backend == "shader" and self._view_params_buffer is None:
+            self._initialize_shader_resources()
+
+    def _initialize_shader_resources(self) -> None:
+        """
+        Create the view parameter buffer and load the source of the compute
+        shader.
+        """
+        self._view_params_buffer = self._ctx.buffer(
+            data=array(
+                "f",
+                [
+                    self._id_view.center[0],
+                    self._id_view.center[1],
+                    self._id_view.width,
+                    self._id_view.height,
+                    self._id_view.zoom,
+                ],
+            )
+        )
+
+        self._position_buffer = None
+        self._param_buffer = None
+        self._output_rays_buffer = None
+        self._output_values_buffer = None
+        self._inv_buffer = None
+        self._ray_table_buffer = None
+
+        # Index in the output buffers of the first ray of each sensor
+        self._ray_offsets = np.zeros(0, dtype=np.intp)
+        self._n_rays_out = 0
 
-            self._position_buffer = None
-            self._param_buffer = None
-            self._output_rays_buffer = None
-            self._inv_buffer = None
+        # Number of ids per sensor in the invisible buffer, the shader is
+        # only compiled again when it grows
+        self._invisible_capacity = 0
 
-            shader_dir = path.abspath(path.join(path.dirname(__file__), "shaders"))
+        # Destinations of the readback of the output buffers
+        self._hitpoints = np.zeros((0, 10), dtype=np.float32)
+        self._values = np.zeros((0, 2), dtype=np.float32)
 
-            with open(path.join(shader_dir, "id_compute.glsl"), "rt", encoding="utf-8") as f_id:
-                self._source_compute_ids = f_id.read()
+        shader_dir = path.abspath(path.join(path.dirname(__file__), "shaders"))
 
-            self._id_shader = None
+        with open(path.join(shader_dir, "id_compute.glsl"), "rt", encoding="utf-8") as f_id:
+            self._source_compute_ids = f_id.read()
+
+        self._id_shader = None
 
     @property
     def _n_sensors(self) -> int:
@@ -95,6 +200,31 @@ class RayCompute:
         """
         return 1 + max(len(sensor.invisible_ids) for sensor in self._sensors)
 
+    def _generate_ray_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate the table of the rays computed by the compute shader.
+
+        With fused rays, the rays of all the sensors follow each other, so
+        the lidar and the semantic sensor of a drone are computed and read
+        back as one sweep of their rays. Otherwise, each sensor has as many
+        rays as the sensor with the most rays.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The (N, 2) index of the sensor and
+            index in the sensor of each ray, and the index of the first ray
+            of each sensor.
+        """
+        if self._fused_rays:
+            n_rays = np.array([sensor.resolution for sensor in self._sensors], dtype=np.intp)
+        else:
+            n_rays = np.full(self._n_sensors, self._max_n_rays, dtype=np.intp)
+
+        offsets = np.concatenate(([0], np.cumsum(n_rays)[:-1])).astype(np.intp)
+        ray_sensors = np.repeat(np.arange(self._n_sensors), n_rays)
+        ray_indices = np.arange(len(ray_sensors)) - offsets[ray_sensors]
+
+        return np.stack((ray_sensors, ray_indices), axis=-1).astype(np.int32), offsets
+
     def _generate_buffers(self):
         """
         Generate GPU buffers for sensor computation.
@@ -102,23 +232,36 @@ class RayCompute:
         Returns:
             Tuple of buffers.
         """
-        position_buffer = self._ctx.buffer(
-            data=array("f", self._generate_position_buffer())
-        )
+        ray_table, self._ray_offsets = self._generate_ray_table()
+        self._n_rays_out = len(ray_table)
+
+        position_buffer = self._ctx.buffer(reserve=self._n_sensors * 3 * 4, usage="stream")
         param_buffer = self._ctx.buffer(
             data=array("f", self._generate_parameter_buffer())
         )
         output_rays_buffer = self._ctx.buffer(
             data=array("f", self._generate_output_buffer())
         )
+        output_values_buffer = self._ctx.buffer(reserve=self._n_rays_out * 2 * 4)
         inv_buffer = self._ctx.buffer(data=array("I", self._generate_invisible_buffer()))
+        ray_table_buffer = self._ctx.buffer(data=ray_table.tobytes())
 
-        param_buffer.bind_to_storage_buffer(binding=2)
-        position_buffer.bind_to_storage_buffer(binding=3)
-        output_rays_buffer.bind_to_storage_buffer(binding=4)
-        inv_buffer.bind_to_storage_buffer(binding=5)
+        return (position_buffer, param_buffer, output_rays_buffer, output_values_buffer,
+                inv_buffer, ray_table_buffer)
 
-        return position_buffer, param_buffer, output_rays_buffer, inv_buffer
+    def _bind_buffers(self) -> None:
+        """
+        Bind the buffers to the bindings of the compute shader. The bindings
+        are shared by all the playgrounds of the process, so they are set
+        before each run of the shader.
+        """
+        self._param_buffer.bind_to_storage_buffer(binding=2)
+        self._position_buffer.bind_to_storage_buffer(binding=3)
+        self._output_rays_buffer.bind_to_storage_buffer(binding=4)
+        self._inv_buffer.bind_to_storage_buffer(binding=5)
+        self._view_params_buffer.bind_to_storage_buffer(binding=6)
+        self._output_values_buffer.bind_to_storage_buffer(binding=7)
+        self._ray_table_buffer.bind_to_storage_buffer(binding=8)
 
     def _generate_parameter_buffer(self):
         """
@@ -130,42 +273,40 @@ class RayCompute:
             yield sensor.resolution
             yield sensor.n_points
 
-    def _generate_position_buffer(self):
+    def _get_positions(self) -> np.ndarray:
         """
-        Generate position buffer for all sensors.
+        Returns the positions and angles of all sensors, as written in the
+        position buffer.
         """
-        for sensor in self._sensors:
-            yield sensor.position[0]
-            yield sensor.position[1]
-            yield sensor.angle
+        return np.array([(sensor.position[0], sensor.position[1], sensor.angle)
+                         for sensor in self._sensors], dtype=np.float32)
 
     def _generate_output_buffer(self):
         """
-        Generate output buffer for all sensors.
+        Generate output buffer for all the rays of the ray table.
         """
-        for _ in range(self._n_sensors):
-            for _ in range(self._max_n_rays):
-                # View Position
-                yield 0.0
-                yield 0.0
+        for _ in range(self._n_rays_out):
+            # View Position
+            yield 0.0
+            yield 0.0
 
-                # Abs Env Position
-                yield 0.0
-                yield 0.0
+            # Abs Env Position
+            yield 0.0
+            yield 0.0
 
-                # Rel Position
-                yield 0.0
-                yield 0.0
+            # Rel Position
+            yield 0.0
+            yield 0.0
 
-                # Sensor center on view
-                yield 0.0
-                yield 0.0
+            # Sensor center on view
+            yield 0.0
+            yield 0.0
 
-                # ID
-                yield 0.0
+            # ID
+            yield 0.0
 
-                # Distance
-                yield 0.0
+            # Distance
+            yield 0.0
 
     def _generate_invisible_buffer(self):
         """
@@ -180,7 +321,7 @@ class RayCompute:
                 yield inv
                 count += 1
 
-            while count < self._max_invisible:
+            while count < self._invisible_capacity:
                 yield 0
                 count += 1
 
@@ -190,12 +331,155 @@ class RayCompute:
         """
         new_source = self._source_compute_ids
         new_source = new_source.replace("N_SENSORS", str(len(self._sensors)))
-        new_source = new_source.replace("MAX_N_RAYS", str(self._max_n_rays))
-        new_source = new_source.replace("MAX_N_INVISIBLE", str(self._max_invisible))
+        new_source = new_source.replace("N_RAYS", str(self._n_rays_out))
+        new_source = new_source.replace("RAYS_PER_GROUP", str(self.RAYS_PER_GROUP))
+        new_source = new_source.replace("MAX_N_INVISIBLE", str(self._invisible_capacity))
         id_shader = self._ctx.compute_shader(source=new_source)
 
         return id_shader
 
+    @property
+    def backend(self) -> str:
+        """
+        Returns the backend computing the hitpoints: 'shader', 'cpu' or
+        'geometric'.
+        """
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend: str) -> None:
+        """
+        Switch the backend computing the hitpoints.
+
+        Args:
+            backend (str): One of BACKENDS.
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {self.BACKENDS}")
+
+        if backend == self._backend:
+            return
+
+        self._backend = backend
+        self._initialize_backend()
+        if self._backend == "shader" and self._sensors:
+            self._update_buffers_and_shaders()
+        self.invalidate()
+
+    @property
+    def _view_size(self) -> Tuple[int, int]:
+        """
+        Returns the size of the ID view, in pixels.
+        """
+        return math.ceil(self._size[0] * self._zoom), math.ceil(self._size[1] * self._zoom)
+
+    @property
+    def zoom(self) -> float:
+        """
+        Returns the zoom factor of the ID view.
+        """
+        return self._zoom
+
+    @zoom.setter
+    def zoom(self, zoom: float) -> None:
+        """
+        Set the zoom factor of the ID view, which is created again with the
+        resources of the backend.
+
+        Args:
+            zoom (float): Zoom factor, positive.
+        """
+        if zoom <= 0:
+            raise ValueError("The zoom of the ID view should be positive")
+
+        if zoom == self._zoom:
+            return
+
+        self._zoom = zoom
+        if self._id_view is not None:
+            self._playground.remove_view(self._id_view)
+        self._id_view = None
+        self._view_params_buffer = None
+        self._geometric_ray_caster = None
+        self._cpu_buffers = None
+
+        self._initialize_backend()
+        if self._backend == "shader" and self._sensors:
+            self._update_buffers_and_shaders()
+        self.invalidate()
+
+    @property
+    def compact_readback(self) -> bool:
+        """
+        Returns whether only the ids and the distances of the hitpoints are
+        read back from the compute shader.
+        """
+        return self._compact_readback
+
+    @compact_readback.setter
+    def compact_readback(self, compact_readback: bool) -> None:
+        """
+        Read back only the ids and the distances of the hitpoints from the
+        compute shader, the two columns used by the values of the sensors,
+        instead of the 10 columns. The other columns, only used to draw the
+        rays, are then left to zero. It has no effect with the other backends.
+
+        Args:
+            compact_readback (bool): Whether to read back only the ids and
+                the distances.
+        """
+        self._compact_readback = compact_readback
+        # The hitpoints of the compute shader only exist with its backend
+        if self._backend == "shader":
+            self._hitpoints[:] = 0
+        self._shader_up_to_date = False
+
+    @property
+    def fused_rays(self) -> bool:
+        """
+        Returns whether the rays of sensors with different numbers of rays
+        are computed together.
+        """
+        return self._fused_rays
+
+    @fused_rays.setter
+    def fused_rays(self, fused_rays: bool) -> None:
+        """
+        Compute the rays of all the sensors in one sweep, such as the 181
+        rays of the lidar and the 35 rays of the semantic sensor of a drone,
+        instead of computing the sensors with different numbers of rays or
+        points per ray separately. The compute shader then only computes and
+        reads back the rays of the sensors, instead of as many rays for each
+        sensor as the sensor with the most rays, and the CPU backend marches
+        along the rays of all the sensors at once. The hitpoints are the same
+        in both modes.
+
+        Args:
+            fused_rays (bool): Whether to compute the rays of all the sensors
+                together.
+        """
+        self._fused_rays = fused_rays
+        self._cpu_buffers = None
+        if self._backend == "shader" and self._sensors:
+            self._update_buffers_and_shaders()
+
+    @property
+    def use_shader(self) -> bool:
+        """
+        Returns whether the hitpoints are computed with a compute shader.
+        """
+        return self._backend == "shader"
+
+    @use_shader.setter
+    def use_shader(self, use_shader: bool) -> None:
+        """
+        Switch between the compute shader and the CPU to compute the hitpoints.
+
+        Args:
+            use_shader (bool): Whether to use the compute shader.
+        """
+        self.backend = "shader" if use_shader else "cpu"
+
     def add(self, sensor) -> None:
         """
         Add a sensor to the computation.
@@ -203,169 +487,435 @@ class RayCompute:
         Args:
             sensor: The sensor to add.
         """
+        # A sensor added back to the playground after a removal is already known
+        if sensor in self._sensors:
+            return
+
         self._sensors.append(sensor)
+        self._cpu_buffers = None
 
-        if self._use_shader:
+        if self._backend == "shader":
             self._update_buffers_and_shaders()
 
     def _update_buffers_and_shaders(self) -> None:
         """
         Update GPU buffers and shaders.
         """
+        self._invisible_capacity = max(self._invisible_capacity, self._max_invisible,
+                                       self.MIN_INVISIBLE_CAPACITY)
+
         (
             self._position_buffer,
             self._param_buffer,
             self._output_rays_buffer,
+            self._output_values_buffer,
             self._inv_buffer,
+            self._ray_table_buffer,
         ) = self._generate_buffers()
 
+        self._hitpoints = np.zeros((self._n_rays_out, 10), dtype=np.float32)
+        self._values = np.zeros((self._n_rays_out, 2), dtype=np.float32)
+        self._shader_up_to_date = False
+
         self._id_shader = self._generate_shaders()
 
+    def _update_invisible_buffer(self) -> None:
+        """
+        Update the invisible elements of the sensors. The invisible buffer is
+        rewritten in place while the elements fit in its capacity, otherwise
+        the capacity is doubled, and the buffers and the shader are generated
+        again.
+        """
+        if self._max_invisible > self._invisible_capacity:
+            self._invisible_capacity = max(2 * self._invisible_capacity, self._max_invisible)
+            self._update_buffers_and_shaders()
+        else:
+            self._inv_buffer.write(array("I", self._generate_invisible_buffer()))
+
     def update_sensors(self) -> None:
         """
-        Update all sensors' hitpoints.
+        Update the hitpoints of the sensors due for an update at this step
+        (see Sensor.update_period). The other sensors keep their hitpoints.
+
+        The hitpoints of the lazy sensors (see Sensor.lazy) are only computed
+        when their values are read, by update_lazy_sensor(), reusing the ID
+        view drawn and the rays cast by the shader during the step.
+        """
+        self.invalidate()
+
+        sensors = []
+        for sensor in self._sensors:
+            if not sensor.update_due:
+                continue
+            if sensor.computed_lazily:
+                self._lazy_sensors.add(sensor)
+            else:
+                sensors.append(sensor)
+
+        self._update_sensors(sensors)
+
+    def update_lazy_sensor(self, sensor: RaySensor) -> None:
+        """
+        Update the hitpoints of a lazy sensor, if they were not computed yet
+        during the step. The other lazy sensors with the same number of rays
+        and of points per ray are updated together, as their hitpoints are
+        computed in the same array operations.
+
+        Args:
+            sensor (RaySensor): The lazy sensor, whose values are read.
+        """
+        if sensor not in self._lazy_sensors:
+            return
+
+        key = (sensor.resolution, sensor.n_points)
+        sensors = [other for other in self._lazy_sensors
+                   if (other.resolution, other.n_points) == key]
+        self._lazy_sensors.difference_update(sensors)
+
+        # The rays are often cast in the control() of a drone, they are not
+        # counted as the time of its solution
+        profiler = self._playground.profiler
+        with profiler.phase(StepProfiler.LAZY_RAY_COMPUTE) if profiler else NO_PROFILING:
+            self._update_sensors(sensors)
+
+    def compute_pending_sensors(self, kept_only: bool = False) -> None:
+        """
+        Compute the values of the lazy sensors not read yet during the step,
+        before the playground changes.
+
+        Args:
+            kept_only (bool): Only compute the sensors which keep their
+                values at the next update (see Sensor.update_period), the
+                others get new values anyway.
+        """
+        for sensor in [sensor for sensor in self._sensors
+                       if sensor.values_pending and not (kept_only and sensor.update_due)]:
+            # pylint: disable=protected-access
+            sensor._compute_pending_values()
+
+    def forget_shapes(self, shapes: List[pymunk.Shape]) -> None:
+        """
+        Drop what the backend cached about shapes removed for good from the
+        playground.
+
+        Args:
+            shapes (List[pymunk.Shape]): The shapes.
+        """
+        if self._geometric_ray_caster is not None:
+            self._geometric_ray_caster.forget_shapes(shapes)
+
+    def invalidate(self) -> None:
+        """
+        Forget the ID view and the rays cast during the current step, after
+        the playground changed (new step, restored snapshot, ...). The lazy
+        sensors whose values are pending get new hitpoints when read.
+        """
+        self._id_view_up_to_date = False
+        self._ids_view = None
+        self._shader_up_to_date = False
+        self._lazy_sensors = {sensor for sensor in self._sensors if sensor.values_pending}
+
+    def _update_sensors(self, sensors: List[RaySensor]) -> None:
+        """
+        Update the hitpoints of sensors with the current backend.
+
+        Args:
+            sensors (List[RaySensor]): The sensors to update.
         """
-        if not self._sensors:
+        if not sensors:
+            return
+
+        if self._backend == "geometric":
+            self._geometric_ray_caster.update_sensors(sensors)
             return
 
-        self._id_view.update_and_draw_in_framebuffer(force=True)
+        if not self._id_view_up_to_date:
+            self._id_view.update_and_draw_in_framebuffer()
+            self._id_view_up_to_date = True
 
-        if self._use_shader:
-            self._update_sensors_shaders()
+        if self._backend == "shader":
+            self._update_sensors_shaders(sensors)
         else:
-            self._update_sensors_cpu()
+            self._update_sensors_cpu(sensors)
 
-    def _update_sensors_shaders(self) -> None:
+    def _update_sensors_shaders(self, sensors: List[RaySensor]) -> None:
         """
-        Update sensors using GPU shaders.
+        Update sensors using GPU shaders. The shader computes the hitpoints of
+        all the sensors once per step, only the sensors to update get them.
+
+        Args:
+            sensors (List[RaySensor]): The sensors to update.
         """
-        update_inv = False
-        for sensor in self._sensors:
-            if sensor.require_invisible_update:
-                update_inv = True
+        if not self._shader_up_to_date:
+            self._run_shader()
+            self._shader_up_to_date = True
 
-        if update_inv:
-            self._update_buffers_and_shaders()
+        # The sensors keep their hitpoints after the next update, so they
+        # get a copy of their part of the readback array
+        to_update = set(sensors)
+        for index, sensor in enumerate(self._sensors):
+            if sensor in to_update:
+                offset = self._ray_offsets[index]
+                sensor.update_hitpoints(self._hitpoints[offset: offset + sensor.resolution].copy())
 
-        self._position_buffer = self._ctx.buffer(
-            data=array("f", self._generate_position_buffer())
-        )
-        self._position_buffer.bind_to_storage_buffer(binding=3)
+    def _run_shader(self) -> None:
+        """
+        Compute the hitpoints of all the sensors with the compute shader, and
+        read them back in the hitpoints array.
+        """
+        if any(sensor.require_invisible_update for sensor in self._sensors):
+            self._update_invisible_buffer()
+
+        # Orphan the storage of the position buffer, so that writing it does
+        # not wait for the previous run of the shader
+        self._position_buffer.orphan()
+        self._position_buffer.write(self._get_positions())
 
+        self._bind_buffers()
         self._id_view.texture.use()
-        self._id_shader.run(group_x=self._n_sensors)
+        self._id_shader.run(group_x=-(-self._n_rays_out // self.RAYS_PER_GROUP))
+        gl.glMemoryBarrier(gl.GL_BUFFER_UPDATE_BARRIER_BIT)
 
-        hitpoints = np.frombuffer(
-            self._output_rays_buffer.read(), dtype=np.float32
-        ).reshape(self._n_sensors, self._max_n_rays, 10)
+        if self._compact_readback:
+            read_buffer_into(self._output_values_buffer, self._values)
+            self._hitpoints[:, 8:10] = self._values
+        else:
+            read_buffer_into(self._output_rays_buffer, self._hitpoints)
 
-        for index, sensor in enumerate(self._sensors):
-            sensor.update_hitpoints(hitpoints[index, : sensor.resolution, :])
+    def _generate_cpu_buffers(self) -> List[dict]:
+        """
+        Preallocate the arrays of the CPU computation. With fused rays, all
+        the sensors are computed together, otherwise the sensors with the
+        same number of rays and of points per ray are computed together.
 
-    def _update_sensors_cpu(self) -> None:
+        Returns:
+            List[dict]: For each group of sensors, the indices of the sensors,
+            the constant parameters of their rays and the scratch arrays.
+        """
+        groups = {}
+        for index, sensor in enumerate(self._sensors):
+            key = None if self._fused_rays else (sensor.resolution, sensor.n_points)
+            groups.setdefault(key, []).append(index)
+
+        cpu_buffers = []
+        for indices in groups.values():
+            sensors = [self._sensors[index] for index in indices]
+            resolutions = np.array([sensor.resolution for sensor in sensors], dtype=np.intp)
+            offsets = np.concatenate(([0], np.cumsum(resolutions)[:-1])).astype(np.intp)
+            # Index in the group of the sensor of each ray, the rays of the
+            # sensors following each other
+            ray_sensors = np.repeat(np.arange(len(sensors)), resolutions)
+            n_rays = len(ray_sensors)
+            cpu_buffers.append({
+                "indices": indices,
+                "offsets": offsets,
+                "resolutions": resolutions,
+                "ray_sensors": ray_sensors,
+                # Angles of the rays relative to the angle of their sensor
+                "ray_angles": np.concatenate([
+                    np.linspace(-sensor.fov / 2, sensor.fov / 2, sensor.resolution)
+                    for sensor in sensors]),
+                "ranges": np.repeat([sensor.max_range for sensor in sensors], resolutions),
+                "n_points": np.repeat([sensor.n_points for sensor in sensors], resolutions),
+                "first_indices": np.empty(n_rays, dtype=np.intp),
+                "first_ids": np.empty(n_rays, dtype=np.uint32),
+                "hitpoints": np.zeros((n_rays, 10)),
+            })
+
+        return cpu_buffers
+
+    def _update_sensors_cpu(self, sensors: List[RaySensor]) -> None:
         """
         Updates the sensors' data using a CPU-based approach.
 
         This method processes the sensor data by calculating the hitpoints of rays
         cast by each sensor in the playground. It uses the ID views to
         determine the positions, distances, and other attributes of the detected
-        objects.
+        objects. The sensors with the same number of rays and of points per
+        ray are computed together, in a single set of array operations.
 
         Steps:
         1. Retrieve the ID images from the views.
-        2. For each sensor:
+        2. For each group of sensors:
            - Calculate the start and end positions of the rays.
-           - Clip the ray points to ensure they are within the view bounds.
+           - March along the rays by chunks of points, clipped to the view
+             bounds, until each ray hits a visible object or ends.
            - Retrieve object IDs and filter out invisible objects.
            - Calculate the first hitpoint for each ray.
            - Compute relative positions and distances of the hitpoints.
-           - Update the sensor with the calculated hitpoints.
+           - Update the sensors with the calculated hitpoints.
 
         Notes:
         - This method is used when shaders are not enabled for sensor updates.
         - It handles invisible objects by removing their IDs from the results.
-        """
-        img_id = self._id_view.get_np_img()
-
-        for sensor in self._sensors:
-            # Calculate the start position of the rays in the view
-            end_positions = sensor.end_positions
-            ray_start_x = ((sensor.position[0] - self._id_view.center[0]) * self._id_view.zoom
-                           + self._id_view.width / 2)
-            ray_start_y = ((sensor.position[1] - self._id_view.center[1]) * self._id_view.zoom
-                           + self._id_view.height / 2)
-            center_on_view = np.asarray((ray_start_x, ray_start_y)).reshape(2, 1)
 
-            # Calculate the end positions of the rays
-            rays_end = center_on_view + end_positions * self._id_view.zoom
+        Args:
+            sensors (List[RaySensor]): The sensors to update.
+        """
+        if self._cpu_buffers is None:
+            self._cpu_buffers = self._generate_cpu_buffers()
+
+        if self._ids_view is None:
+            self._ids_view = self._id_view.get_np_ids().ravel()
+
+        to_update = set(sensors)
+        ids_view = self._ids_view
+        for buffers in self._cpu_buffers:
+            selected = [position for position, index in enumerate(buffers["indices"])
+                        if self._sensors[index] in to_update]
+            if selected:
+                self._update_sensor_group_cpu(ids_view, buffers, selected)
+
+    def _update_sensor_group_cpu(self, ids_view: np.ndarray, buffers: dict,
+                                 selected: List[int]) -> None:
+        """
+        Compute the hitpoints of a group of sensors, their rays being
+        flattened in a single array.
 
-            # Generate points along the rays
-            points = np.linspace(center_on_view, rays_end, num=sensor.n_points)
+        Args:
+            ids_view (np.ndarray): The flattened uids of the ID view.
+            buffers (dict): The parameters and the scratch arrays of the group,
+                generated by _generate_cpu_buffers().
+            selected (List[int]): Positions in the group of the sensors to update.
+        """
+        sensors = [self._sensors[buffers["indices"][position]] for position in selected]
+        if len(selected) == len(buffers["indices"]):
+            rays_selected = slice(None)
+            ray_sensors = buffers["ray_sensors"]
+        else:
+            rays_selected = np.concatenate([
+                np.arange(buffers["offsets"][position],
+                          buffers["offsets"][position] + buffers["resolutions"][position])
+                for position in selected])
+            ray_sensors = np.repeat(np.arange(len(selected)), buffers["resolutions"][selected])
+        ranges = buffers["ranges"][rays_selected]
+        n_points = buffers["n_points"][rays_selected]
+        n_rays = len(ray_sensors)
+        zoom = self._id_view.zoom
+        view_center = np.asarray(self._id_view.center, dtype=float)
+        half_size = np.array((self._id_view.width / 2, self._id_view.height / 2))
+
+        # Calculate the start position of the rays in the view
+        positions = np.array([sensor.position for sensor in sensors], dtype=float)
+        angles = np.array([sensor.angle for sensor in sensors], dtype=float)
+        center_on_view = (positions - view_center) * zoom + half_size
+        rays_start = center_on_view[ray_sensors]
+
+        # Calculate the end positions of the rays
+        ray_angles = angles[ray_sensors] + buffers["ray_angles"][rays_selected]
+        lengths = ranges * zoom
+        rays_end = np.stack((lengths * np.cos(ray_angles), lengths * np.sin(ray_angles)), axis=-1)
+        rays_end += rays_start
+
+        # Step between the points along the rays
+        ray_steps = (rays_end - rays_start) / (n_points - 1)[:, np.newaxis]
+
+        # Invisible objects of the sensor of each ray, padded with zeros
+        invisible_ids = [sensor.invisible_ids for sensor in sensors]
+        invisible = np.zeros((len(sensors), max(len(ids_sensor) for ids_sensor in invisible_ids)),
+                             dtype=np.uint32)
+        for index, ids_sensor in enumerate(invisible_ids):
+            invisible[index, :len(ids_sensor)] = ids_sensor
+        invisible = invisible[ray_sensors]
+
+        # March along the rays by chunks of points, and stop marching the
+        # rays as soon as they hit a visible object or reach their end. Rays
+        # that hit nothing keep their first point.
+        first_indices = buffers["first_indices"][:n_rays]
+        first_ids = buffers["first_ids"][:n_rays]
+        first_indices[:] = 0
+        first_ids[:] = 0
+        rays = np.arange(n_rays)
+        start = 0
+        chunk = self.CPU_MARCHING_CHUNK
+        max_n_points = n_points.max()
+        while start < max_n_points and len(rays) > 0:
+            steps = np.arange(start, min(start + chunk, max_n_points))
+            points_x, points_y = self._get_ray_points(rays_start[rays], ray_steps[rays], rays_end[rays],
+                                                      steps, n_points[rays])
+
+            # Retrieve object IDs from the ID view
+            pixel_indices = points_y.astype(np.intp)
+            pixel_indices *= self._id_view.width
+            pixel_indices += points_x.astype(np.intp)
+            ids = ids_view[pixel_indices]
 
-            # Clip points to ensure they are within the view bounds
-            points[:, 0, :] = np.clip(points[:, 0, :], 0, self._id_view.width - 1)
-            points[:, 1, :] = np.clip(points[:, 1, :], 0, self._id_view.height - 1)
+            # Remove invisible objects
+            for ids_invisible in invisible[rays].T:
+                ids[ids == ids_invisible[:, np.newaxis]] = 0
 
-            points = points.swapaxes(1, 2).reshape(-1, 2)
-            rr, cc = points[:, 1].astype(int), points[:, 0].astype(int)
+            # Find the first non-zero ID for each ray
+            hit = ids != 0
+            index_first_non_zero = np.argmax(hit, axis=1)
+            has_hit = hit[np.arange(len(rays)), index_first_non_zero]
+            hit_rays = rays[has_hit]
+            first_indices[hit_rays] = steps[index_first_non_zero[has_hit]]
+            first_ids[hit_rays] = ids[has_hit, index_first_non_zero[has_hit]]
+
+            start += chunk
+            chunk *= 2
+            rays = rays[~has_hit & (n_points[rays] > start)]
+
+        # Calculate the hitpoints
+        view_position = np.hstack(self._get_ray_points(rays_start, ray_steps, rays_end,
+                                                       first_indices[:, np.newaxis], n_points))
+        no_hit = first_ids == 0
+
+        # Calculate relative positions and distances, in the frame of the
+        # environment
+        rel_pos = rays_start - view_position
+        distance = np.sqrt(rel_pos[:, 0] ** 2 + rel_pos[:, 1] ** 2) / zoom
+        distance[no_hit] = ranges[no_hit]
+
+        # Combine all hitpoint data, with the absolute positions in the
+        # environment calculated before moving the missed rays to their end.
+        # The positions on the view are at the scale of the environment.
+        hitpoints = buffers["hitpoints"][:n_rays]
+        hitpoints[:, 2:4] = (view_position - half_size) / zoom + view_center
+        view_position[no_hit] = rays_end[no_hit]
+        hitpoints[:, 0:2] = view_position / zoom
+        hitpoints[:, 6:8] = rays_start / zoom
+        hitpoints[:, 8] = first_ids
+        hitpoints[:, 9] = distance
+
+        # Update the sensors with the calculated hitpoints
+        offset = 0
+        for sensor in sensors:
+            sensor.update_hitpoints(hitpoints[offset: offset + sensor.resolution].copy())
+            offset += sensor.resolution
+
+    def _get_ray_points(self, rays_start: np.ndarray, ray_steps: np.ndarray, rays_end: np.ndarray,
+                        steps: np.ndarray, n_points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the points along the rays, clipped to the view bounds, as
+        numpy.linspace() would.
 
-            # Retrieve object IDs from the ID image
-            pts_ids = img_id[rr, cc].astype(np.uint64)
-            ids = 256 * 256 * pts_ids[:, 2] + 256 * pts_ids[:, 1] + pts_ids[:, 0]
+        Args:
+            rays_start (np.ndarray): (N, 2) start positions of the rays in the view.
+            ray_steps (np.ndarray): (N, 2) steps between the points of the rays.
+            rays_end (np.ndarray): (N, 2) end positions of the rays in the view.
+            steps (np.ndarray): Indices of the points, broadcast to (N, K).
+                The points after the last point of a ray are its end.
+            n_points (np.ndarray): (N,) number of points along the rays.
 
-            # Remove invisible objects
-            invisible_mask = ~np.isin(ids, sensor.invisible_ids)
-            ids = ids * invisible_mask
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (N, K) x and y positions of the
+            points in the view.
+        """
+        # The last point is the end of the ray
+        last = None
+        if len(n_points) > 0 and steps.max() >= n_points.min() - 1:
+            last = steps >= (n_points - 1)[:, np.newaxis]
 
-            ids = ids.reshape(-1, sensor.resolution).transpose()
+        coordinates = []
+        for axis, bound in ((0, self._id_view.width - 1), (1, self._id_view.height - 1)):
+            points = steps * ray_steps[:, axis, np.newaxis] + rays_start[:, axis, np.newaxis]
 
-            # Find the first non-zero ID for each ray
-            index_first_non_zero = np.argmax((ids != 0), axis=1)
-            id_first_non_zero = ids[
-                np.arange(len(index_first_non_zero)), index_first_non_zero
-            ]
-
-            # Calculate the hitpoints
-            points = points.reshape((-1, sensor.resolution, 2))
-            view_position = points[
-                            index_first_non_zero, np.arange(len(index_first_non_zero)), :
-                            ]
-
-            # Calculate relative positions and distances
-            rel_pos = center_on_view.transpose() - view_position
-            distance = np.sqrt(rel_pos[:, 0] ** 2 + rel_pos[:, 1] ** 2)
-            distance[id_first_non_zero == 0] = sensor.max_range
-            distance = np.expand_dims(distance, -1)
-
-            # Calculate absolute positions in the environment
-            x_abs = ((view_position[:, 0] - self._id_view.width / 2) / self._id_view.zoom
-                     + self._id_view.center[0])
-            y_abs = ((view_position[:, 1] - self._id_view.height / 2) / self._id_view.zoom
-                     + self._id_view.center[1])
-            view_position[id_first_non_zero == 0, :] = rays_end[
-                                                       :, id_first_non_zero == 0
-                                                       ].T
-            abs_env_position = np.vstack((x_abs, y_abs)).transpose()
-
-            # Broadcast the center position to match the resolution
-            center_on_view = np.broadcast_to(
-                center_on_view.transpose(), (sensor.resolution, 2)
-            )
+            if last is not None:
+                points = np.where(last, rays_end[:, axis, np.newaxis], points)
 
-            # Expand the ID array for concatenation
-            id_first_non_zero = np.expand_dims(id_first_non_zero, -1)
-
-            # Combine all hitpoint data
-            hitpoints = np.hstack(
-                (
-                    view_position,
-                    abs_env_position,
-                    np.zeros((sensor.resolution, 2)),
-                    center_on_view,
-                    id_first_non_zero,
-                    distance,
-                )
-            )
+            # Clip points to ensure they are within the view bounds
+            np.clip(points, 0, bound, out=points)
+            coordinates.append(points)
 
-            # Update the sensor with the calculated hitpoints
-            sensor.update_hitpoints(hitpoints)
+        return coordinates[0], coordinates[1]
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import copy
 from abc import ABC
-from typing import Optional
+from typing import Optional, Dict, Any
 
 import numpy as np
 
@@ -56,6 +57,34 @@ class RaySensor(ExternalSensor, ABC):
         """
         self._hitpoints = hitpoints
 
+    def _compute_values(self) -> None:
+        """
+        Compute the sensor values. A lazy sensor first gets the hitpoints of
+        the current step from the ray compute of the playground.
+        """
+        if self.computed_lazily and self._playground:
+            self._playground.ray_compute.update_lazy_sensor(self)
+
+        super()._compute_values()
+
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        Returns the state of the sensor, with a copy of its hitpoints.
+        """
+        state = super().snapshot_state()
+        state["hitpoints"] = copy.copy(self._hitpoints)
+        return state
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Revert the sensor to a state returned by snapshot_state().
+
+        Args:
+            state (Dict[str, Any]): State of the sensor.
+        """
+        super().restore_state(state)
+        self._hitpoints = copy.copy(state["hitpoints"])
+
     @property
     def end_positions(self) -> np.ndarray:
         """
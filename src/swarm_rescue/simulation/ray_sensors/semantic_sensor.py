@@ -22,6 +22,7 @@ class SemanticSensor(RaySensor):
         """
         Draws the semantic sensor rays using Arcade.
         """
+        self._compute_pending_values()
         if self._disabled:
             return
 
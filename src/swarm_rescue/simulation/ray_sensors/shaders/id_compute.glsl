@@ -1,6 +1,6 @@
             #version 440
 
-            layout(local_size_x=MAX_N_RAYS) in;
+            layout(local_size_x=RAYS_PER_GROUP) in;
 
             struct HitPoint
             {
@@ -61,6 +61,18 @@
                 int inv_ids[N_SENSORS][MAX_N_INVISIBLE];
             }InvIDs;
 
+            layout(std430, binding=7) buffer hit_values
+            {
+                float values[];
+            } OutValues;
+
+            // Sensor and index in the sensor of each computed ray, the output
+            // of a ray being at its index in the table
+            layout(std430, binding=8) buffer ray_table
+            {
+                ivec2 rays[N_RAYS];
+            } RayTable;
+
             layout(std430, binding=6) buffer view_params
             {
                 float center_view_x;
@@ -75,8 +87,14 @@
 
             void main() {
 
-                int i_ray = int(gl_LocalInvocationIndex);
-                int i_sensor = int(gl_WorkGroupID);
+                int i_out = int(gl_GlobalInvocationID.x);
+                if (i_out >= N_RAYS)
+                {
+                    return;
+                }
+
+                int i_sensor = RayTable.rays[i_out].x;
+                int i_ray = RayTable.rays[i_out].y;
 
                 // SENSOR PARAMETERS
                 SensorParam s_param = Params.sensor_params[i_sensor];
@@ -123,7 +141,9 @@
                     sample_point = ivec2(mix(center, end_pos, ratio));
                     id_color_out = texelFetch(id_texture, sample_point, 0);
 
-                    id_out = int(256*256*id_color_out.z*255 + 256*id_color_out.y*255 + id_color_out.x*255);
+                    // Round each channel, the float products are not exact for large ids
+                    ivec4 id_channels = ivec4(round(id_color_out * 255.));
+                    id_out = 256*256*id_channels.z + 256*id_channels.y + id_channels.x;
 
                     if (id_out != 0)
                     {
@@ -149,6 +169,7 @@
 
                 }
 
+                // Distance in the frame of the environment
                 float dist = range;
                 if (id_out != 0)
                 {
@@ -160,8 +181,9 @@
 
                 HitPoint out_pt;
 
-                out_pt.view_pos_x = sample_point.x;
-                out_pt.view_pos_y = sample_point.y;
+                // Positions on the view at the scale of the environment
+                out_pt.view_pos_x = sample_point.x/zoom;
+                out_pt.view_pos_y = sample_point.y/zoom;
 
                 out_pt.env_pos_x = (sample_point.x - view_w/2)/zoom + center_view_x ;
                 out_pt.env_pos_y = (sample_point.y - view_h/2)/zoom + center_view_y ;
@@ -172,13 +194,17 @@
                 //float rel_pos_y = (sample_point.y - center_y)*cos(angle) + (sample_point.x - center_x)*sin(angle);
                 //out_pt.env_rel_pos_y = rel_pos_y/zoom;
 
-                out_pt.sensor_x_on_view = sensor_x_on_view ;
-                out_pt.sensor_y_on_view = sensor_y_on_view ;
+                out_pt.sensor_x_on_view = sensor_x_on_view/zoom;
+                out_pt.sensor_y_on_view = sensor_y_on_view/zoom;
 
                 out_pt.id = float(id_out);
-                out_pt.dist = dist/zoom;
+                out_pt.dist = dist;
+
+                Out.hpts[i_out] = out_pt;
 
-                Out.hpts[i_ray + i_sensor*MAX_N_RAYS] = out_pt;
+                // Only the id and the distance, for a compact readback
+                OutValues.values[2*i_out] = out_pt.id;
+                OutValues.values[2*i_out + 1] = out_pt.dist;
 
             }
 
@@ -7,6 +7,7 @@ from swarm_rescue.simulation.reporting.evaluation import EvalConfig
 from swarm_rescue.simulation.reporting.evaluation_pdf_report import EvaluationPdfReport
 from swarm_rescue.simulation.reporting.stats_computation import StatsComputation
 from swarm_rescue.simulation.reporting.team_info import TeamInfo
+from swarm_rescue.simulation.utils.step_profiler import StepProfiler
 
 
 # from datetime import datetime
@@ -39,6 +40,8 @@ class DataSaver:
         participating in the challenge.
         _result_path: The path to the directory for the current team and timestamp.
         _stats_filename: The filename of the CSV file for storing the statistics.
+        _profile_filename: The filename of the CSV file for storing the
+        timings of the step profiler.
     """
 
     def __init__(self, team_info: TeamInfo, result_path: str = None, enabled: bool = True):
@@ -60,6 +63,7 @@ class DataSaver:
             return
 
         self._stats_filename = None
+        self._profile_filename = None
 
         self._images_path = None
         if self._result_path is not None:
@@ -178,6 +182,44 @@ class DataSaver:
 
         self._add_line(data)
 
+    def save_profile(self, eval_config: EvalConfig, num_round: int,
+                     profiler: StepProfiler) -> None:
+        """
+        Saves the timings measured by the step profiler during one round to
+        a CSV file next to the stats file, with one line per phase.
+
+        Args:
+            eval_config (EvalConfig): The evaluation configuration.
+            num_round (int): The round number.
+            profiler (StepProfiler): The profiler of the round.
+        """
+        if not self._enabled:
+            return
+
+        if self._profile_filename is None:
+            self._profile_filename = (self._result_path +
+                                      f"/team{self._team_info.team_number_str_padded}"
+                                      f"_profile.csv")
+            with open(self._profile_filename, 'w') as file:
+                csv.writer(file).writerow(('Id Config', 'Map', 'Zones', 'Round',
+                                           'Nb Steps', 'Scope', 'Drone', 'Phase',
+                                           'Calls', 'Wall Time', 'CPU Time'))
+
+        with open(self._profile_filename, 'a') as file:
+            obj = csv.writer(file)
+            for scope, drone_id, phase, calls, wall_time, cpu_time in profiler.rows():
+                obj.writerow((eval_config.id_config,
+                              eval_config.map_name,
+                              eval_config.zones_name_for_filename,
+                              str(num_round),
+                              profiler.nb_steps,
+                              scope,
+                              drone_id,
+                              phase,
+                              calls,
+                              "%.6f" % wall_time,
+                              "%.6f" % cpu_time))
+
     def save_images(self, im, im_explo_lines, im_explo_zones, map_name: str,
                     zones_name: str, num_round: int) -> None:
         """
@@ -0,0 +1,215 @@
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
+
+
+class PhaseTimes:
+    """
+    The PhaseTimes class accumulates the time spent in one phase of the
+    simulation step, over all the steps of a round.
+
+    It is used as a context manager by StepProfiler:
+
+        with profiler.phase("physics"):
+            ...
+
+    The time of a phase of the simulator measured during a phase of a drone
+    solution (the rays of a lazy sensor cast when the solution reads it) is
+    not counted in the phase of the drone.
+
+    Attributes:
+        calls (int): Number of times the phase was measured.
+        wall_time (float): Accumulated wall time, in seconds.
+        cpu_time (float): Accumulated CPU time of the process, in seconds.
+    """
+
+    __slots__ = ("calls", "wall_time", "cpu_time", "_wall_start", "_cpu_start",
+                 "_profiler", "_drone_phase")
+
+    def __init__(self, profiler: Optional["StepProfiler"] = None, drone_phase: bool = False):
+        """
+        Initialize the PhaseTimes.
+
+        Args:
+            profiler (Optional[StepProfiler]): The profiler of the phase.
+            drone_phase (bool): Whether the phase is a phase of a drone solution.
+        """
+        self.calls = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+        self._profiler = profiler
+        self._drone_phase = drone_phase
+
+    def __enter__(self):
+        if self._drone_phase:
+            self._profiler.current_drone_phase = self
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, *exc):
+        wall_time = time.perf_counter() - self._wall_start
+        cpu_time = time.process_time() - self._cpu_start
+        self.wall_time += wall_time
+        self.cpu_time += cpu_time
+        self.calls += 1
+
+        if self._drone_phase:
+            self._profiler.current_drone_phase = None
+        elif self._profiler is not None and self._profiler.current_drone_phase is not None:
+            self._profiler.current_drone_phase.wall_time -= wall_time
+            self._profiler.current_drone_phase.cpu_time -= cpu_time
+            self._profiler.wall_time_in_drones += wall_time
+        return False
+
+    def __getstate__(self):
+        return self.calls, self.wall_time, self.cpu_time
+
+    def __setstate__(self, state):
+        self.calls, self.wall_time, self.cpu_time = state
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+        self._profiler = None
+        self._drone_phase = False
+
+    @property
+    def mean_wall_time(self) -> float:
+        """
+        Returns the mean wall time of one call, in seconds.
+        """
+        return self.wall_time / self.calls if self.calls else 0.0
+
+
+# Shared context manager returned when profiling is disabled
+NO_PROFILING = nullcontext()
+
+
+class StepProfiler:
+    """
+    The StepProfiler class measures where the time of a round goes.
+
+    The Playground measures the phases of its step (pre_step, apply_commands,
+    physics, ray_compute, observations, post_step, transmit_messages) and
+    GuiSR measures the code of the solution (define_message_for_all() and
+    control()) separately for each drone. The times are only accumulated,
+    so the overhead is two clock readings per phase.
+
+    The rays of the lazy sensors (see Sensor.lazy) are cast when they are
+    read, often in the control() of a drone, after the step. This time is
+    measured in the LAZY_RAY_COMPUTE phase of the simulator, and not in the
+    phase of the drone.
+
+    Example Usage:
+        profiler = StepProfiler()
+        my_gui = GuiSR(the_map=the_map, profiler=profiler)
+        my_gui.run()
+        print(profiler.summary())
+
+    Attributes:
+        phases (Dict[str, PhaseTimes]): Times of the phases of the simulator.
+        drones (Dict[int, Dict[str, PhaseTimes]]): Times of the phases of each
+            drone solution, indexed by the identifier of the drone.
+        current_drone_phase (Optional[PhaseTimes]): The phase of a drone
+            being measured, if any.
+        wall_time_in_drones (float): Wall time of the phases of the simulator
+            measured during the phases of the drones, in seconds.
+    """
+
+    STEP = "step"
+    LAZY_RAY_COMPUTE = "lazy_ray_compute"
+
+    def __init__(self):
+        self.phases: Dict[str, PhaseTimes] = {}
+        self.drones: Dict[int, Dict[str, PhaseTimes]] = {}
+        self.current_drone_phase: Optional[PhaseTimes] = None
+        self.wall_time_in_drones = 0.0
+
+    def phase(self, name: str, drone_id: Optional[int] = None) -> PhaseTimes:
+        """
+        Returns the context manager measuring a phase.
+
+        Args:
+            name (str): Name of the phase.
+            drone_id (Optional[int]): Identifier of the drone, for the phases
+                of a drone solution.
+
+        Returns:
+            PhaseTimes: The accumulated times of the phase.
+        """
+        if drone_id is None:
+            phases = self.phases
+        else:
+            phases = self.drones.setdefault(drone_id, {})
+
+        times = phases.get(name)
+        if times is None:
+            times = phases[name] = PhaseTimes(self, drone_phase=drone_id is not None)
+        return times
+
+    def reset(self) -> None:
+        """
+        Forget all the measured times.
+        """
+        self.phases.clear()
+        self.drones.clear()
+        self.wall_time_in_drones = 0.0
+
+    @property
+    def nb_steps(self) -> int:
+        """
+        Returns the number of playground steps measured.
+        """
+        step = self.phases.get(self.STEP)
+        return step.calls if step else 0
+
+    @property
+    def simulator_wall_time(self) -> float:
+        """
+        Returns the wall time spent in the playground steps, and in the
+        simulator during the phases of the drones, in seconds.
+        """
+        step = self.phases.get(self.STEP)
+        return (step.wall_time if step else 0.0) + self.wall_time_in_drones
+
+    @property
+    def drones_wall_time(self) -> float:
+        """
+        Returns the wall time spent in the code of all the drone solutions,
+        in seconds.
+        """
+        return sum(times.wall_time
+                   for phases in self.drones.values()
+                   for times in phases.values())
+
+    def rows(self) -> List[Tuple[str, str, str, int, float, float]]:
+        """
+        Returns the measured times as a list of rows: scope ('simulator' or
+        'drone'), drone identifier (empty for the simulator), phase, calls,
+        wall time and CPU time.
+
+        Returns:
+            List[Tuple]: One row per phase.
+        """
+        rows = [("simulator", "", name, times.calls, times.wall_time, times.cpu_time)
+                for name, times in self.phases.items()]
+        for drone_id, phases in self.drones.items():
+            rows += [("drone", str(drone_id), name, times.calls, times.wall_time, times.cpu_time)
+                     for name, times in phases.items()]
+        return rows
+
+    def summary(self) -> str:
+        """
+        Returns a short human readable summary of the mean times per step.
+        The 'step' phase is the whole playground step, the other phases of
+        the playground are included in it.
+
+        Returns:
+            str: The summary.
+        """
+        nb_steps = max(self.nb_steps, 1)
+        items = [f"{name}: {times.wall_time / nb_steps * 1000:.2f}"
+                 for name, times in self.phases.items()]
+        items.append(f"drones: {self.drones_wall_time / nb_steps * 1000:.2f}")
+        return ", ".join(items) + " (ms/step)"
@@ -76,12 +76,14 @@ class GaussianNoise:
 
         self._shape: Optional[tuple] = None
 
-    def add_noise(self, values: Union[np.ndarray, float]):
+    def add_noise(self, values: Union[np.ndarray, float], random_generator=None):
         """
         Add Gaussian noise to the input values.
 
         Args:
             values (np.ndarray or float): Input values.
+            random_generator: np.random.RandomState to draw the noise from.
+                Defaults to the numpy random generator.
 
         Returns:
             np.ndarray or float: Noisy values.
@@ -89,6 +91,9 @@ class GaussianNoise:
         if values is None:
             return None
 
+        if random_generator is None:
+            random_generator = np.random
+
         values2 = values
         gaussian_noise: Optional[np.ndarray | float] = None
         if isinstance(values, np.ndarray):
@@ -100,12 +105,12 @@ class GaussianNoise:
                 self._shape = values2.shape
             assert (self._shape == values2.shape)
 
-            gaussian_noise = np.random.normal(loc=self._mean_noise,
-                                              scale=self._std_dev_noise,
-                                              size=values2.shape)
+            gaussian_noise = random_generator.normal(loc=self._mean_noise,
+                                                     scale=self._std_dev_noise,
+                                                     size=values2.shape)
         elif isinstance(values, float):
-            gaussian_noise = np.random.normal(loc=self._mean_noise,
-                                              scale=self._std_dev_noise)
+            gaussian_noise = random_generator.normal(loc=self._mean_noise,
+                                                     scale=self._std_dev_noise)
         return values2 + gaussian_noise
 
 
@@ -0,0 +1,306 @@
+"""
+Benchmark of the simulator.
+
+Runs fixed-seed scenarios on the maps of the 'maps' package, for several
+numbers of drones and the backends of the ray sensors (compute shader, CPU
+sampling of the ID view and geometric intersection), and writes the results as JSON: steps per second, mean time per step
+of each phase of the simulator and of the drones, and peak memory.
+
+Each scenario runs in its own process, so that the peak memory of one
+scenario does not depend on the previous ones.
+
+Example Usage:
+    python -m swarm_rescue.tools.bench --maps MapIntermediate01 MapMedium01 \\
+        --drones 10 50 --backends shader cpu --steps 200 --output bench.json
+"""
+import argparse
+import gc
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+import pymunk
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.drone.drone_motionless import DroneMotionless
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.ray_sensors.ray_compute import RayCompute
+from swarm_rescue.simulation.utils.misc_data import MiscData
+from swarm_rescue.simulation.utils.step_profiler import StepProfiler
+from swarm_rescue.solutions.my_drone_random import MyDroneRandom
+
+from swarm_rescue.maps.map_intermediate_01 import MapIntermediate01
+from swarm_rescue.maps.map_intermediate_02 import MapIntermediate02
+from swarm_rescue.maps.map_final_2022_23 import MapFinal2022_23
+from swarm_rescue.maps.map_final_2023_24_01 import MapFinal_2023_24_01
+from swarm_rescue.maps.map_final_2023_24_02 import MapFinal_2023_24_02
+from swarm_rescue.maps.map_final_2023_24_03 import MapFinal_2023_24_03
+from swarm_rescue.maps.map_final_2024_25_01 import MapFinal_2024_25_01
+from swarm_rescue.maps.map_final_2024_25_02 import MapFinal_2024_25_02
+from swarm_rescue.maps.map_final_2024_25_03 import MapFinal_2024_25_03
+from swarm_rescue.maps.map_medium_01 import MapMedium01
+from swarm_rescue.maps.map_medium_02 import MapMedium02
+from swarm_rescue.maps.map_random import MapRandom
+from swarm_rescue.maps.map_test_special_zones import MapTestSpecialZones
+
+MAP_CLASSES: Dict[str, Type[MapAbstract]] = {
+    map_class.__name__: map_class
+    for map_class in (MapIntermediate01, MapIntermediate02, MapMedium01, MapMedium02,
+                      MapFinal2022_23, MapFinal_2023_24_01, MapFinal_2023_24_02,
+                      MapFinal_2023_24_03, MapFinal_2024_25_01, MapFinal_2024_25_02,
+                      MapFinal_2024_25_03, MapRandom, MapTestSpecialZones)
+}
+
+DRONE_TYPES: Dict[str, Type[DroneAbstract]] = {
+    "random": MyDroneRandom,
+    "motionless": DroneMotionless,
+}
+
+BACKENDS = RayCompute.BACKENDS
+
+Scenario = Tuple[str, str, int, str, int, int, int]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Returns the peak resident memory of the current process, in MB, or None
+    if it cannot be measured on this platform.
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    if platform.system() == "Darwin":
+        return max_rss / (1024 * 1024)
+    return max_rss / 1024
+
+
+def set_number_drones(the_map: MapAbstract, number_drones: int,
+                      drone_type: Type[DroneAbstract], seed: int) -> List[DroneAbstract]:
+    """
+    Returns the drones of the map, after adding or removing drones to reach
+    'number_drones'. The extra drones are placed at random positions of the
+    map where they do not overlap a wall or another entity.
+
+    Args:
+        the_map (MapAbstract): The map.
+        number_drones (int): The number of drones wanted.
+        drone_type (Type[DroneAbstract]): The class of the extra drones.
+        seed (int): Seed of the positions of the extra drones.
+
+    Returns:
+        List[DroneAbstract]: The drones in the playground.
+    """
+    playground = the_map.playground
+    drones = list(the_map.drones)
+
+    for drone in drones[number_drones:]:
+        playground.remove(drone, definitive=True)
+    drones = drones[:number_drones]
+
+    rng = random.Random(seed)
+    width, height = the_map.size_area
+    misc_data = MiscData(size_area=the_map.size_area,
+                         number_drones=number_drones,
+                         max_timestep_limit=the_map.max_timestep_limit,
+                         max_walltime_limit=the_map.max_walltime_limit)
+    while len(drones) < number_drones:
+        drone = drone_type(identifier=len(drones), misc_data=misc_data)
+        for _ in range(1000):
+            position = (rng.uniform(-width / 2 + 20, width / 2 - 20),
+                        rng.uniform(-height / 2 + 20, height / 2 - 20))
+            obstacles = [query for query in
+                         playground.space.point_query(position, 2 * drone.base.radius,
+                                                      pymunk.ShapeFilter())
+                         if not query.shape.sensor]
+            if not obstacles:
+                coordinates = (position, rng.uniform(-np.pi, np.pi))
+                break
+        else:
+            raise ValueError(f"No free position for {number_drones} drones "
+                             f"in {type(the_map).__name__}")
+        playground.add(drone, coordinates)
+        drones.append(drone)
+
+    return drones
+
+
+def run_scenario(map_name: str, drone_type_name: str, number_drones: int,
+                 backend: str, nb_steps: int, warmup_steps: int = 10,
+                 seed: int = 0) -> Dict[str, Any]:
+    """
+    Runs one scenario in the current process and returns its results.
+
+    The drones send their messages and are controlled at each step, as in
+    GuiSR, but nothing is drawn and the explored map is not updated.
+
+    Args:
+        map_name (str): Name of the map class.
+        drone_type_name (str): Key of the drone class in DRONE_TYPES.
+        number_drones (int): Number of drones.
+        backend (str): 'shader', 'cpu' or 'geometric', the backend of the
+            ray sensors.
+        nb_steps (int): Number of measured steps.
+        warmup_steps (int): Number of steps before the measure.
+        seed (int): Seed of the random generators.
+
+    Returns:
+        Dict[str, Any]: The parameters and the results of the scenario.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+
+    random.seed(seed)
+    np.random.seed(seed)
+
+    drone_type = DRONE_TYPES[drone_type_name]
+    the_map = MAP_CLASSES[map_name](drone_type=drone_type)
+    playground = the_map.playground
+    playground.ray_backend = backend
+    drones = set_number_drones(the_map, number_drones, drone_type, seed)
+
+    profiler = StepProfiler()
+    playground.profiler = profiler
+
+    start = 0.0
+    for step in range(warmup_steps + nb_steps):
+        if step == warmup_steps:
+            profiler.reset()
+            start = time.perf_counter()
+
+        messages = {}
+        commands = {}
+        for drone in drones:
+            with profiler.phase("define_message_for_all", drone.identifier):
+                messages[drone] = {drone.communicator: (None, drone.define_message_for_all())}
+        for drone in drones:
+            with profiler.phase("control", drone.identifier):
+                commands[drone] = drone.control()
+
+        playground.step(all_commands=commands, all_messages=messages)
+
+    wall_time = time.perf_counter() - start
+
+    result = {
+        "map": map_name,
+        "drone_type": drone_type_name,
+        "number_drones": number_drones,
+        "backend": backend,
+        "steps": nb_steps,
+        "seed": seed,
+        "wall_time": wall_time,
+        "steps_per_s": nb_steps / wall_time if wall_time > 0 else None,
+        "phases_ms_per_step": {name: times.wall_time / max(nb_steps, 1) * 1000
+                               for name, times in profiler.phases.items()},
+        "drones_ms_per_step": profiler.drones_wall_time / max(nb_steps, 1) * 1000,
+        "peak_rss_mb": peak_rss_mb(),
+        "gl_renderer": playground.ctx.info.RENDERER,
+    }
+
+    playground.cleanup()
+    playground.close_window()
+    gc.collect()
+
+    return result
+
+
+def _run_scenario_in_worker(scenario: Scenario) -> Dict[str, Any]:
+    """
+    Runs one scenario in a worker process of run_benchmark().
+
+    Args:
+        scenario (Scenario): The arguments of run_scenario().
+
+    Returns:
+        Dict[str, Any]: The results of the scenario.
+    """
+    return run_scenario(*scenario)
+
+
+def run_benchmark(map_names: List[str], drone_type_name: str, numbers_drones: List[int],
+                  backends: List[str], nb_steps: int, warmup_steps: int = 10,
+                  seed: int = 0) -> Dict[str, Any]:
+    """
+    Runs all the combinations of maps, numbers of drones and backends, each
+    one in a new process.
+
+    Args:
+        map_names (List[str]): Names of the map classes.
+        drone_type_name (str): Key of the drone class in DRONE_TYPES.
+        numbers_drones (List[int]): Numbers of drones.
+        backends (List[str]): Backends of the ray sensors.
+        nb_steps (int): Number of measured steps of each scenario.
+        warmup_steps (int): Number of steps before the measure.
+        seed (int): Seed of the random generators.
+
+    Returns:
+        Dict[str, Any]: The description of the environment and the list of
+        the results of the scenarios.
+    """
+    scenarios: List[Scenario] = [(map_name, drone_type_name, number_drones, backend,
+                                  nb_steps, warmup_steps, seed)
+                                 for map_name in map_names
+                                 for number_drones in numbers_drones
+                                 for backend in backends]
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=1, maxtasksperchild=1) as pool:
+        for scenario, result in zip(scenarios, pool.imap(_run_scenario_in_worker, scenarios)):
+            print(f"{scenario[0]}, {scenario[2]} drones, {scenario[3]}: "
+                  f"{result['steps_per_s']:.1f} steps/s", file=sys.stderr)
+            results.append(result)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "numpy": np.__version__,
+        },
+        "results": results,
+    }
+
+
+def main():
+    """
+    Parses the command line, runs the benchmark and writes the JSON output.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark of the swarm-rescue simulator")
+    parser.add_argument("--maps", nargs="+", default=list(MAP_CLASSES), choices=list(MAP_CLASSES),
+                        help="Maps to run (default: all the maps)")
+    parser.add_argument("--drone_type", default="random", choices=list(DRONE_TYPES),
+                        help="Controller of the drones")
+    parser.add_argument("--drones", nargs="+", type=int, default=[10, 50, 200],
+                        help="Numbers of drones")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS,
+                        help="Backends of the ray sensors")
+    parser.add_argument("--steps", type=int, default=200, help="Number of measured steps")
+    parser.add_argument("--warmup", type=int, default=10, help="Number of steps before the measure")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generators")
+    parser.add_argument("--output", "-o", type=str, help="JSON output file (default: standard output)")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.maps, args.drone_type, args.drones, args.backends,
+                           args.steps, args.warmup, args.seed)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+import pathlib
+import sys
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.communicator import Communicator
+from swarm_rescue.simulation.drone.controller import Controller
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.drone.sensor import Sensor
+from swarm_rescue.simulation.ray_sensors.external_sensor import ExternalSensor
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        pass
+
+
+def test_devices_of_the_agent():
+    drone = MyDrone(identifier=0, misc_data=MiscData(size_area=(500, 400), number_drones=1))
+    devices = drone.base.devices
+
+    assert drone.sensors == [dev for dev in devices if isinstance(dev, Sensor)]
+    assert drone.external_sensors == [dev for dev in devices if isinstance(dev, ExternalSensor)]
+    assert drone.controllers == [dev for dev in devices if isinstance(dev, Controller)]
+    assert drone.communicators == [drone.communicator]
+    assert set(drone.default_commands) == {"forward", "lateral", "rotation", "grasper"}
+
+    # The lists follow the devices added to the base
+    communicator = Communicator(transmission_range=100)
+    drone.base.add_device(communicator)
+    assert drone.communicators == [drone.communicator, communicator]
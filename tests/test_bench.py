@@ -0,0 +1,20 @@
+import pathlib
+import sys
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.tools.bench import run_scenario
+
+
+def test_run_scenario_cpu_backend_with_extra_drones():
+    result = run_scenario("MapIntermediate01", "motionless", number_drones=3,
+                          backend="cpu", nb_steps=3, warmup_steps=1)
+
+    assert result["number_drones"] == 3
+    assert result["backend"] == "cpu"
+    assert result["steps_per_s"] > 0
+    assert "ray_compute" in result["phases_ms_per_step"]
+    assert "physics" in result["phases_ms_per_step"]
@@ -0,0 +1,124 @@
+import gc
+import pathlib
+import sys
+import numpy as np
+import pytest
+
+from typing import List, Optional, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.communication_graph import CommunicationGraph
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        return f"drone {self.identifier}"
+
+    def control(self):
+        return {"forward": 0.5, "lateral": 0.0, "rotation": 0.2, "grasper": 0}
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract] = MyDrone, ray_backend: Optional[str] = None):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (1000, 400)
+
+        self._playground = ClosedPlayground(size=self._size_area, ray_backend=ray_backend)
+
+        # POSITIONS OF THE DRONES
+        # The drones are in range (250 pixels) of their neighbours only
+        self._number_drones = 5
+        self._drones_pos = [((-400, 0), 0), ((-240, 50), 0), ((-100, 0), 0), ((150, 0), 0), ((300, -50), 0)]
+        self._drones: List[DroneAbstract] = []
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def test_communication_graph_in_playground():
+    the_map = MyMap()
+    playground = the_map.playground
+    comms = [drone.communicator for drone in the_map.drones]
+
+    for _ in range(5):
+        all_messages = {drone: {drone.communicator: (None, drone.define_message_for_all())}
+                        for drone in the_map.drones}
+        playground.step(all_messages=all_messages)
+
+        # The graph is only used during the step
+        assert not playground.communication_graph.enabled
+        assert playground.communication_graph.comms_in_range(comms[0]) is None
+
+        for comm in comms:
+            expected = [other for other in comms if other is not comm and comm.in_transmission_range(other)]
+            assert comm.comms_in_range == expected
+            assert [sender for sender, _ in comm.received_messages] == expected
+
+    assert comms[1] in comms[0].comms_in_range
+    assert comms[2] not in comms[0].comms_in_range
+
+    playground.close_window()
+    gc.collect()
+
+
+@pytest.mark.parametrize("n_comms", [60, 500])
+def test_kd_tree_matches_matrix(n_comms):
+    pytest.importorskip("scipy")
+
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(-1000, 1000, size=(n_comms, 2))
+    ranges = rng.choice([150.0, 250.0, 400.0], size=n_comms)
+
+    in_range = CommunicationGraph._get_in_range_matrix(positions, ranges)
+    assert np.any(in_range)
+    assert np.array_equal(CommunicationGraph._get_in_range_kd_tree(positions, ranges), in_range)
+
+
+def expected_messages(drones: List[DroneAbstract]):
+    # Each communicator keeps the message of the last sender in range
+    messages = {drone: {} for drone in drones}
+    for sender in drones:
+        for drone in drones:
+            comm = drone.communicator
+            if (drone is not sender and not comm._disabled and not sender.communicator._disabled
+                    and comm.in_transmission_range(sender.communicator)):
+                messages[drone] = {comm: (sender.communicator, sender.define_message_for_all())}
+    return messages
+
+
+def test_broadcast_messages():
+    the_map = MyMap()
+    playground = the_map.playground
+    comms = [drone.communicator for drone in the_map.drones]
+
+    all_messages = {drone: {drone.communicator: (None, drone.define_message_for_all())}
+                    for drone in the_map.drones}
+    messages, _ = playground.step(all_messages=all_messages)
+    assert messages == expected_messages(the_map.drones)
+
+    # A disabled communicator neither sends nor receives
+    comms[1].disable()
+    messages = playground._transmit_messages(all_messages)
+    assert messages[the_map.drones[0]] == {}
+    assert messages[the_map.drones[1]] == {}
+    assert messages == expected_messages(the_map.drones)
+
+    playground.close_window()
+    gc.collect()
@@ -0,0 +1,109 @@
+import gc
+import pathlib
+import sys
+import numpy as np
+import pytest
+
+from typing import List, Optional, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.communicator import Communicator
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.drone.message_codec import PickleCodec
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        return {"id": self.identifier, "map": np.full((20, 20), self.identifier, dtype=np.uint8)}
+
+    def control(self):
+        pass
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract] = MyDrone, ray_backend: Optional[str] = None):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (600, 400)
+
+        self._playground = ClosedPlayground(size=self._size_area, ray_backend=ray_backend)
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = 3
+        self._drones_pos = [((-100, 0), 0), ((0, 0), 0), ((100, 0), 0)]
+        self._drones: List[DroneAbstract] = []
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def test_pickle_codec():
+    codec = PickleCodec()
+    msg = (3, {"map": np.arange(100, dtype=np.float32)})
+
+    data = codec.encode(msg)
+    decoded = codec.decode(data)
+
+    assert isinstance(data, bytes)
+    assert len(data) < 600
+    assert decoded[0] == 3
+    assert np.array_equal(decoded[1]["map"], msg[1]["map"])
+
+
+def test_byte_budget_is_positive():
+    with pytest.raises(ValueError):
+        Communicator(byte_budget=-1)
+
+
+def test_bytes_sent_and_received():
+    the_map = MyMap()
+    playground = the_map.playground
+    comms = [drone.communicator for drone in the_map.drones]
+    for comm in comms:
+        comm.codec = PickleCodec()
+
+    all_messages = {drone: {drone.communicator: (None, drone.define_message_for_all())}
+                    for drone in the_map.drones}
+    messages, _ = playground.step(all_messages=all_messages)
+
+    size = len(PickleCodec().encode(the_map.drones[0].define_message_for_all()))
+    assert [comm.bytes_sent for comm in comms] == [size] * 3
+    assert [comm.bytes_received for comm in comms] == [2 * size] * 3
+
+    # The receivers get a copy of the message
+    sender, msg = messages[the_map.drones[0]][comms[0]]
+    assert msg is not all_messages[sender.agent][sender][1]
+    assert np.array_equal(msg["map"], all_messages[sender.agent][sender][1]["map"])
+
+    # A message over the budget is not sent
+    comms[0].byte_budget = size - 1
+    playground.step(all_messages=all_messages)
+    assert comms[0].bytes_sent == 0
+    assert comms[1].bytes_received == size
+    assert [sender for sender, _ in comms[1].received_messages] == [comms[2]]
+
+    # Without codec, the messages are sent as they are and not counted
+    for comm in comms:
+        comm.codec = None
+    messages, _ = playground.step(all_messages=all_messages)
+    assert [comm.bytes_sent for comm in comms] == [0] * 3
+    sender, msg = messages[the_map.drones[0]][comms[0]]
+    assert msg is all_messages[sender.agent][sender][1]
+
+    playground.close_window()
+    gc.collect()
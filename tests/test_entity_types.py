@@ -0,0 +1,134 @@
+import pathlib
+import sys
+import numpy as np
+
+from typing import List, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.elements.normal_wall import NormalBox
+from swarm_rescue.simulation.elements.rescue_center import RescueCenter
+from swarm_rescue.simulation.elements.wounded_person import WoundedPerson
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.ray_sensors.entity_type import TypeEntity, get_type_entity
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        pass
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract] = MyDrone):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (400, 300)
+
+        self._playground = ClosedPlayground(size=self._size_area)
+
+        self.box = NormalBox(up_left_point=(50, 100), width=40, height=30)
+        self._playground.add(self.box, self.box.wall_coordinates)
+
+        self.rescue_center = RescueCenter(size=(50, 50))
+        self._playground.add(self.rescue_center, ((150, -100), 0))
+
+        self.wounded_person = WoundedPerson(rescue_center=self.rescue_center)
+        self._playground.add(self.wounded_person, ((-30, 0), 0))
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = 1
+        self._drones_pos = [((0, 0), 0)]
+        self._drones: List[DroneAbstract] = []
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def test_entity_types_of_uids():
+    the_map = MyMap()
+    playground = the_map.playground
+    drone = the_map.drones[0]
+
+    entities = [the_map.box, the_map.rescue_center, the_map.wounded_person, drone.base]
+    unknown_uid = 1 + max(playground._uids_to_entities)
+    types, grasped = playground.get_entity_types(np.array([entity.uid for entity in entities]
+                                                          + [unknown_uid]))
+
+    assert [TypeEntity(int(value)) for value in types[:-1]] == [
+        TypeEntity.WALL, TypeEntity.RESCUE_CENTER, TypeEntity.WOUNDED_PERSON, TypeEntity.DRONE]
+    assert types[-1] == 0
+    assert not grasped.any()
+
+    # The table is the same as the classification of each entity
+    uids = np.array(list(playground._uids_to_entities))
+    types, _ = playground.get_entity_types(uids)
+    for uid, value in zip(uids, types):
+        assert get_type_entity(playground.get_entity_from_uid(uid)).value == value
+
+
+def test_entity_types_follow_grasping_and_removal():
+    the_map = MyMap()
+    playground = the_map.playground
+    drone = the_map.drones[0]
+    wounded_person = the_map.wounded_person
+    playground.get_entity_types(np.array([wounded_person.uid]))
+
+    drone.grasper._can_grasp = True
+    drone.grasper.grasps(wounded_person)
+    _, grasped = playground.get_entity_types(np.array([wounded_person.uid]))
+    assert grasped[0]
+
+    drone.grasper.release(wounded_person)
+    _, grasped = playground.get_entity_types(np.array([wounded_person.uid]))
+    assert not grasped[0]
+
+    playground.remove(the_map.box, definitive=True)
+    types, _ = playground.get_entity_types(np.array([the_map.box.uid]))
+    assert types[0] == 0
+
+
+def test_structured_output_of_the_semantic_sensor():
+    the_map = MyMap()
+    playground = the_map.playground
+    semantic = the_map.drones[0].semantic()
+    playground.step()
+    hitpoints = semantic._hitpoints
+
+    np.random.seed(0)
+    semantic.update()
+    detections = semantic.get_sensor_values()
+
+    semantic.structured_output = True
+    assert len(semantic.get_sensor_values()) == semantic.resolution
+    semantic.update_hitpoints(hitpoints)
+    np.random.seed(0)
+    semantic.update()
+    values = semantic.get_sensor_values()
+
+    assert values.dtype == semantic.DTYPE
+    assert len(values) == len(detections) > 0
+    assert np.array_equal(values["distance"], [data.distance for data in detections])
+    assert np.array_equal(values["angle"], [data.angle for data in detections])
+    assert np.array_equal(values["entity_type"], [data.entity_type.value for data in detections])
+    assert np.array_equal(values["grasped"], [data.grasped for data in detections])
+    assert np.array_equal(semantic.ray_angles[values["ray"]], values["angle"])
+
+    wounded = values[values["entity_type"] == TypeEntity.WOUNDED_PERSON.value]
+    assert len(wounded) > 0
@@ -0,0 +1,136 @@
+import pathlib
+import sys
+import numpy as np
+
+from typing import List, Optional, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.elements.normal_wall import NormalBox
+from swarm_rescue.simulation.elements.rescue_center import RescueCenter
+from swarm_rescue.simulation.elements.wounded_person import WoundedPerson
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        pass
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract] = MyDrone, ray_backend: Optional[str] = None):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (500, 400)
+
+        self._playground = ClosedPlayground(size=self._size_area, ray_backend=ray_backend)
+
+        self.rescue_center = RescueCenter(size=(60, 60))
+        self._playground.add(self.rescue_center, ((180, 140), 0))
+
+        self.box = NormalBox(up_left_point=(60, -60), width=40, height=80)
+        self._playground.add(self.box, self.box.wall_coordinates)
+
+        self.wounded_person = WoundedPerson(rescue_center=self.rescue_center)
+        self._playground.add(self.wounded_person, ((-100, 100), 0))
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = 1
+        self._drones_pos = [((-60, -40), 0.3)]
+        self._drones: List[DroneAbstract] = []
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def hitpoints_of(the_map):
+    return [sensor._hitpoints.copy() for sensor in the_map.playground.ray_compute._sensors]
+
+
+def test_geometric_backend_matches_cpu_backend():
+    the_map = MyMap(ray_backend="cpu")
+    playground = the_map.playground
+    playground.step()
+    cpu_hitpoints = hitpoints_of(the_map)
+
+    playground.ray_backend = "geometric"
+    assert not playground.use_shaders
+    playground.step()
+    geometric_hitpoints = hitpoints_of(the_map)
+
+    for cpu, geometric in zip(cpu_hitpoints, geometric_hitpoints):
+        assert cpu.shape == geometric.shape
+        # Rays are sampled every pixel in the ID view
+        assert np.median(np.abs(cpu[:, 9] - geometric[:, 9])) < 1.5
+        assert np.mean(cpu[:, 8] == geometric[:, 8]) > 0.95
+        assert np.allclose(cpu[:, 6:8], geometric[:, 6:8])
+
+    lidar_values = the_map.drones[0].lidar().get_sensor_values()
+    assert not np.any(np.isnan(lidar_values))
+
+    detected_ids = set(np.concatenate([hitpoints[:, 8] for hitpoints in geometric_hitpoints]).astype(int))
+    assert the_map.drones[0].base.uid not in detected_ids
+    assert {the_map.box.uid, the_map.wounded_person.uid} <= detected_ids
+
+
+def test_geometric_backend_without_id_view():
+    the_map = MyMap(ray_backend="geometric")
+    playground = the_map.playground
+    ray_compute = playground.ray_compute
+    assert ray_compute.backend == "geometric"
+    assert ray_compute._id_view is None
+
+    playground.step()
+    hitpoints = hitpoints_of(the_map)[0]
+    sensor = ray_compute._sensors[0]
+    position = np.asarray(sensor.position)
+
+    # The environment position of the hitpoints is at their distance
+    distances = np.linalg.norm(hitpoints[:, 2:4] - position, axis=1)
+    assert np.allclose(distances, hitpoints[:, 9])
+
+    # Switching to a backend sampling the ID view creates it
+    playground.ray_backend = "cpu"
+    assert ray_compute._id_view is not None
+    assert ray_compute.use_shader is False
+
+
+def test_geometric_caches_forget_removed_entities():
+    the_map = MyMap(ray_backend="geometric")
+    playground = the_map.playground
+    caster = playground.ray_compute._geometric_ray_caster
+    playground.step()
+
+    box_shapes = the_map.box.pm_shapes
+    assert all(shape in caster._shape_uids for shape in box_shapes)
+    assert all(shape in caster._static_edges for shape in box_shapes)
+
+    # A removed entity can come back, its geometry stays cached
+    playground.remove(the_map.box)
+    playground.step()
+    assert all(shape in caster._shape_uids for shape in box_shapes)
+
+    playground.remove(the_map.box, definitive=True)
+    playground.remove(the_map.wounded_person, definitive=True)
+    playground.step()
+    removed_shapes = box_shapes + the_map.wounded_person.pm_shapes
+    for cache in (caster._shape_uids, caster._local_vertices, caster._static_edges):
+        assert not any(shape in cache for shape in removed_shapes)
+    assert len(caster._shape_uids) == len(playground.space.shapes)
@@ -0,0 +1,78 @@
+import pathlib
+import sys
+import numpy as np
+
+from typing import List, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.gui_sr import GuiSR
+from swarm_rescue.simulation.gui_map.headless_runner import HeadlessRunner
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        command = {"forward": 1.0,
+                   "lateral": 0.2,
+                   "rotation": 0.1,
+                   "grasper": 0}
+        return command
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract]):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (300, 300)
+        self._max_timestep_limit = 30
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = 2
+        self._drones_pos = [((-50, 0), 0), ((50, 0), 0)]
+        self._drones: List[DroneAbstract] = []
+
+        self._playground = ClosedPlayground(size=self._size_area)
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones,
+                             max_timestep_limit=self._max_timestep_limit,
+                             max_walltime_limit=self._max_walltime_limit)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def test_headless_runner_same_result_as_gui():
+    the_map_gui = MyMap(drone_type=MyDrone)
+    gui = GuiSR(the_map=the_map_gui, headless=True)
+    gui.run()
+
+    the_map_fast = MyMap(drone_type=MyDrone)
+    runner = HeadlessRunner(the_map=the_map_fast)
+    runner.run()
+
+    assert runner.elapsed_timestep == gui.elapsed_timestep == 30
+    assert runner.rescued_number == gui.rescued_number
+    assert runner.mean_drones_health == gui.mean_drones_health
+    assert runner.percent_drones_destroyed == gui.percent_drones_destroyed
+    assert runner.last_image is not None
+    assert runner.last_image.shape == gui.last_image.shape
+
+    for drone_gui, drone_fast in zip(the_map_gui.drones, the_map_fast.drones):
+        assert np.allclose(drone_gui.true_position(), drone_fast.true_position())
+        assert np.isclose(drone_gui.true_angle(), drone_fast.true_angle())
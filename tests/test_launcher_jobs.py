@@ -0,0 +1,55 @@
+import pathlib
+import sys
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.launcher import Launcher
+
+EVAL_PLAN = """
+stat_saving_enabled: false
+video_capture_enabled: false
+
+evaluation_plan:
+  - map_name: MapTestSpecialZones
+    nb_rounds: 3
+    config_weight: 1
+    zones_config: []
+"""
+
+# Results of a round which do not depend on the walltime: the health of the
+# drones is lost at most once per second of walltime in a collision
+DETERMINISTIC_RESULTS = {"percent_drones_destroyed": 0,
+                         "elapsed_timestep": 2,
+                         "full_rescue_timestep": 3,
+                         "score_exploration": 4,
+                         "rescued_number": 5,
+                         "has_crashed": 9}
+
+
+def run_launcher(config_path: str, jobs: int):
+    launcher = Launcher(config_path=config_path)
+    results = []
+
+    def process_round_result(eval_config, num_round, result):
+        results.append((eval_config.map_name, num_round,
+                        [result[index] for index in DETERMINISTIC_RESULTS.values()],
+                        launcher.number_drones))
+        return False
+
+    launcher._process_round_result = process_round_result
+    assert launcher.go(headless=True, fast=True, jobs=jobs, seed=0)
+    return results
+
+
+def test_jobs_give_the_same_results(tmp_path):
+    config_path = tmp_path / "eval_plan.yml"
+    config_path.write_text(EVAL_PLAN)
+
+    sequential_results = run_launcher(str(config_path), jobs=1)
+    parallel_results = run_launcher(str(config_path), jobs=2)
+
+    assert [num_round for _, num_round, _, _ in sequential_results] == [1, 2, 3]
+    assert parallel_results == sequential_results
@@ -0,0 +1,233 @@
+import gc
+import pathlib
+import sys
+import numpy as np
+import pytest
+
+from typing import List, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.elements.normal_wall import NormalBox
+from swarm_rescue.simulation.elements.rescue_center import RescueCenter
+from swarm_rescue.simulation.elements.wounded_person import WoundedPerson
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.ray_sensors.drone_semantic_sensor import DroneSemanticSensor
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        command = {"forward": 1.0,
+                   "lateral": 0.0,
+                   "rotation": 0.5,
+                   "grasper": 0}
+        return command
+
+
+class MyMap(MapAbstract):
+    def __init__(self, ray_backend: str, drone_type: Type[DroneAbstract] = MyDrone):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (400, 400)
+
+        self._playground = ClosedPlayground(size=self._size_area, ray_backend=ray_backend)
+        box = NormalBox(up_left_point=(-100, 100), width=200, height=20)
+        self._playground.add(box, box.wall_coordinates)
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = 2
+        self._drones_pos = [((0, 0), 0), ((-60, -60), 1.0)]
+        self._drones: List[DroneAbstract] = []
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def run_lazy_map(ray_backend: str, read_semantic: bool, seed: int = 3, nb_steps: int = 5):
+    np.random.seed(seed)
+    the_map = MyMap(ray_backend)
+    playground = the_map.playground
+    for drone in the_map.drones:
+        for sensor in drone.sensors:
+            sensor.lazy = True
+
+    commands = {drone: drone.control() for drone in the_map.drones}
+    lidar_values = []
+    for _ in range(nb_steps):
+        playground.step(all_commands=commands)
+        for drone in the_map.drones:
+            if read_semantic:
+                drone.semantic_values()
+            lidar_values.append(drone.lidar_values().copy())
+
+    return lidar_values
+
+
+def test_lazy_sensor_is_computed_when_read():
+    for ray_backend in ("cpu", "shader"):
+        the_map = MyMap(ray_backend)
+        playground = the_map.playground
+        drone = the_map.drones[0]
+        drone.lidar().lazy = True
+
+        commands = {drone: drone.control() for drone in the_map.drones}
+        playground.step(all_commands=commands)
+        assert drone.lidar()._hitpoints is None
+        assert drone.semantic()._hitpoints is not None
+
+        lidar_values = drone.lidar_values()
+        assert drone.lidar()._hitpoints is not None
+        assert np.any(lidar_values < drone.lidar().max_range)
+        # The rays are not cast again at the next read
+        assert drone.lidar_values() is lidar_values
+
+        playground.step(all_commands=commands)
+        assert drone.lidar_values() is not lidar_values
+
+
+def run_map_distances(lazy: bool, nb_steps: int = 4):
+    the_map = MyMap("cpu")
+    playground = the_map.playground
+    for drone in the_map.drones:
+        drone.lidar().lazy = lazy
+        drone.semantic().lazy = lazy
+
+    commands = {drone: drone.control() for drone in the_map.drones}
+    distances = []
+    for _ in range(nb_steps):
+        playground.step(all_commands=commands)
+        for drone in the_map.drones:
+            drone.lidar_values()
+            drone.semantic_values()
+            distances.append((drone.lidar()._hitpoints[:, 9].copy(),
+                              drone.semantic()._hitpoints[:, 9].copy()))
+
+    return distances
+
+
+def test_lazy_sensors_see_the_same_hitpoints():
+    eager_distances = run_map_distances(lazy=False)
+    lazy_distances = run_map_distances(lazy=True)
+    for eager, lazy in zip(eager_distances, lazy_distances):
+        assert np.array_equal(eager[0], lazy[0])
+        assert np.array_equal(eager[1], lazy[1])
+
+
+def test_noise_of_lazy_sensors_does_not_depend_on_other_reads():
+    lidar_values = run_lazy_map("cpu", read_semantic=False)
+    lidar_values_with_semantic = run_lazy_map("cpu", read_semantic=True)
+    for values, values_with_semantic in zip(lidar_values, lidar_values_with_semantic):
+        assert np.array_equal(values, values_with_semantic)
+
+
+def test_stateful_sensors_stay_eager():
+    the_map = MyMap("cpu")
+    playground = the_map.playground
+    drone = the_map.drones[0]
+    drone.odometer().lazy = True
+    drone.gps().lazy = True
+
+    commands = {drone: drone.control() for drone in the_map.drones}
+    for _ in range(3):
+        playground.step(all_commands=commands)
+        assert not drone.odometer().values_pending
+        assert not drone.gps().values_pending
+
+
+class MapWithWoundedPerson(MyMap):
+    def __init__(self, ray_backend: str):
+        super().__init__(ray_backend)
+        self.rescue_center = RescueCenter(size=(50, 50))
+        self._playground.add(self.rescue_center, ((150, -150), 0))
+        self.wounded_person = WoundedPerson(rescue_center=self.rescue_center)
+        self._playground.add(self.wounded_person, ((40, 0), 0))
+
+
+def run_map_with_removal(ray_backend: str, lazy: bool, nb_steps: int = 3):
+    the_map = MapWithWoundedPerson(ray_backend)
+    playground = the_map.playground
+    drone = the_map.drones[0]
+    drone.lidar().lazy = lazy
+    drone.semantic().lazy = lazy
+
+    # The wounded person is removed at the end of the second step, before
+    # the sensors are read
+    post_step = playground._post_step
+
+    def post_step_removing_wounded_person():
+        post_step()
+        if playground.timestep == 1:
+            playground.remove(the_map.wounded_person, definitive=True)
+
+    playground._post_step = post_step_removing_wounded_person
+
+    values = []
+    for _ in range(nb_steps):
+        playground.step()
+        semantic = drone.semantic_values()
+        drone.lidar_values()
+        values.append((drone.lidar()._hitpoints[:, 9].copy(),
+                       [(data.angle, data.entity_type) for data in semantic]))
+
+    playground.close_window()
+    gc.collect()
+    return values
+
+
+@pytest.mark.parametrize("ray_backend", ["cpu", "geometric"])
+def test_lazy_sensors_observe_the_step_before_a_removal(ray_backend):
+    eager_values = run_map_with_removal(ray_backend, lazy=False)
+    lazy_values = run_map_with_removal(ray_backend, lazy=True)
+
+    wounded_person = DroneSemanticSensor.TypeEntity.WOUNDED_PERSON
+    assert [wounded_person in [entity_type for _, entity_type in detections]
+            for _, detections in eager_values] == [True, True, False]
+    for eager, lazy in zip(eager_values, lazy_values):
+        assert np.array_equal(eager[0], lazy[0])
+        assert eager[1] == lazy[1]
+
+
+def run_map_with_update_period(lazy: bool, nb_steps: int = 8):
+    the_map = MyMap("cpu")
+    playground = the_map.playground
+    for drone in the_map.drones:
+        drone.lidar()._noise = False
+        drone.lidar().update_period = 2
+        drone.lidar().lazy = lazy
+
+    commands = {drone: drone.control() for drone in the_map.drones}
+    values = []
+    for step in range(nb_steps):
+        playground.step(all_commands=commands)
+        # The lidars are only read on the steps keeping their values
+        if step % 2 == 1:
+            values.append([drone.lidar_values().copy() for drone in the_map.drones])
+
+    playground.close_window()
+    gc.collect()
+    return values
+
+
+def test_lazy_sensors_keep_the_values_of_their_update():
+    eager_values = run_map_with_update_period(lazy=False)
+    lazy_values = run_map_with_update_period(lazy=True)
+    for eager, lazy in zip(eager_values, lazy_values):
+        for eager_lidar, lazy_lidar in zip(eager, lazy):
+            assert np.array_equal(eager_lidar, lazy_lidar)
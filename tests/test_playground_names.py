@@ -0,0 +1,81 @@
+import gc
+import pathlib
+import sys
+import pytest
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.elements.normal_wall import NormalBox, NormalWall
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+
+
+def add_box(playground, name):
+    box = NormalBox(up_left_point=(-100, 100), width=40, height=80)
+    box.name = name
+    playground.add(box, box.wall_coordinates)
+    return box
+
+
+def test_names_of_the_elements_are_unique():
+    playground = ClosedPlayground(size=(500, 400))
+
+    box = add_box(playground, "box")
+    with pytest.raises(ValueError):
+        add_box(playground, "box")
+
+    # The name of a removed element can be used again
+    playground.remove(box)
+    other_box = add_box(playground, "box")
+
+    playground.remove(box, definitive=True)
+    with pytest.raises(ValueError):
+        add_box(playground, "box")
+
+    playground.remove(other_box, definitive=True)
+    add_box(playground, "box")
+
+    # Elements without name get one from their uid
+    wall = NormalWall(pos_start=(0, 0), pos_end=(100, 0))
+    playground.add(wall, wall.wall_coordinates)
+    assert wall.name == f"NormalWall_{wall.uid}"
+    assert len({element.uid for element in playground.elements}) == len(playground.elements)
+
+    playground.close_window()
+    gc.collect()
+
+
+def test_names_of_elements_added_back():
+    playground = ClosedPlayground(size=(500, 400))
+
+    box_a = add_box(playground, "box")
+    playground.remove(box_a)
+
+    box_b = add_box(playground, "box")
+    playground.remove(box_b, definitive=True)
+
+    # The element added back holds its name again
+    playground.add(box_a, from_removed=True)
+    assert playground._name_to_elements["box"] is box_a
+    with pytest.raises(ValueError):
+        add_box(playground, "box")
+
+    playground.close_window()
+    gc.collect()
+
+
+def test_names_after_restore():
+    playground = ClosedPlayground(size=(500, 400))
+    snapshot = playground.snapshot()
+
+    add_box(playground, "box")
+    playground.restore(snapshot)
+    add_box(playground, "box")
+
+    with pytest.raises(ValueError):
+        add_box(playground, "box")
+
+    playground.close_window()
+    gc.collect()
@@ -0,0 +1,122 @@
+import pathlib
+import sys
+import numpy as np
+
+from typing import List, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.elements.normal_wall import NormalBox
+from swarm_rescue.simulation.elements.rescue_center import RescueCenter
+from swarm_rescue.simulation.elements.wounded_person import WoundedPerson
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        pass
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract] = MyDrone):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (400, 400)
+
+        self._playground = ClosedPlayground(size=self._size_area)
+
+        self.rescue_center = RescueCenter(size=(50, 50))
+        self._playground.add(self.rescue_center, ((150, 150), 0))
+
+        self.wounded_person = WoundedPerson(rescue_center=self.rescue_center)
+        self._playground.add(self.wounded_person, ((-120, 120), 0))
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = 2
+        self._drones_pos = [((-60, -60), 0), ((60, -60), 0)]
+        self._drones: List[DroneAbstract] = []
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def step(the_map, nb_steps):
+    commands = {drone: {"forward": 0.5, "lateral": 0.1, "rotation": 0.2, "grasper": 0}
+                for drone in the_map.drones}
+    for _ in range(nb_steps):
+        the_map.playground.step(all_commands=commands)
+
+
+def poses(the_map):
+    return np.array([list(drone.true_position()) + [drone.true_angle()]
+                     for drone in the_map.drones])
+
+
+def test_restore_replays_the_same_steps():
+    the_map = MyMap()
+    playground = the_map.playground
+    step(the_map, 5)
+
+    snapshot = playground.snapshot()
+    poses_snapshot = poses(the_map)
+    gps_snapshot = the_map.drones[0].measured_gps_position()
+
+    step(the_map, 10)
+    poses_after = poses(the_map)
+    gps_after = the_map.drones[0].measured_gps_position()
+    assert not np.allclose(poses_after, poses_snapshot)
+
+    playground.restore(snapshot)
+    assert playground.timestep == 5
+    assert np.allclose(poses(the_map), poses_snapshot)
+    assert np.allclose(the_map.drones[0].measured_gps_position(), gps_snapshot)
+
+    step(the_map, 10)
+    assert playground.timestep == 15
+    assert np.allclose(poses(the_map), poses_after)
+    assert np.allclose(the_map.drones[0].measured_gps_position(), gps_after)
+
+
+def test_restore_removed_and_added_entities():
+    the_map = MyMap()
+    playground = the_map.playground
+    drone = the_map.drones[0]
+    wounded_person = the_map.wounded_person
+    step(the_map, 2)
+
+    snapshot = playground.snapshot()
+    nb_sensors = len(playground.ray_compute._sensors)
+
+    playground.remove(drone)
+    playground.remove(wounded_person, definitive=True)
+    box = NormalBox(up_left_point=(0, 100), width=20, height=20)
+    playground.add(box, ((0, 100), 0))
+    step(the_map, 2)
+
+    playground.restore(snapshot)
+    assert drone in playground.agents
+    assert not drone.removed
+    assert wounded_person in playground.elements
+    assert playground.get_entity_from_uid(wounded_person.uid) is wounded_person
+    assert box not in playground.elements
+    assert len(playground.ray_compute._sensors) == nb_sensors
+
+    step(the_map, 2)
+    assert playground.timestep == 4
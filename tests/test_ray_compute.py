@@ -0,0 +1,233 @@
+import gc
+import pathlib
+import sys
+import numpy as np
+import pytest
+
+from typing import List, Optional, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.elements.normal_wall import NormalBox
+from swarm_rescue.simulation.elements.rescue_center import RescueCenter
+from swarm_rescue.simulation.elements.wounded_person import WoundedPerson
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        pass
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract] = MyDrone, ray_backend: Optional[str] = None,
+                 ray_zoom: float = 1):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (500, 400)
+
+        self._playground = ClosedPlayground(size=self._size_area, ray_backend=ray_backend,
+                                            ray_zoom=ray_zoom)
+
+        self.rescue_center = RescueCenter(size=(60, 60))
+        self._playground.add(self.rescue_center, ((180, 140), 0))
+
+        self.box = NormalBox(up_left_point=(60, -60), width=40, height=80)
+        self._playground.add(self.box, self.box.wall_coordinates)
+
+        self.wounded_person = WoundedPerson(rescue_center=self.rescue_center)
+        self._playground.add(self.wounded_person, ((-100, 100), 0))
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = 1
+        self._drones_pos = [((-60, -40), 0.3)]
+        self._drones: List[DroneAbstract] = []
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def hitpoints_of(the_map):
+    return [sensor._hitpoints.copy() for sensor in the_map.playground.ray_compute._sensors]
+
+
+def test_compact_readback_keeps_ids_and_distances():
+    the_map = MyMap(ray_backend="shader")
+    playground = the_map.playground
+    playground.step()
+    full_hitpoints = hitpoints_of(the_map)
+
+    playground.ray_compute.compact_readback = True
+    playground.step()
+    compact_hitpoints = hitpoints_of(the_map)
+
+    for full, compact in zip(full_hitpoints, compact_hitpoints):
+        assert full.shape == compact.shape
+        assert np.array_equal(full[:, 8:10], compact[:, 8:10])
+        assert not np.any(compact[:, :8])
+
+    lidar_values = the_map.drones[0].lidar().get_sensor_values()
+    assert not np.any(np.isnan(lidar_values))
+
+
+@pytest.mark.parametrize("ray_backend", ["cpu", "geometric"])
+def test_compact_readback_has_no_effect_without_shader(ray_backend):
+    the_map = MyMap(ray_backend=ray_backend)
+    playground = the_map.playground
+    playground.step()
+    hitpoints = hitpoints_of(the_map)
+
+    playground.ray_compute.compact_readback = True
+    assert playground.ray_compute.compact_readback
+    playground.ray_compute.invalidate()
+    playground.ray_compute.update_sensors()
+
+    for full, compact in zip(hitpoints, hitpoints_of(the_map)):
+        assert np.array_equal(full, compact)
+
+    playground.close_window()
+    gc.collect()
+
+
+def test_shader_backend_matches_cpu_backend():
+    the_map = MyMap(ray_backend="shader")
+    playground = the_map.playground
+    playground.step()
+    shader_hitpoints = hitpoints_of(the_map)
+
+    # The sensors do not keep views of the array overwritten by the next readback
+    for sensor in playground.ray_compute._sensors:
+        assert not np.shares_memory(sensor._hitpoints, playground.ray_compute._hitpoints)
+
+    playground.ray_backend = "cpu"
+    playground.step()
+    cpu_hitpoints = hitpoints_of(the_map)
+
+    for shader, cpu in zip(shader_hitpoints, cpu_hitpoints):
+        assert np.array_equal(shader[:, 8], cpu[:, 8])
+        assert np.median(np.abs(shader[:, 9] - cpu[:, 9])) < 1.0
+
+
+def test_invisible_elements_update_without_compiling_the_shader():
+    the_map = MyMap(ray_backend="shader")
+    playground = the_map.playground
+    ray_compute = playground.ray_compute
+    playground.step()
+    id_shader = ray_compute._id_shader
+
+    sensors = ray_compute._sensors
+    detected_ids = set(np.concatenate([hitpoints[:, 8] for hitpoints in hitpoints_of(the_map)]).astype(int))
+    assert the_map.box.uid in detected_ids
+
+    for sensor in sensors:
+        sensor.add_to_temporary_invisible(the_map.box)
+    playground.step()
+    detected_ids = set(np.concatenate([hitpoints[:, 8] for hitpoints in hitpoints_of(the_map)]).astype(int))
+    assert the_map.box.uid not in detected_ids
+
+    for sensor in sensors:
+        sensor.remove_from_temporary_invisible(the_map.box)
+    playground.step()
+    detected_ids = set(np.concatenate([hitpoints[:, 8] for hitpoints in hitpoints_of(the_map)]).astype(int))
+    assert the_map.box.uid in detected_ids
+
+    # The invisible elements fit in the capacity of the invisible buffer
+    assert ray_compute._id_shader is id_shader
+
+    # Growing the capacity compiles the shader again
+    capacity = ray_compute._invisible_capacity
+    for sensor in sensors:
+        for _ in range(capacity):
+            sensor.add_to_temporary_invisible(the_map.box)
+        sensor.add_to_temporary_invisible(the_map.wounded_person)
+    playground.step()
+    assert ray_compute._invisible_capacity > capacity
+    assert ray_compute._id_shader is not id_shader
+    detected_ids = set(np.concatenate([hitpoints[:, 8] for hitpoints in hitpoints_of(the_map)]).astype(int))
+    assert not {the_map.box.uid, the_map.wounded_person.uid} & detected_ids
+
+
+def test_cpu_marching_does_not_depend_on_the_chunks():
+    the_map = MyMap(ray_backend="cpu")
+    playground = the_map.playground
+    ray_compute = playground.ray_compute
+    playground.step()
+
+    all_hitpoints = []
+    for chunk in [1, 7, 1000]:
+        ray_compute.CPU_MARCHING_CHUNK = chunk
+        ray_compute.update_sensors()
+        all_hitpoints.append(hitpoints_of(the_map))
+
+    for hitpoints in all_hitpoints[1:]:
+        for expected, computed in zip(all_hitpoints[0], hitpoints):
+            assert np.array_equal(expected, computed)
+
+
+def test_fused_rays_do_not_change_the_hitpoints():
+    for ray_backend in ("shader", "cpu"):
+        the_map = MyMap(ray_backend=ray_backend)
+        playground = the_map.playground
+        ray_compute = playground.ray_compute
+        assert ray_compute.fused_rays
+        playground.step()
+        fused_hitpoints = hitpoints_of(the_map)
+
+        ray_compute.fused_rays = False
+        ray_compute.update_sensors()
+        separate_hitpoints = hitpoints_of(the_map)
+
+        for fused, separate in zip(fused_hitpoints, separate_hitpoints):
+            assert np.array_equal(fused, separate)
+
+        if ray_backend == "shader":
+            # Each sensor only computes its own rays
+            n_rays = sum(sensor.resolution for sensor in ray_compute._sensors)
+            ray_compute.fused_rays = True
+            assert len(ray_compute._hitpoints) == n_rays
+
+
+def test_ray_zoom_keeps_the_distances_in_the_frame_of_the_environment():
+    for ray_backend in ("shader", "cpu"):
+        the_map = MyMap(ray_backend=ray_backend)
+        the_map.playground.step()
+        expected_hitpoints = hitpoints_of(the_map)
+
+        the_map.playground.ray_zoom = 0.5
+        the_map.playground.step()
+        assert the_map.playground.ray_compute._id_view.width == 250
+        hitpoints = hitpoints_of(the_map)
+
+        # Same ID view when the zoom is given to the playground
+        the_map = MyMap(ray_backend=ray_backend, ray_zoom=0.5)
+        the_map.playground.step()
+        for zoom_hitpoints, computed in zip(hitpoints, hitpoints_of(the_map)):
+            assert np.array_equal(zoom_hitpoints[:, [0, 1, 2, 3, 6, 7, 9]],
+                                  computed[:, [0, 1, 2, 3, 6, 7, 9]])
+
+        for expected, computed in zip(expected_hitpoints, hitpoints):
+            assert np.mean((expected[:, 8] != 0) == (computed[:, 8] != 0)) > 0.9
+            hit = (expected[:, 8] != 0) & (computed[:, 8] != 0)
+            # A pixel of the ID view covers 2 units of the playground
+            assert np.median(np.abs(expected[hit, 9] - computed[hit, 9])) < 2.0
+            assert np.median(np.abs(expected[hit, 2:4] - computed[hit, 2:4])) < 2.0
+            # The positions on the view are at the scale of the playground
+            assert np.median(np.abs(expected[:, 0:2] - computed[:, 0:2])) < 2.0
+            assert np.allclose(expected[:, 6:8], computed[:, 6:8], atol=1.0)
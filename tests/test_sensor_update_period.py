@@ -0,0 +1,113 @@
+import pathlib
+import sys
+import numpy as np
+import pytest
+
+from typing import List, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.drone.drone_sensors import DroneGPS
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        command = {"forward": 1.0,
+                   "lateral": 0.0,
+                   "rotation": 1.0,
+                   "grasper": 0}
+        return command
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract] = MyDrone):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (400, 400)
+
+        self._playground = ClosedPlayground(size=self._size_area, ray_backend="cpu")
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = 1
+        self._drones_pos = [((0, 0), 0)]
+        self._drones: List[DroneAbstract] = []
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def test_sensor_values_are_kept_between_updates():
+    the_map = MyMap()
+    playground = the_map.playground
+    drone = the_map.drones[0]
+    drone.lidar().update_period = 3
+    drone.odometer().update_period = 2
+
+    commands = {drone: drone.control()}
+    lidar_values = []
+    hitpoints = []
+    odometer_values = []
+    for _ in range(7):
+        playground.step(all_commands=commands)
+        lidar_values.append(drone.lidar_values().copy())
+        hitpoints.append(drone.lidar()._hitpoints)
+        odometer_values.append(drone.odometer_values().copy())
+
+    # The lidar is computed at steps 0, 3 and 6
+    for step in range(1, 7):
+        same = np.array_equal(lidar_values[step], lidar_values[step - 1])
+        assert same == (step % 3 != 0)
+        assert (hitpoints[step] is hitpoints[step - 1]) == (step % 3 != 0)
+
+    for step in range(1, 7):
+        same = np.array_equal(odometer_values[step], odometer_values[step - 1])
+        assert same == (step % 2 != 0)
+
+    # The semantic sensor is still computed at each step
+    assert drone.semantic().update_due
+
+
+def test_disabled_sensor_is_computed_when_enabled():
+    the_map = MyMap()
+    playground = the_map.playground
+    drone = the_map.drones[0]
+    gps = drone.gps()
+    gps.update_period = 5
+
+    playground.step()
+    assert not gps.update_due
+
+    gps.disable()
+    gps.update()
+    assert gps.update_due
+    assert drone.gps_values() is None
+
+    playground.step()
+    assert drone.gps_values() is not None
+
+
+def test_update_period_should_be_positive():
+    with pytest.raises(ValueError):
+        DroneGPS(update_period=0)
+
+    gps = DroneGPS()
+    with pytest.raises(ValueError):
+        gps.update_period = 0
@@ -0,0 +1,153 @@
+import gc
+import pathlib
+import sys
+import numpy as np
+import pymunk
+import pytest
+
+from typing import List, Optional, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.maps.walls_final_2024_25_02 import add_walls, add_boxes
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.elements.normal_wall import NormalBox, NormalWall, merge_wall_segments
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.ray_sensors.entity_type import TypeEntity, get_type_entity
+from swarm_rescue.simulation.utils.definitions import CollisionTypes
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        pass
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract] = MyDrone, ray_backend: Optional[str] = None,
+                 merge_walls: bool = False):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (500, 400)
+
+        self._playground = ClosedPlayground(size=self._size_area, ray_backend=ray_backend)
+
+        # Two collinear walls touching end to end, and two parallel walls
+        # side by side
+        for pos_start, pos_end in [((-200, 100), (0, 100)), ((0, 100), (150, 100)),
+                                   ((100, -150), (100, 50)), ((104, -150), (104, 50))]:
+            wall = NormalWall(pos_start=pos_start, pos_end=pos_end)
+            self._playground.add(wall, wall.wall_coordinates)
+
+        box = NormalBox(up_left_point=(-150, -60), width=40, height=80)
+        self._playground.add(box, box.wall_coordinates)
+
+        if merge_walls:
+            self._playground.merge_walls()
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = 1
+        self._drones_pos = [((-20, -20), 0.3)]
+        self._drones: List[DroneAbstract] = []
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def test_merge_wall_segments():
+    # Walls touching end to end
+    merged = merge_wall_segments([((0, 0), (10, 0), 6), ((10, 0), (20, 0), 6)])
+    assert len(merged) == 1
+    assert np.allclose(np.hstack(merged[0]), [0, 0, 20, 0, 6])
+
+    # Walls 2 and 3 of walls_final_2024_25_02.py, 4 pixels apart
+    merged = merge_wall_segments([((-463, 544), (-463, 332), 6), ((-459, 544), (-459, 332), 6)])
+    assert len(merged) == 1
+    assert np.allclose(np.hstack(merged[0]), [-461, 334, -461, 542, 10])
+
+    # Walls of a corner, or apart, are not merged
+    assert len(merge_wall_segments([((0, 0), (10, 0), 6), ((0, 0), (0, 10), 6)])) == 2
+    assert len(merge_wall_segments([((0, 0), (10, 0), 6), ((20, 0), (30, 0), 6)])) == 2
+    assert len(merge_wall_segments([((0, 0), (10, 0), 6), ((0, 4), (20, 4), 6)])) == 2
+
+
+def test_merge_walls_of_a_map():
+    playground = ClosedPlayground(size=(1700, 1100))
+    add_walls(playground)
+    add_boxes(playground)
+    n_walls = len(playground.elements)
+
+    static_walls = playground.merge_walls()
+
+    assert playground.elements == [static_walls]
+    assert len(static_walls.wall_segments) < n_walls
+    assert len(static_walls.pm_shapes) == len(static_walls.wall_segments)
+    assert get_type_entity(static_walls) == TypeEntity.WALL
+    assert all(shape.collision_type == CollisionTypes.WALL for shape in static_walls.pm_shapes)
+
+    # Nothing left to merge
+    assert playground.merge_walls() is None
+
+    playground.close_window()
+    gc.collect()
+
+
+@pytest.mark.parametrize("merge_walls", [False, True])
+def test_corners_of_the_merged_walls_are_solid(merge_walls):
+    the_map = MyMap(merge_walls=merge_walls)
+    space = the_map.playground.space
+
+    # Corners of the box and of the ends of the horizontal walls (from -200
+    # to 150, thickness 6), just inside, out of the rounded ends of a capsule
+    solid = [(-149, -61), (-111, -61), (-149, -139), (-111, -139),
+             (-199.8, 102.8), (-199.8, 97.2), (149.8, 102.8), (149.8, 97.2)]
+    empty = [(-151, -59), (-109, -141), (-201, 100), (151, 100)]
+
+    for point in solid:
+        assert any(query.shape.collision_type == CollisionTypes.WALL
+                   for query in space.point_query(point, 0, pymunk.ShapeFilter())), point
+    for point in empty:
+        assert not any(query.shape.collision_type == CollisionTypes.WALL
+                       for query in space.point_query(point, 0, pymunk.ShapeFilter())), point
+
+    the_map.playground.close_window()
+    gc.collect()
+
+
+def run_map_distances(ray_backend: str, merge_walls: bool):
+    the_map = MyMap(ray_backend=ray_backend, merge_walls=merge_walls)
+    n_elements = len(the_map.playground.elements)
+    the_map.playground.step()
+    distances = [sensor._hitpoints[:, 9].copy() for sensor in the_map.playground.ray_compute._sensors]
+    detected_types = {data.entity_type for data in the_map.drones[0].semantic_values()}
+
+    the_map.playground.close_window()
+    gc.collect()
+    return n_elements, distances, detected_types
+
+
+@pytest.mark.parametrize("ray_backend", ["cpu", "geometric"])
+def test_merged_walls_are_seen_by_the_ray_sensors(ray_backend):
+    n_elements, distances, detected_types = run_map_distances(ray_backend, merge_walls=False)
+    n_merged_elements, merged_distances, merged_detected_types = run_map_distances(ray_backend,
+                                                                                   merge_walls=True)
+
+    assert n_merged_elements < n_elements
+    assert merged_detected_types == detected_types
+    for walls, merged_walls in zip(distances, merged_distances):
+        assert np.median(np.abs(walls - merged_walls)) < 1
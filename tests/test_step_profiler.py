@@ -0,0 +1,122 @@
+import pathlib
+import pickle
+import sys
+
+from typing import List, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.headless_runner import HeadlessRunner
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.utils.misc_data import MiscData
+from swarm_rescue.simulation.utils.step_profiler import StepProfiler
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        command = {"forward": 1.0,
+                   "lateral": 0.0,
+                   "rotation": 0.0,
+                   "grasper": 0}
+        return command
+
+
+class MyDroneReadingLidar(MyDrone):
+    def control(self):
+        self.lidar_values()
+        return super().control()
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract]):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (300, 300)
+        self._max_timestep_limit = 20
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = 2
+        self._drones_pos = [((-50, 0), 0), ((50, 0), 0)]
+        self._drones: List[DroneAbstract] = []
+
+        self._playground = ClosedPlayground(size=self._size_area)
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones,
+                             max_timestep_limit=self._max_timestep_limit,
+                             max_walltime_limit=self._max_walltime_limit)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def test_step_profiler_phases():
+    profiler = StepProfiler()
+    the_map = MyMap(drone_type=MyDrone)
+    runner = HeadlessRunner(the_map=the_map, profiler=profiler)
+    runner.run()
+
+    assert runner.profiler is profiler
+    # The round ends when the limit of 20 timesteps is exceeded
+    assert profiler.nb_steps == 21
+    for name in ["pre_step", "apply_commands", "physics", "ray_compute",
+                 "observations", "post_step", "transmit_messages"]:
+        assert name in profiler.phases
+        assert profiler.phases[name].wall_time >= 0
+
+    assert profiler.phases["physics"].calls == 21
+    assert sorted(profiler.drones) == [0, 1]
+    assert profiler.drones[0]["control"].calls == 20
+    assert profiler.drones[1]["define_message_for_all"].calls == 20
+
+    step_time = profiler.phases[StepProfiler.STEP].wall_time
+    assert profiler.phases["physics"].wall_time <= step_time
+    assert 0 < profiler.simulator_wall_time == step_time
+
+    rows = profiler.rows()
+    assert len(rows) == len(profiler.phases) + 4
+    assert ("drone", "1", "control") in [row[:3] for row in rows]
+
+    profiler_copy = pickle.loads(pickle.dumps(profiler))
+    assert profiler_copy.nb_steps == 21
+    assert profiler_copy.drones_wall_time == profiler.drones_wall_time
+
+
+def test_step_profiler_disabled():
+    the_map = MyMap(drone_type=MyDrone)
+    runner = HeadlessRunner(the_map=the_map)
+    runner.run()
+
+    assert runner.profiler is None
+    assert the_map.playground.profiler is None
+
+
+def test_lazy_rays_are_not_counted_in_the_drones():
+    profiler = StepProfiler()
+    the_map = MyMap(drone_type=MyDroneReadingLidar)
+    for drone in the_map.drones:
+        drone.lidar().lazy = True
+    runner = HeadlessRunner(the_map=the_map, profiler=profiler)
+    runner.run()
+
+    # The lidars are read in control(), after the steps
+    lazy_ray_compute = profiler.phases[StepProfiler.LAZY_RAY_COMPUTE]
+    assert lazy_ray_compute.calls == 20
+    assert profiler.wall_time_in_drones == lazy_ray_compute.wall_time > 0
+    step_time = profiler.phases[StepProfiler.STEP].wall_time
+    assert profiler.simulator_wall_time == step_time + lazy_ray_compute.wall_time
+    for drone_id in [0, 1]:
+        assert 0 <= profiler.drones[drone_id]["control"].wall_time
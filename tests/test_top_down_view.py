@@ -0,0 +1,119 @@
+import pathlib
+import sys
+import numpy as np
+
+from typing import List, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.elements.normal_wall import NormalBox
+from swarm_rescue.simulation.elements.rescue_center import RescueCenter
+from swarm_rescue.simulation.elements.wounded_person import WoundedPerson
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.gui_map.top_down_view import TopDownView
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        command = {"forward": 1.0,
+                   "lateral": 0.0,
+                   "rotation": 0.5,
+                   "grasper": 0}
+        return command
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract] = MyDrone):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (400, 300)
+
+        self._playground = ClosedPlayground(size=self._size_area, ray_backend="cpu")
+
+        self.boxes = []
+        for up_left_point in [(-150, 100), (50, 100), (100, -50)]:
+            box = NormalBox(up_left_point=up_left_point, width=40, height=30)
+            self._playground.add(box, box.wall_coordinates)
+            self.boxes.append(box)
+
+        self.rescue_center = RescueCenter(size=(50, 50))
+        self._playground.add(self.rescue_center, ((150, -100), 0))
+        self._playground.add(WoundedPerson(rescue_center=self.rescue_center), ((-120, -80), 0))
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = 2
+        self._drones_pos = [((-40, 0), 0), ((40, 0), 1.5)]
+        self._drones: List[DroneAbstract] = []
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def test_static_layer_draws_the_same_id_view():
+    the_map = MyMap()
+    playground = the_map.playground
+    id_view = playground.ray_compute._id_view
+
+    full_view = TopDownView(playground, playground.size, playground.center, 1,
+                            use_color_uid=True, draw_interactive=False,
+                            draw_transparent=False, draw_zone=False)
+
+    commands = {drone: drone.control() for drone in the_map.drones}
+    for step in range(12):
+        if step == 4:
+            box = the_map.boxes[0]
+            box.move_to(((-100, 40), 0.3))
+        if step == 8:
+            playground.remove(the_map.boxes[1], definitive=True)
+
+        playground.step(all_commands=commands)
+        full_view.update_and_draw_in_framebuffer(force=True)
+        assert np.array_equal(id_view.get_np_img(), full_view.get_np_img())
+
+
+def test_ids_of_the_id_view():
+    the_map = MyMap()
+    playground = the_map.playground
+    playground.step()
+    id_view = playground.ray_compute._id_view
+
+    img = id_view.get_np_img().astype(np.uint32)
+    ids = id_view.get_np_ids()
+    assert ids.shape == (id_view.height, id_view.width)
+    assert np.array_equal(ids, 256 * 256 * img[..., 2] + 256 * img[..., 1] + img[..., 0])
+    assert {box.uid for box in the_map.boxes} <= set(np.unique(ids))
+
+
+def test_textures_with_id_color():
+    the_map = MyMap()
+    box = the_map.boxes[0]
+
+    texture = box.generate_texture_with_id_color(box.texture)
+    alpha = np.asarray(box.texture.image.convert("RGBA"))[..., 3]
+    pixels = np.asarray(texture.image)
+    assert np.all(pixels[alpha != 0] == box.color_uid)
+    assert np.all(pixels[alpha == 0] == 0)
+
+    # The texture is reused when the entity is drawn again in an ID view
+    assert box.generate_texture_with_id_color(box.texture) is texture
+    playground = the_map.playground
+    id_view = TopDownView(playground, use_color_uid=True, draw_interactive=False,
+                          draw_transparent=False, draw_zone=False)
+    assert id_view.sprites[box].texture is texture
@@ -0,0 +1,161 @@
+import pathlib
+import sys
+import numpy as np
+import pytest
+
+from typing import List, Type
+
+# Insert the 'src' directory, located two levels up from the current script,
+# into sys.path. This ensures Python can find project-specific modules
+# (e.g., 'swarm_rescue') when the script is run from a subfolder like 'tests/'.
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "src"))
+
+from swarm_rescue.simulation.drone.controller import BatchedCommands
+from swarm_rescue.simulation.drone.drone_abstract import DroneAbstract
+from swarm_rescue.simulation.gui_map.closed_playground import ClosedPlayground
+from swarm_rescue.simulation.gui_map.map_abstract import MapAbstract
+from swarm_rescue.simulation.gui_map.vector_env import VectorEnv, OBSERVATION_SHAPES
+from swarm_rescue.simulation.utils.misc_data import MiscData
+
+
+class MyDrone(DroneAbstract):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    def define_message_for_all(self):
+        pass
+
+    def control(self):
+        pass
+
+
+class MyMap(MapAbstract):
+    def __init__(self, drone_type: Type[DroneAbstract] = MyDrone, number_drones: int = 2):
+        super().__init__(drone_type=drone_type)
+
+        # PARAMETERS MAP
+        self._size_area = (300, 300)
+        self._max_timestep_limit = 5
+
+        # POSITIONS OF THE DRONES
+        self._number_drones = number_drones
+        self._drones_pos = [((-60 + 60 * i, 0), 0) for i in range(number_drones)]
+        self._drones: List[DroneAbstract] = []
+
+        self._playground = ClosedPlayground(size=self._size_area)
+
+        misc_data = MiscData(size_area=self._size_area,
+                             number_drones=self._number_drones,
+                             max_timestep_limit=self._max_timestep_limit,
+                             max_walltime_limit=self._max_walltime_limit)
+        for i in range(self._number_drones):
+            drone = drone_type(identifier=i, misc_data=misc_data)
+            self._drones.append(drone)
+            self._playground.add(drone, self._drones_pos[i])
+
+
+def make_map_with_one_drone():
+    return MyMap(number_drones=1)
+
+
+def test_vector_env_shapes_and_padding():
+    env = VectorEnv([MyMap, make_map_with_one_drone])
+    obs = env.reset()
+
+    assert env.num_envs == 2
+    assert env.max_drones == 2
+    assert env.numbers_drones == [2, 1]
+    for name, shape in OBSERVATION_SHAPES.items():
+        assert obs[name].shape == (2, 2) + shape
+    assert np.array_equal(env.alive, [[True, True], [True, False]])
+    assert not np.isnan(obs["lidar"][1, 0]).any()
+    assert np.isnan(obs["lidar"][1, 1]).all()
+
+    commands = np.zeros((2, 2, 4))
+    commands[:, :, 0] = 1.0
+    for _ in range(5):
+        obs, rewards, dones = env.step(commands)
+
+    assert rewards.shape == (2, 2)
+    assert dones.tolist() == [True, True]
+    for the_map, number_drones in zip(env.maps, env.numbers_drones):
+        for i in range(number_drones):
+            assert the_map.drones[i].true_position()[0] > -60 + 60 * i
+
+    with np.testing.assert_raises(ValueError):
+        env.step(np.zeros((2, 1, 4)))
+
+    obs = env.reset()
+    assert not np.isnan(obs["lidar"][0]).any()
+
+    env.close()
+
+
+def test_vector_env_subprocesses():
+    env = VectorEnv([MyMap, MyMap], use_subprocesses=True)
+    try:
+        obs = env.reset()
+        assert obs["gps"].shape == (2, 2, 2)
+
+        obs, rewards, dones = env.step(np.zeros((2, 2, 4)))
+        assert not np.isnan(obs["lidar"]).any()
+        assert dones.tolist() == [False, False]
+    finally:
+        env.close()
+
+
+def test_vector_env_commands_and_observations():
+    env = VectorEnv([MyMap])
+    env.reset()
+    drones = env.maps[0].drones
+
+    commands = np.array([[[0.5, -2.0, 0.25, 1.0],
+                          [-0.5, 0.0, 1.0, 0.0]]])
+    obs, _, _ = env.step(commands)
+
+    # The commands are written in the controllers of the drones
+    expected = [[0.5, -1.0, 0.25, 1], [-0.5, 0.0, 1.0, 0]]
+    for drone, (forward, lateral, rotation, grasper) in zip(drones, expected):
+        assert drone.base.forward_controller.command == forward
+        assert drone.base.lateral_controller.command == lateral
+        assert drone.base.angular_vel_controller.command == rotation
+        assert drone.grasper.grasp_controller.command == grasper
+
+    # The observations are the values of the sensors of the drones
+    for i, drone in enumerate(drones):
+        assert np.array_equal(obs["lidar"][0, i], drone.lidar_values())
+        assert np.array_equal(obs["gps"][0, i], drone.gps_values())
+        assert obs["compass"][0, i] == drone.compass_values()
+        assert np.array_equal(obs["odometer"][0, i], drone.odometer_values())
+
+        detections = drone.semantic_values()
+        semantic = obs["semantic"][0, i]
+        assert len(detections) > 0
+        assert np.array_equal(semantic[detections["ray"], 0], detections["distance"])
+        assert np.array_equal(semantic[detections["ray"], 2], detections["entity_type"])
+        assert np.array_equal(semantic[:, 1], drone.semantic().ray_angles)
+        assert np.isnan(semantic[:, 0]).sum() == len(semantic) - len(detections)
+
+    env.close()
+
+
+def test_batched_commands_are_checked():
+    the_map = MyMap()
+    drones = the_map.drones
+    batched_commands = BatchedCommands([[drone.base.forward_controller, drone.grasper.grasp_controller]
+                                        for drone in drones])
+    assert batched_commands.commands.shape == (2, 2)
+
+    batched_commands.commands[1, 1] = 0.5
+    with pytest.raises(ValueError):
+        the_map.playground.step(batched_commands=batched_commands)
+
+    # A disabled controller gets its default command
+    batched_commands.commands[:] = [[0.5, 1], [0.5, 1]]
+    drones[0].base.forward_controller._currently_disabled = True
+    the_map.playground.step(batched_commands=batched_commands)
+    assert drones[0].base.forward_controller.command == 0.0
+    assert drones[1].base.forward_controller.command == 0.5
+    assert drones[0].grasper.grasp_controller.command == 1
+
+    the_map.playground.close_window()